@@ -0,0 +1,66 @@
+"""API routes for feed data."""
+
+import logging
+
+from flask import Blueprint, current_app, jsonify, request
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def create_feeds_blueprint(layout=None):
+    """
+    Create feeds API blueprint with optional injected layout.
+
+    Args:
+        layout: Optional Layout instance. If not provided, uses the one from
+                current_app.extensions.
+
+    Returns:
+        Configured Blueprint instance
+    """
+    feeds_bp = Blueprint("feeds_api", __name__, url_prefix="/api/feeds")
+
+    def get_layout():
+        """Get the layout from injection or current_app."""
+        if layout is not None:
+            return layout
+        return current_app.extensions.get("onboard_layout")
+
+    @feeds_bp.route("/<feed_id>/history", methods=["GET"])
+    def feed_history(feed_id: str):
+        """Page through the articles a feed no longer keeps in its live cache.
+
+        Query parameters: `limit` (default 50, at most 200) and `before`, the
+        `next` cursor returned by the previous page.
+        """
+        try:
+            feed = get_layout().get_feed(feed_id)
+        except (AttributeError, KeyError):
+            return jsonify({"error": f"Unknown feed {feed_id}"}), 404
+
+        try:
+            limit = int(request.args.get("limit", DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return jsonify({"error": "limit must be an integer"}), 400
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+        try:
+            articles, cursor = feed.source.feed_cache.history_page(
+                before=request.args.get("before"), limit=limit
+            )
+        except ValueError:
+            return jsonify({"error": "Invalid before cursor"}), 400
+
+        return jsonify(
+            {
+                "feed_id": feed.source.id,
+                "name": feed.name,
+                "articles": articles,
+                "next": cursor,
+            }
+        )
+
+    return feeds_bp
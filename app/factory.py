@@ -9,6 +9,7 @@ from flask_assets import Bundle, Environment
 from flask_caching import Cache
 
 from app.modules.testsupport import is_test_environment
+from app.services.page_stream import not_streamed, page_streaming_enabled, stream_page
 
 logger = logging.getLogger(__name__)
 
@@ -70,12 +71,18 @@ def create_app(
             try:
                 from flask_minify import Minify
 
-                Minify(app=app, html=True, js=True, cssless=True)
+                Minify(
+                    app=app,
+                    html=True,
+                    js=True,
+                    cssless=True,
+                    # Minifying needs the whole body, which would undo streaming
+                    bypass=["^index$"] if page_streaming_enabled() else [],
+                )
             except ImportError:
                 pass
 
     cache = Cache(app, config=cache_config)
-    app.extensions["cache"] = cache
 
     # Set up assets
     assets = Environment(app)
@@ -90,8 +97,10 @@ def create_app(
 
     # Register blueprints
     from app.api.bookmarks import create_bookmarks_blueprint
+    from app.api.feeds import create_feeds_blueprint
 
     app.register_blueprint(create_bookmarks_blueprint())
+    app.register_blueprint(create_feeds_blueprint())
 
     # Register main routes
     _register_routes(app, cache)
@@ -181,7 +190,19 @@ def _register_routes(app, cache):
 
     from flask import make_response, redirect, render_template, request
 
+    from app.services.feed_fragments import (
+        FeedFragmentCache,
+        batch_loading_enabled,
+        fragment_response,
+        fragments_response,
+        requested_feeds,
+    )
+    from app.services.fragment_validator import validate_fragment, validation_enabled
+
     page_timeout = int(os.environ.get("ONBOARD_PAGE_TIMEOUT", 600))
+    feed_fragments = app.extensions.setdefault(
+        "onboard_feed_fragments", FeedFragmentCache()
+    )
 
     @app.context_processor
     def inject_current_date():
@@ -190,84 +211,64 @@ def _register_routes(app, cache):
             "today_date": datetime.now(),
             "site_title": os.environ.get("ONBOARD_SITE_TITLE", "OnBoard"),
             "favicon_path": layout.favicon_path if layout else lambda x: None,
+            "batch_feeds": batch_loading_enabled(),
         }
 
     @app.route("/")
     @app.route("/tab/<tab_name>")
     @cache.cached(
-        timeout=page_timeout, unless=lambda: get_layout(app).is_modified()
+        timeout=page_timeout,
+        unless=lambda: get_layout(app).is_modified(),
+        response_filter=not_streamed,
     )
     def index(tab_name=None):
         layout = get_layout(app)
-        if layout.is_modified():
-            layout.reload()
+        # Rebuild in the background; this request is served from the current layout
+        modified = layout.is_modified()
+        if modified:
+            layout.reload_async()
 
         if request.headers.get("HX-Request"):
             return render_template("tab_content.html", layout=layout, tab_name=tab_name)
+        elif page_streaming_enabled():
+            # Sent as it renders and cached once complete
+            return stream_page(
+                "index.html",
+                cache=None if modified else cache,
+                cache_key=index.make_cache_key(tab_name=tab_name, use_request=True),
+                timeout=page_timeout,
+                layout=layout,
+                tab_name=tab_name,
+                skip_htmx=False,
+            )
         else:
             return render_template(
                 "index.html", layout=layout, tab_name=tab_name, skip_htmx=False
             )
 
+    def render_feed_fragment(feed):
+        # skip_htmx makes the templates leave out their hx-trigger="load" markup
+        html = render_template(feed.template, widget=feed, skip_htmx=True)
+        if validation_enabled():
+            html = validate_fragment(html, feed.template)
+        return html
+
     @app.route("/feed/<feed_id>")
     def feed(feed_id):
         layout = get_layout(app)
         feed = layout.get_feed(feed_id)
-        html = render_template(feed.template, widget=feed, skip_htmx=True)
-        try:
-            from html.parser import HTMLParser
-
-            class HXStripper(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.parts = []
-
-                def _filter_attrs(self, attrs):
-                    filtered = []
-                    for name, value in attrs:
-                        if name in ("hx-trigger", "data-hx-trigger") and value:
-                            if "load" in value.split():
-                                continue
-                        filtered.append((name, value))
-                    return filtered
-
-                def handle_starttag(self, tag, attrs):
-                    attrs_filtered = self._filter_attrs(attrs)
-                    attr_str = "".join(
-                        f' {n}="{v}"' if v is not None else f" {n}"
-                        for n, v in attrs_filtered
-                    )
-                    self.parts.append(f"<{tag}{attr_str}>")
-
-                def handle_startendtag(self, tag, attrs):
-                    attrs_filtered = self._filter_attrs(attrs)
-                    attr_str = "".join(
-                        f' {n}="{v}"' if v is not None else f" {n}"
-                        for n, v in attrs_filtered
-                    )
-                    self.parts.append(f"<{tag}{attr_str}/>")
-
-                def handle_endtag(self, tag):
-                    self.parts.append(f"</{tag}>")
-
-                def handle_data(self, data):
-                    self.parts.append(data)
-
-                def handle_comment(self, data):
-                    self.parts.append(f"<!--{data}-->")
-
-                def handle_entityref(self, name):
-                    self.parts.append(f"&{name};")
-
-                def handle_charref(self, name):
-                    self.parts.append(f"&#{name};")
-
-            stripper = HXStripper()
-            stripper.feed(html)
-            html = "".join(stripper.parts)
-        except Exception:
-            pass
-        return html
+        # Rendered once per article snapshot; answered with 304 if unchanged
+        fragment = feed_fragments.get(feed, lambda: render_feed_fragment(feed))
+        return fragment_response(fragment)
+
+    @app.route("/feeds")
+    def feeds():
+        # All feeds of a tab (or the ids asked for) in one response of oob swaps
+        fragments = [
+            feed_fragments.get(feed, lambda feed=feed: render_feed_fragment(feed))
+            for feed in requested_feeds(get_layout(app))
+        ]
+        return fragments_response(fragments)
 
     @app.route("/click_events")
     def click_events():
@@ -14,7 +14,16 @@ from flask_caching import Cache
 from app.models import apscheduler as apscheduler_module
 from app.models import layout as layout_module
 from app.modules.testsupport import is_test_environment
+from app.services.feed_fragments import (
+    FeedFragmentCache,
+    batch_loading_enabled,
+    fragment_response,
+    fragments_response,
+    requested_feeds,
+)
+from app.services.fragment_validator import validate_fragment, validation_enabled
 from app.services.link_tracker import link_tracker
+from app.services.page_stream import not_streamed, page_streaming_enabled, stream_page
 
 logging.basicConfig(format="%(asctime)s - %(message)s", level=logging.WARN)
 
@@ -52,15 +61,25 @@ else:
     }
     from flask_minify import Minify
 
-    Minify(app=app, html=True, js=True, cssless=True)
+    Minify(
+        app=app,
+        html=True,
+        js=True,
+        cssless=True,
+        # Minifying needs the whole body, which would undo streaming
+        bypass=["^index$"] if page_streaming_enabled() else [],
+    )
 
 cache = Cache(app, config=cache_config)
 page_timeout = int(os.environ.get("ONBOARD_PAGE_TIMEOUT", 600))
+feed_fragments = FeedFragmentCache()
 
 # Register API blueprints
 from app.api.bookmarks import bookmarks_api
+from app.api.feeds import create_feeds_blueprint
 
 app.register_blueprint(bookmarks_api)
+app.register_blueprint(create_feeds_blueprint(layout))
 
 assets = Environment(app)
 
@@ -96,20 +115,37 @@ def inject_current_date():
         "today_date": datetime.now(),
         "site_title": os.environ.get("ONBOARD_SITE_TITLE", "OnBoard"),
         "favicon_path": layout.favicon_path,
+        "batch_feeds": batch_loading_enabled(),
     }
 
 
 @app.route("/")
 @app.route("/tab/<tab_name>")
-@cache.cached(timeout=page_timeout, unless=lambda: layout.is_modified)
+@cache.cached(
+    timeout=page_timeout,
+    unless=lambda: layout.is_modified(),
+    response_filter=not_streamed,
+)
 def index(tab_name=None):
-    # Load feeds and bookmarks
-    if layout.is_modified():
-        layout.reload()
+    # Rebuild in the background; this request is served from the current layout
+    modified = layout.is_modified()
+    if modified:
+        layout.reload_async()
 
     if request.headers.get("HX-Request"):
         # Return partial content for HTMX requests
         return render_template("tab_content.html", layout=layout, tab_name=tab_name)
+    elif page_streaming_enabled():
+        # Sent as it renders and cached once complete
+        return stream_page(
+            "index.html",
+            cache=None if modified else cache,
+            cache_key=index.make_cache_key(tab_name=tab_name, use_request=True),
+            timeout=page_timeout,
+            layout=layout,
+            tab_name=tab_name,
+            skip_htmx=False,
+        )
     else:
         # Return full page for direct navigation
         return render_template(
@@ -117,77 +153,30 @@ def index(tab_name=None):
         )
 
 
+def render_feed_fragment(feed):
+    # skip_htmx makes the templates leave out their hx-trigger="load" markup
+    html = render_template(feed.template, widget=feed, skip_htmx=True)
+    if validation_enabled():
+        html = validate_fragment(html, feed.template)
+    return html
+
+
 @app.route("/feed/<feed_id>")
 def feed(feed_id):
     feed = layout.get_feed(feed_id)
-    # logger.debug(f"{feed.name} - {feed.display_items[0].title}")
-    # Render fragment with skip_htmx=True so templates avoid including htmx load triggers.
-    # As a defensive measure, remove any hx-trigger attributes that include the "load"
-    # event from the returned HTML to avoid accidental re-loading if a fragment
-    # accidentally contains a load trigger.
-    html = render_template(feed.template, widget=feed, skip_htmx=True)
-    try:
-        # Use a small HTML parser to remove any hx-trigger or data-hx-trigger
-        # attributes that reference the `load` event. This is more robust than
-        # a regex-based removal and avoids accidentally breaking other attributes.
-        from html.parser import HTMLParser
-
-        class HXStripper(HTMLParser):
-            def __init__(self):
-                super().__init__()
-                self.parts = []
-
-            def _filter_attrs(self, attrs):
-                filtered = []
-                for name, value in attrs:
-                    # remove hx-trigger or data-hx-trigger when its value contains the
-                    # token 'load' (e.g. "load once"). Be conservative and only drop
-                    # attributes that explicitly mention load.
-                    if name in ("hx-trigger", "data-hx-trigger") and value:
-                        # tokenise on whitespace so "load once"/"load" both match
-                        if "load" in value.split():
-                            continue
-                    filtered.append((name, value))
-                return filtered
-
-            def handle_starttag(self, tag, attrs):
-                attrs_filtered = self._filter_attrs(attrs)
-                attr_str = "".join(
-                    f' {n}="{v}"' if v is not None else f' {n}'
-                    for n, v in attrs_filtered
-                )
-                self.parts.append(f"<{tag}{attr_str}>")
-
-            def handle_startendtag(self, tag, attrs):
-                attrs_filtered = self._filter_attrs(attrs)
-                attr_str = "".join(
-                    f' {n}="{v}"' if v is not None else f' {n}'
-                    for n, v in attrs_filtered
-                )
-                self.parts.append(f"<{tag}{attr_str}/>")
-
-            def handle_endtag(self, tag):
-                self.parts.append(f"</{tag}>")
-
-            def handle_data(self, data):
-                self.parts.append(data)
-
-            def handle_comment(self, data):
-                self.parts.append(f"<!--{data}-->")
-
-            def handle_entityref(self, name):
-                self.parts.append(f"&{name};")
-
-            def handle_charref(self, name):
-                self.parts.append(f"&#{name};")
-
-        stripper = HXStripper()
-        stripper.feed(html)
-        html = "".join(stripper.parts)
-    except Exception:
-        # If anything goes wrong, fall back to returning the rendered html
-        pass
-    return html
+    # Rendered once per article snapshot; answered with 304 if unchanged
+    fragment = feed_fragments.get(feed, lambda: render_feed_fragment(feed))
+    return fragment_response(fragment)
+
+
+@app.route("/feeds")
+def feeds():
+    # All feeds of a tab (or the ids asked for) in one response of oob swaps
+    fragments = [
+        feed_fragments.get(feed, lambda feed=feed: render_feed_fragment(feed))
+        for feed in requested_feeds(layout)
+    ]
+    return fragments_response(fragments)
 
 
 @app.route("/click_events")
@@ -0,0 +1,46 @@
+import copy
+import time
+from typing import Any, Iterable
+
+
+class ArticleSnapshot:
+    """An immutable, versioned list of the articles a feed displays.
+
+    A feed never changes a published snapshot: updates build the next list
+    aside and publish it by replacing a single reference, so a renderer that
+    took a snapshot iterates it without locks while an update runs. Its
+    articles are not changed either; code about to modify one works on a copy
+    (see `writable`). The version goes up by one with every publish.
+    """
+
+    __slots__ = ("articles", "ids", "version", "published", "_identities")
+
+    def __init__(self, articles: Iterable[Any] = (), version: int = 0) -> None:
+        self.articles: tuple = tuple(articles)
+        self.ids = frozenset(article.id for article in self.articles)
+        self.version = version
+        self.published = time.time()
+        self._identities = frozenset(map(id, self.articles))
+
+    def next(self, articles: Iterable[Any]) -> "ArticleSnapshot":
+        """The snapshot that replaces this one."""
+        return ArticleSnapshot(articles, self.version + 1)
+
+    @property
+    def tag(self) -> str:
+        """Identifies this snapshot's content, also across restarts and reloads."""
+        return f"{self.version}-{int(self.published * 1_000_000):x}"
+
+    def __contains__(self, article: Any) -> bool:
+        # By identity: a copy of a published article is free to change
+        return id(article) in self._identities
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    def writable(self, articles: Iterable[Any]) -> list[Any]:
+        """Return `articles` with the ones published in this snapshot copied."""
+        return [
+            copy.copy(article) if id(article) in self._identities else article
+            for article in articles
+        ]
@@ -0,0 +1,103 @@
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .file_store import CacheStore
+from .local_file_store import LocalFileStore
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+MANIFEST_NAME = ".archive-manifest"
+
+
+class CacheArchiver:
+    """Moves oversized feed cache files into a dated `archive-YYYY-MM-DD` folder.
+
+    The cache directory is listed once per run, and the size of every file seen
+    is written to a manifest in the directory. A file is only archived when it
+    is over the threshold and its size changed since the previous run, so a
+    file that could not be moved is not retried until it is written again. The
+    archive folder is created by the first move, never empty.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        file_store: Optional[CacheStore] = None,
+        min_size_bytes: int = 300 * 1024,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.file_store = file_store or LocalFileStore()
+        self.min_size_bytes = min_size_bytes
+        self.manifest_path = self.cache_dir.joinpath(MANIFEST_NAME)
+
+    def load_manifest(self) -> Dict[str, int]:
+        """Sizes recorded by the previous run, if it used the same threshold."""
+        try:
+            manifest = LocalFileStore().read_json(self.manifest_path)
+        except Exception:
+            return {}
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("min_size_bytes") != self.min_size_bytes
+        ):
+            return {}
+        return manifest.get("sizes", {})
+
+    def run(self) -> List[Path]:
+        """Archive large .json files in one pass. Never raises.
+
+        Returns the new paths of the moved files.
+        """
+        moved: List[Path] = []
+        try:
+            previous = self.load_manifest()
+            sizes: Dict[str, int] = {}
+            archive_dir = self.cache_dir.joinpath(f"archive-{date.today().isoformat()}")
+
+            for p in list(self.file_store.list_dir(self.cache_dir)):
+                if not p.is_file() or p.suffix != ".json":
+                    continue
+
+                # Use a safe stat call; if file disappears, skip it.
+                try:
+                    size = p.stat().st_size
+                except FileNotFoundError:
+                    continue
+
+                if size <= self.min_size_bytes or previous.get(p.name) == size:
+                    sizes[p.name] = size
+                    continue
+
+                dest = archive_dir.joinpath(p.name)
+                # Delegate move to file_store so tests can simulate moves
+                try:
+                    self.file_store.move(p, dest)
+                    moved.append(dest)
+                except Exception as e:
+                    # Log per-file move errors and continue with other files
+                    logger.exception("Failed to move %s to %s: %s", p, dest, e)
+                    sizes[p.name] = size
+
+            if sizes or previous:
+                self.save_manifest(sizes)
+            logger.debug(
+                f"CacheArchiver: archived {len(moved)} of {len(sizes) + len(moved)} "
+                f"cache files in {self.cache_dir}"
+            )
+        except Exception as e:
+            # Top-level safety: archiving must never raise. Log and return
+            logger.exception("CacheArchiver encountered an unexpected error: %s", e)
+
+        return moved
+
+    def save_manifest(self, sizes: Dict[str, int]) -> None:
+        try:
+            LocalFileStore().write_json_atomic(
+                self.manifest_path,
+                {"min_size_bytes": self.min_size_bytes, "sizes": sizes},
+            )
+        except OSError:
+            logger.exception(f"CacheArchiver: could not write {self.manifest_path}")
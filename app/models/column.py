@@ -8,16 +8,22 @@ class Column:
         self.widgets: list["widget.Widget"] = []
 
     @staticmethod
-    def from_dict(dictionary: dict, bookmark_manager=None) -> "Column":
+    def from_dict(
+        dictionary: dict, bookmark_manager=None, feed_registry=None
+    ) -> "Column":
         column_obj = Column()
         if "rows" in dictionary:
             column_obj.rows = [
-                row.Row.from_dict(r, bookmark_manager=bookmark_manager)
+                row.Row.from_dict(
+                    r, bookmark_manager=bookmark_manager, feed_registry=feed_registry
+                )
                 for r in dictionary["rows"]
             ]
         if "widgets" in dictionary:
             column_obj.widgets = [
-                widget.Widget.from_dict(w, bookmark_manager=bookmark_manager)
+                widget.Widget.from_dict(
+                    w, bookmark_manager=bookmark_manager, feed_registry=feed_registry
+                )
                 for w in dictionary["widgets"]
             ]
         return column_obj
@@ -1,40 +1,64 @@
 import calendar
-import importlib
+import copy
 import logging
 import os
+import threading
+import time
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from email import utils
 from email.utils import formatdate
 from pathlib import Path
+from typing import Optional
 
 import dateutil
 import feedparser
 
+from .article_snapshot import ArticleSnapshot
 from .feed_article import FeedArticle
 from .feed_cache import FeedCache
-from .noop_feed_processor import NoOpFeedProcessor
-from .utils import calculate_sha1_hash, pwd
+from .filter_engine import FilterEngine
+from .poll_schedule import PollSchedule, WarmupThrottle
+from .retention import RetentionPolicy
+from .utils import calculate_sha1_hash
 from .widget import Widget
-from app.processors.strip_long_urls import StripLongUrls
+from .widget_item import WidgetItem
+from app.services.feed_fetcher import FeedFetcher, FetchResult, get_feed_fetcher
+from app.services.processor_registry import ProcessorRegistry, get_processor_registry
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
 class Feed(Widget):
-    summary_enabled: bool = True
-    from typing import Optional
+    JOB_PREFIX = "feed-"
 
+    summary_enabled: bool = True
     hx_get: Optional[str] = None
-
-    def __init__(self, widget, feed_cache=None, scheduler=None) -> None:
+    view_id: Optional[str] = None
+    # The shared articles, replaced (never modified) on every change
+    _snapshot: ArticleSnapshot = ArticleSnapshot()
+    # ids listed in the last downloaded feed document
+    _seen_ids: frozenset[str] = frozenset()
+    # False until the owner has read its cache (see `hydrate`)
+    _hydrated: bool = True
+    _hydrating: bool = False
+
+    def __init__(
+        self,
+        widget,
+        feed_cache=None,
+        scheduler=None,
+        fetcher=None,
+        feed_registry=None,
+        processor_registry=None,
+    ) -> None:
         super().__init__(widget, scheduler=scheduler)
+        self._fetcher = fetcher  # Allow injection for testing
+        self._processor_registry = processor_registry
 
         self.feed_url = widget["feed_url"]
         self.display_limit = widget.get("display_limit", 10)
         self.summary_enabled = widget.get("summary_enabled", True)
-        self.hx_get = f"/feed/{self.id}"
 
         self._filters = []
         if "filters" in widget:
@@ -49,84 +73,237 @@ class Feed(Widget):
                                 "attribute": attribute,
                             }
                         )
+        self.filter_engine = FilterEngine(self._filters)
+
+        # Widgets showing the same url share one owner Feed, which holds the
+        # cache, the download job and the unfiltered article list. This widget
+        # only renders a view of it.
+        self.views: list["Feed"] = [self]
+        # This widget's filtered/processed snapshot, if it differs from the owner's
+        self._view: Optional[ArticleSnapshot] = None
+        # Article id -> (shared article, this view's processed copy of it)
+        self._processed: dict[str, tuple[FeedArticle, FeedArticle]] = {}
+        self.source = (
+            feed_registry.register(self) if feed_registry is not None else self
+        )
+        self.view_id = (
+            feed_registry.view_id(self) if feed_registry is not None else self.id
+        )
+        self.hx_get = f"/feed/{self.view_id}"
+
+        if self.source is not self:
+            self.feed_cache = self.source.feed_cache
+            self.cache_path = self.source.cache_path
+            # An owner that has not loaded yet rebuilds every view when it does
+            if self.source._hydrated:
+                self.rebuild_view()
+            # The owner polls for every widget, so honour the tightest override
+            if self.source.poll_schedule.request_interval(
+                widget.get("update_interval")
+            ):
+                self.source.reschedule()
+            return
+
+        self.poll_schedule = PollSchedule(widget.get("update_interval"), key=self.id)
+        self._interval: Optional[timedelta] = None
+        self.retention = RetentionPolicy.from_widget(widget)
 
         # Use FeedCache to centralize cache path & IO (inject for testing)
         self.feed_cache = feed_cache or FeedCache(self.id)
         self.cache_path = self.feed_cache.cache_path
 
+        # Articles are read from the cache on first use rather than here, so
+        # building a layout takes the same time however many are cached
+        self._hydrated = False
+        self._hydrate_lock = threading.RLock()
+
+        modified = self.feed_cache.last_modified()
+        self._last_updated = datetime.fromtimestamp(modified) if modified else None
+
+        # A layout being rebuilt schedules its feeds once it is swapped in
+        deferred = feed_registry is not None and feed_registry.defer_jobs
+        if self.scheduler.running and not deferred:
+            self.schedule(feed_registry.warmup if feed_registry is not None else None)
+
+    @property
+    def job_id(self) -> str:
+        return f"{self.JOB_PREFIX}{self.id}"
+
+    def schedule(self, warmup: Optional[WarmupThrottle] = None) -> None:
+        """Add the poll job for this feed url and queue a refresh if it is stale.
+
+        The job id is derived from the url, so scheduling the same feed from a
+        reloaded layout replaces the previous job instead of adding another.
+        """
+        # Until hydrated the default interval is used; `hydrate` reschedules
+        self._interval = self.poll_schedule.next_interval(
+            self.pub_dates if self.hydrated else []
+        )
+        self.job = self.scheduler.add_job(
+            self.enqueue_update,
+            "interval",
+            id=self.job_id,
+            name=f"{self.id} - {self.name} - poll",
+            seconds=self._interval.total_seconds(),
+            start_date=self.poll_schedule.start_date(self._interval),
+            jitter=30,
+            max_instances=1,
+            misfire_grace_time=120,
+            coalesce=True,
+            replace_existing=True,
+        )
+        logger.debug(
+            f"Feed: {self.name} polling every {self._interval} with job id: {self.job.id}"
+        )
+
+        if self.needs_update:
+            # Stagger startup refreshes when loaded as part of a layout
+            if warmup is not None:
+                self.refresh(run_time=warmup.next_run_time())
+            else:
+                self.refresh()
+
+    @property
+    def hydrated(self) -> bool:
+        """True once the shared article list has been read from the cache."""
+        return self.source._hydrated
+
+    def hydrate(self) -> None:
+        """Load the feed's cached articles into the shared list, once.
+
+        Runs on first use of the articles, i.e. the first `/feed/<feed_id>`
+        request or poll job, or from the layout's prewarm. Threads arriving
+        while another one loads wait for it to finish.
+        """
+        source = self.source
+        if source._hydrated:
+            return
+        with source._hydrate_lock:
+            # Loading sets the items, which rebuilds the views on this thread
+            if source._hydrated or source._hydrating:
+                return
+            source._hydrating = True
+            try:
+                source._load_cached_articles()
+            finally:
+                source._hydrating = False
+                source._hydrated = True
+        source.reschedule()
+        source.process_views()
+
+    def process_views(self) -> None:
+        """Queue a job running the views' own processors on the loaded cache.
+
+        The cache only holds the owner's articles, so views with processors of
+        their own are published unprocessed when it is loaded. The job runs
+        them once on the scheduler's pool instead of waiting for the next
+        download, and never on the request that loaded the cache.
+        """
+        if not any(view.own_processors for view in self.views):
+            return
+        if not self.scheduler.running:
+            return
+        self.scheduler.add_job(
+            self._process_views,
+            args=(self._snapshot,),
+            # Not under JOB_PREFIX: a layout swap only drops stale poll jobs
+            id=f"views-{self.id}",
+            name=f"{self.id} - {self.name} - process views",
+            replace_existing=True,
+        )
+
+    def _process_views(self, snapshot: ArticleSnapshot) -> None:
+        # A download published since then has run the processors already
+        if self._snapshot is not snapshot:
+            return
+        for view in self.views:
+            if view.own_processors:
+                view.rebuild_view(run_processors=True)
+
+    def _load_cached_articles(self) -> None:
+        started = time.perf_counter()
         # load cached article dicts then convert to FeedArticle
         dicts = self.feed_cache.load_cache(archive_on_load=False)
         logger.debug(
-            f"Feed.__init__: loaded {len(dicts)} dicts from cache for feed id={self.id} path={self.cache_path}"
+            f"Feed.hydrate: loaded {len(dicts)} dicts from cache for feed id={self.id} path={self.cache_path}"
         )
-        self.items = []
-        appended = 0
+        items = []
         for article in dicts:
             try:
-                # Parse pub_date defensively; if parsing fails, fall back to now
-                raw_pub = article.get("pub_date") or ""
-                try:
-                    pub_dt = dateutil.parser.parse(str(raw_pub))
-                except Exception:
-                    # Use module-level datetime and timezone (imported at top)
-                    pub_dt = datetime.now(tz=timezone.utc)
-
-                self.items.append(
-                    FeedArticle(
-                        original_title=str(
-                            article.get("original_title") or article.get("title") or ""
-                        ),
-                        title=str(article.get("title") or ""),
-                        link=str(article.get("link") or ""),
-                        description=str(article.get("description", "")),
-                        pub_date=pub_dt,
-                        processed=str(article.get("processed") or ""),
-                        parent=self,
-                    )
-                )
-                appended += 1
+                items.append(FeedArticle.from_cache_dict(article, parent=self))
             except Exception:
                 # skip malformed entries
                 continue
+        kept = self.retain(items)
+        # The cache's mtime, not now, is when these articles were downloaded
+        last_updated = self._last_updated
+        # Views run their processors from a job (see `process_views`), not on
+        # the request that happened to load the cache
+        self.publish(kept, run_processors=False)
+        self._last_updated = last_updated
         logger.debug(
-            f"Feed.__init__: appended {appended} articles into self.items for feed id={self.id}"
+            f"Feed.hydrate: appended {len(kept)} articles into self.items for feed id={self.id}"
         )
-        if self.items:
-            self._last_updated = datetime.fromtimestamp(
-                os.path.getmtime(self.cache_path)
-            )
-        else:
-            self._last_updated = None
-
-        if self.scheduler.running:
-            self.job = self.scheduler.add_job(
-                self.update,
-                "cron",
-                name=f"{self.id} - {self.name} - cron",
-                hour="*",
-                jitter=30,
-                max_instances=1,
-                misfire_grace_time=120,
-                coalesce=True,
-            )
-            logger.debug(
-                f"Feed: {self.name} cron job for scheduled with job id: {self.job.id}"
-            )
 
-            if self.needs_update:
-                self.refresh()
+        # Rewrite caches from older versions so the next start loads them
+        # without parsing dates or normalizing text, and caches that retention
+        # just trimmed
+        version = getattr(self.feed_cache, "version", FeedCache.SCHEMA_VERSION)
+        outdated = isinstance(version, int) and version < FeedCache.SCHEMA_VERSION
+        if items and (outdated or len(kept) < len(items)):
+            self.feed_cache.save_articles([article.to_cache_dict() for article in kept])
+            if outdated:
+                logger.info(
+                    f"Feed: upgraded cache for {self.name} from version {version} "
+                    f"to {FeedCache.SCHEMA_VERSION}"
+                )
+
+        modified = self.feed_cache.last_modified() if self.items else None
+        self._last_updated = datetime.fromtimestamp(modified) if modified else None
+        logger.debug(
+            f"Feed: {self.name} hydrated {len(kept)} articles in "
+            f"{time.perf_counter() - started:.3f}s"
+        )
+
+    def refresh(self, run_time: Optional[datetime] = None):
+        if self.source is not self:
+            return self.source.refresh(run_time)
 
-    def refresh(self):
         # Be defensive: some Feed instances may not have a 'job' attribute
         if hasattr(self, "job") and self.job:
-            logging.debug(f"Feed: {self.name} scheduled for immediate update now!")
+            run_time = run_time or datetime.now()
+            logging.debug(f"Feed: {self.name} scheduled for update at {run_time}")
             try:
-                self.job.modify(next_run_time=datetime.now())
+                self.job.modify(next_run_time=run_time)
             except Exception:
                 logger.exception(f"Failed to modify job for feed {self.name}")
         else:
             logger.warning(f"Feed: {self.name} does not have a scheduled job!")
 
+    def reschedule(self) -> None:
+        """Move the poll job to the interval the PollSchedule now recommends."""
+        if not getattr(self, "job", None):
+            return
+
+        interval = self.poll_schedule.next_interval(self.pub_dates)
+        if interval == self._interval:
+            return
+        try:
+            self.job.reschedule(
+                "interval",
+                seconds=interval.total_seconds(),
+                start_date=self.poll_schedule.start_date(interval),
+                jitter=30,
+            )
+            logger.debug(f"Feed: {self.name} now polling every {interval}")
+            self._interval = interval
+        except Exception:
+            logger.exception(f"Failed to reschedule job for feed {self.name}")
+
+    @property
+    def pub_dates(self) -> list[datetime]:
+        return [article.pub_date for article in self.source.articles]
+
     @property
     def needs_update(self):
         force_update = os.getenv("ONBOARD_FEED_FORCE_UPDATE", "").lower() in (
@@ -141,6 +318,154 @@ class Feed(Widget):
             or self.last_updated < datetime.now() - timedelta(minutes=10)
         )
 
+    @property
+    def snapshot(self) -> ArticleSnapshot:
+        """What this widget displays: the shared articles seen through its filters.
+
+        Renderers take the snapshot once and iterate it without locking; an
+        update publishes a new one instead of changing it.
+        """
+        self.hydrate()
+        view = self._view
+        return view if view is not None else self.source._snapshot
+
+    @property
+    def items(self) -> tuple[FeedArticle, ...]:
+        return self.snapshot.articles
+
+    @items.setter
+    def items(self, items: list[FeedArticle]):
+        self.publish(items)
+
+    def publish(
+        self, articles: list[FeedArticle], run_processors: bool = True
+    ) -> ArticleSnapshot:
+        """Replace the shared articles with a new snapshot and rebuild every view.
+
+        Views with their own processors run them unless `run_processors` is
+        False.
+        """
+        source = self.source
+        snapshot = source._snapshot.next(articles)
+        source._snapshot = snapshot
+        # Articles set directly (not from the cache) replace whatever it holds
+        if not source._hydrating:
+            source._hydrated = True
+        source._last_updated = datetime.now()
+        for view in source.views:
+            view.rebuild_view(run_processors=run_processors)
+        return snapshot
+
+    @property
+    def articles(self) -> tuple[FeedArticle, ...]:
+        """The shared, unfiltered articles for this feed url."""
+        self.hydrate()
+        return self.source._snapshot.articles
+
+    @property
+    def known_ids(self) -> frozenset[str]:
+        """Ids of the shared articles."""
+        self.hydrate()
+        return self.source._snapshot.ids
+
+    @property
+    def stop_after_known(self) -> int:
+        """Stop parsing after this many consecutive known entries (0 scans all)."""
+        return int(
+            self.widget.get(
+                "stop_after_known", os.getenv("ONBOARD_FEED_STOP_AFTER_KNOWN", "0")
+            )
+        )
+
+    @property
+    def last_updated(self):
+        return self.source._last_updated or None
+
+    @property
+    def view_settings(self) -> dict:
+        """Per-widget settings that distinguish views of a shared feed.
+
+        Everything the widget template renders besides the articles is
+        included, so widgets sharing a view id (and its `feed-<view id>`
+        element) render identically.
+        """
+        return {
+            key: self.widget.get(key)
+            for key in (
+                "display_limit",
+                "summary_enabled",
+                "filters",
+                "process",
+                "name",
+                "link",
+                "display_header",
+            )
+        }
+
+    @property
+    def own_processors(self) -> bool:
+        """True when this view is configured with different processors than its owner."""
+        return self.widget.get("process", []) != self.source.widget.get("process", [])
+
+    def rebuild_view(self, run_processors: bool = False) -> None:
+        """Recompute the articles shown by this widget from the shared list.
+
+        A view with its own processors runs them on copies of the shared
+        articles, so the owner's cached titles are never overwritten. They are
+        only run after a download or by the job `process_views` queues, never
+        while constructing or loading the layout. A copy is kept for as long as its shared article is unchanged,
+        so processors skip the copies they already marked (see
+        `run_processor`).
+        """
+        if not self.filters and not self.own_processors:
+            self._view = None
+            return
+
+        # Views carry the version of the snapshot they were built from
+        shared = self.source._snapshot
+        if not self.own_processors:
+            self._view = ArticleSnapshot(
+                self.filter_articles(shared.articles), shared.version
+            )
+            return
+
+        view, sources = [], {}
+        for article in shared.articles:
+            kept = self._processed.get(article.id)
+            if kept is not None and kept[0] is article:
+                own = kept[1]
+            elif self.filters:
+                own = self.filter_engine.filtered(article)
+            else:
+                own = copy.copy(article)
+            if own is not None:
+                view.append(own)
+                sources[own.id] = article
+        if run_processors:
+            view = self.processors(view)
+        self._processed = {a.id: (sources[a.id], a) for a in view if a.id in sources}
+        self._view = ArticleSnapshot(view, shared.version)
+
+    def filter_articles(self, articles: list[FeedArticle]) -> list[FeedArticle]:
+        """Return this widget's filtered copies of `articles`."""
+        if not self.filters:
+            return articles
+        return self.filter_engine.filter(articles)
+
+    @property
+    def fetcher(self) -> FeedFetcher:
+        # Use injected fetcher if provided, otherwise the shared fetch engine
+        if self._fetcher is not None:
+            return self._fetcher
+        return get_feed_fetcher()
+
+    @property
+    def processor_registry(self) -> ProcessorRegistry:
+        # Use injected registry if provided, otherwise the shared one
+        if self._processor_registry is not None:
+            return self._processor_registry
+        return get_processor_registry()
+
     @property
     def filters(self):
         return self._filters
@@ -155,8 +480,59 @@ class Feed(Widget):
         self.id = calculate_sha1_hash(url)
 
     def update(self):
-        articles = self.download(self.feed_url)
-        self.items = self.save_articles(articles)
+        """Download and ingest the feed synchronously."""
+        if self.source is not self:
+            return self.source.update()
+        self.hydrate()
+        # Ingested through the callback, so joining a scheduled download of
+        # this feed that is already in flight ingests its result only once
+        self.fetcher.fetch(
+            self.feed_url,
+            etag=self.feed_cache.etag,
+            modified=self.feed_cache.modified,
+            callback=self.ingest_result,
+        )
+
+    def enqueue_update(self):
+        """Scheduled job target: hand the download to the fetch engine.
+
+        The engine downloads concurrently with every other due feed and calls
+        `ingest_result` when the bytes arrive, so the scheduler thread is
+        released immediately instead of blocking on the network.
+        """
+        if self.source is not self:
+            return self.source.enqueue_update()
+        # The conditional GET needs the validators stored with the articles
+        self.hydrate()
+        self.fetcher.submit(
+            self.feed_url,
+            etag=self.feed_cache.etag,
+            modified=self.feed_cache.modified,
+            callback=self.ingest_result,
+        )
+
+    def ingest_result(self, result: FetchResult):
+        started = time.perf_counter()
+        self.ingest(self.parse(result))
+        logger.debug(
+            f"Feed: {self.name} ingested in {time.perf_counter() - started:.3f}s "
+            f"(fetch {result.elapsed:.3f}s, status={result.status})"
+        )
+
+    def ingest(self, articles: Optional[list[FeedArticle]]):
+        if articles is None:
+            # 304 Not Modified: the cached articles are still current, so skip
+            # processors and the cache rewrite entirely.
+            logger.debug(f"Feed: {self.name} not modified since last download")
+            self.source._last_updated = datetime.now()
+            changed = False
+        else:
+            known = self.known_ids
+            changed = any(article.id not in known for article in articles)
+            self.items = self.save_articles(articles)
+
+        self.poll_schedule.record_fetch(changed)
+        self.reschedule()
 
     def load_cache(self, cache_path: Path | None = None) -> list[FeedArticle]:
         """Load cached articles as FeedArticle objects.
@@ -171,16 +547,8 @@ class Feed(Widget):
             for article in json_articles:
                 try:
                     out.append(
-                        FeedArticle(
-                            original_title=article.get(
-                                "original_title", article.get("title")
-                            ),
-                            title=article.get("title"),
-                            link=article.get("link"),
-                            description=article.get("description", ""),
-                            pub_date=dateutil.parser.parse(article.get("pub_date")),
-                            processed=article.get("processed", None),
-                            parent=self,
+                        FeedArticle.from_cache_dict(
+                            article, parent=self, apply_filters=True
                         )
                     )
                 except Exception:
@@ -213,19 +581,77 @@ class Feed(Widget):
 
         return articles
 
-    def download(self, feed_url: str) -> list[FeedArticle]:
+    def download(self, feed_url: str) -> Optional[list[FeedArticle]]:
+        """Download and parse the feed into FeedArticle objects.
+
+        The request is sent as a conditional GET using the validators stored in
+        the feed cache. Returns None when the server answers 304 Not Modified.
+        """
+        result = self.fetcher.fetch(
+            feed_url,
+            etag=self.feed_cache.etag,
+            modified=self.feed_cache.modified,
+        )
+        return self.parse(result)
+
+    def parse(self, result: FetchResult) -> Optional[list[FeedArticle]]:
+        """Parse downloaded feed bytes into FeedArticle objects.
+
+        Returns None for a 304 Not Modified result and an empty list when the
+        download failed.
+        """
+        if result.not_modified:
+            return None
+
+        if not result.ok:
+            logger.warning(
+                f"Download failed for {result.url}: "
+                f"{result.error or f'HTTP {result.status}'}"
+            )
+            return []
+
+        # Remember the new validators; they are persisted with the next save.
+        self.feed_cache.etag = result.etag
+        self.feed_cache.modified = result.modified
+
         articles = []
-        feed = feedparser.parse(feed_url)
+        feed = feedparser.parse(
+            result.content,
+            response_headers={
+                "content-type": result.content_type or "",
+                "content-location": result.url,
+            },
+        )
 
         # Log parse problems but continue processing entries when possible
         if getattr(feed, "bozo", False):
             logger.warning(
                 "RSS parse issue for %s: %s",
-                feed_url,
+                result.url,
                 getattr(feed, "bozo_exception", "unknown"),
             )
 
+        # Entries already in the cache are skipped before any per-entry work;
+        # most polls only add a handful of new entries at the top of the feed.
+        known = self.known_ids
+        stop_after = self.stop_after_known
+        skipped = consecutive_known = 0
+        seen = set()
         for entry in getattr(feed, "entries", []) or []:
+            link_id = WidgetItem.link_id(str(entry.get("link", "")))
+            seen.add(link_id)
+            if link_id in known:
+                skipped += 1
+                consecutive_known += 1
+                if stop_after and consecutive_known >= stop_after:
+                    logger.debug(
+                        f"Feed: {self.name} stopped after {consecutive_known} "
+                        "consecutive known entries"
+                    )
+                    break
+                continue
+            consecutive_known = 0
+
             # Prefer structured times when available to avoid dateutil parse errors
             pub_date: datetime
             try:
@@ -264,17 +690,24 @@ class Feed(Widget):
                         description=description,
                         pub_date=pub_date,
                         processed="",
-                        parent=self,
+                        parent=self.source,
+                        apply_filters=False,
                     )
                 )
             except Exception:
                 # Skip malformed entries defensively
                 continue
 
+        logger.debug(
+            f"Feed: {self.name} parsed {len(articles)} new entries, "
+            f"skipped {skipped} known"
+        )
+        # Retention never spills what the feed still lists
+        self.source._seen_ids = frozenset(seen)
         return articles
 
     def process(self):
-        self.items = self.processors(self.items)
+        self.items = self.processors(list(self.items))
 
     def processors(self, articles: list[FeedArticle]) -> list[FeedArticle]:
         # Always apply conservative global processors first (unless the feed already lists them)
@@ -285,7 +718,9 @@ class Feed(Widget):
 
         try:
             if "strip_long_urls" not in configured:
-                articles = StripLongUrls().process(articles)
+                articles = self.run_processor(
+                    self.processor_registry.get("strip_long_urls"), articles
+                )
         except Exception:
             logger.exception(
                 "Global processor StripLongUrls failed; continuing without it"
@@ -293,42 +728,52 @@ class Feed(Widget):
 
         if "process" in self.widget:
             for processor in self.widget["process"]:
-                processor_name = processor["processor"]
-                # Check both app/processors and root processors directories
-                app_processor_path = pwd.joinpath(
-                    "app", "processors", processor_name + ".py"
-                )
-                root_processor_path = pwd.joinpath("processors", processor_name + ".py")
+                processor_instance = self.processor_registry.get(processor["processor"])
+                articles = self.run_processor(processor_instance, articles)
 
-                processor_instance = None
-                if app_processor_path.exists():
-                    try:
-                        module = importlib.import_module(
-                            f"app.processors.{processor_name}"
-                        )
-                        processor_class = getattr(
-                            module,
-                            "".join(word.title() for word in processor_name.split("_")),
-                        )
-                        processor_instance = processor_class()
-                    except (ImportError, AttributeError):
-                        processor_instance = NoOpFeedProcessor()
-                elif root_processor_path.exists():
-                    try:
-                        module = importlib.import_module(f"processors.{processor_name}")
-                        processor_class = getattr(
-                            module,
-                            "".join(word.title() for word in processor_name.split("_")),
-                        )
-                        processor_instance = processor_class()
-                    except (ImportError, AttributeError):
-                        processor_instance = NoOpFeedProcessor()
-                else:
-                    processor_instance = NoOpFeedProcessor()
+        return articles
 
-                articles = processor_instance.process(articles)
+    def run_processor(
+        self, processor, articles: list[FeedArticle]
+    ) -> list[FeedArticle]:
+        """Run `processor` only on articles it has not yet seen at its current version.
 
-        return articles
+        Processors opt in by exposing a `version`; the "<Class>:<version>"
+        fingerprint is stored on each article (and persisted in the cache), so
+        unchanged articles are skipped on later updates and everything is
+        reprocessed once when the version changes. Processors without a
+        `version` run on every article each time.
+        """
+        # Processors change articles in place, so published articles (the
+        # shared ones and this view's) are replaced by copies first
+        published = [self.source._snapshot]
+        if self._view is not None:
+            published.append(self._view)
+        version = getattr(processor, "version", None)
+        if version is None:
+            for snapshot in published:
+                articles = snapshot.writable(articles)
+            return processor.process(articles)
+
+        fingerprint = f"{type(processor).__name__}:{version}"
+        pending = [a for a in articles if fingerprint not in a.processed_by]
+        if not pending:
+            return articles
+        shared = [a for a in pending if any(a in p for p in published)]
+        if shared:
+            copies = {id(a): copy.copy(a) for a in shared}
+            articles = [copies.get(id(a), a) for a in articles]
+            pending = [copies.get(id(a), a) for a in pending]
+
+        processed = processor.process(pending)
+        for article in processed:
+            article.mark_processed(fingerprint)
+
+        pending_ids = {id(a) for a in pending}
+        if {id(a) for a in processed} == pending_ids:
+            # Updated in place: keep the caller's list and ordering
+            return articles
+        return [a for a in articles if id(a) not in pending_ids] + list(processed)
 
     def remove_duplicate_articles(self, articles):
         # Filters a list of objects and returns a new list with objects where 'removed' is False.
@@ -347,34 +792,61 @@ class Feed(Widget):
             for articles_list in article_dict.values()
         ]
 
+    def retain(self, articles: list[FeedArticle]) -> list[FeedArticle]:
+        """Apply the retention policy to `articles` (newest first).
+
+        Returns the articles to keep; the rest are appended to the feed's
+        history. Every widget showing this feed keeps at least its
+        display_limit; widgets without one (`display_limit: null`) are bound
+        by the retention policy alone.
+        """
+        limits = [view.display_limit for view in self.source.views]
+        kept, spilled = self.source.retention.split(
+            articles,
+            keep_ids=self.source._seen_ids,
+            min_count=max((limit for limit in limits if limit), default=0),
+        )
+        if spilled:
+            self.source.feed_cache.spill(
+                [article.to_cache_dict() for article in spilled]
+            )
+            logger.info(
+                f"Feed: {self.name} moved {len(spilled)} articles to history, "
+                f"keeping {len(kept)}"
+            )
+        return kept
+
     def save_articles(self, articles: list[FeedArticle]):
         # load all existing articles from the json file, and add the new ones
         # then apply the filters
         # Get existing articles as FeedArticle objects
-        existing = self.items or []
-        all_articles = existing + articles
+        existing = self.source.articles
+        all_articles = list(existing) + articles
 
         # using article.id remove duplicates from articles
         all_articles = self.remove_duplicate_articles(all_articles)
 
-        all_articles = self.processors(all_articles)
+        # The shared list keeps every article so other widgets can apply their
+        # own filters; processors (which may be expensive) only run on the ones
+        # this feed's filters keep, and return copies of published articles.
+        if self.filters:
+            keep = {article.id for article in self.filter_articles(all_articles)}
+            processed = {
+                article.id: article
+                for article in self.processors(
+                    [a for a in all_articles if a.id in keep]
+                )
+            }
+            all_articles = [processed.get(a.id, a) for a in all_articles]
+        else:
+            all_articles = self.processors(all_articles)
 
         # sort articles in place by pub_date newest to oldest
         all_articles.sort(key=lambda a: a.pub_date, reverse=True)
+        all_articles = self.retain(all_articles)
 
         # Persist using FeedCache (save serializable dicts)
-        serializable = [
-            {
-                "original_title": article.original_title,
-                "title": article.title,
-                "link": article.link,
-                "description": article.description,
-                "pub_date": utils.format_datetime(article.pub_date),
-                "id": article.id,
-                "processed": article.processed,
-            }
-            for article in all_articles
-        ]
+        serializable = [article.to_cache_dict() for article in all_articles]
 
         self.feed_cache.save_articles(serializable)
         logger.info(
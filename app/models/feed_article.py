@@ -1,26 +1,51 @@
 import datetime
+import functools
 import html
 import re
 import warnings
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Union
 
+import dateutil.parser
 from bs4 import BeautifulSoup, MarkupResemblesLocatorWarning
 
 # Removed import to avoid circular import: from .feed import Feed
+from .filter_engine import FilterEngine
 from .utils import normalize_text
 from .widget_item import WidgetItem
 
 warnings.filterwarnings("ignore", category=MarkupResemblesLocatorWarning)
 
 
+@functools.lru_cache(maxsize=1024)
+def _shared(value):
+    """Return one canonical object for equal, frequently repeated values.
+
+    Processing timestamps and processor fingerprints repeat across every
+    article handled in the same run, so the articles can share one copy.
+    """
+    return value
+
+
 class FeedArticle(WidgetItem):
+    __slots__ = (
+        "original_title",
+        "_title",
+        "description",
+        "pub_date",
+        "removed",
+        "processed",
+        "processed_by",
+        "_summary",
+        "_derived",
+    )
+
     original_title: str
-    title: str
     description: str
     pub_date: datetime.datetime
-    summary: Optional[str] = None
-    removed: bool = False
-    processed: Optional[str] = None
+    removed: bool
+    processed: Optional[str]
+    # "<Processor>:<version>" fingerprints of the processors already applied
+    processed_by: frozenset[str]
 
     def __init__(
         self,
@@ -31,20 +56,53 @@ class FeedArticle(WidgetItem):
         pub_date: datetime.datetime,
         processed: str,
         parent: Any,
+        apply_filters: bool = True,
+        name: Optional[str] = None,
+        processed_by: Iterable[str] = (),
     ):
         super().__init__(original_title, link, parent)
 
         self.original_title = normalize_text(original_title)
         if title:
-            self.title = normalize_text(title)
+            self._title = self._reuse(normalize_text(title))
         elif self.name:
-            self.title = self.name
+            self._title = self._reuse(self.name)
         else:
-            self.title = self.original_title
+            self._title = self.original_title
 
         self.description = normalize_text(description)
         self.pub_date = pub_date
-        self.processed = processed
+        self.removed = False
+        self.processed = _shared(processed) if processed else processed
+        self.processed_by = _shared(frozenset(processed_by))
+
+        # summary (and possibly title) come from parsing the description HTML,
+        # which is deferred until one of them is first read
+        self._summary: Optional[str] = None
+        self._derived = False
+
+        # Restore a display name rewritten by processors (e.g. StripLongUrls)
+        if name:
+            self.name = self._reuse(name)
+
+        if apply_filters:
+            self.apply_filters(self._parent_filters())
+
+    def _parent_filters(self) -> Optional[Union[list[dict], FilterEngine]]:
+        # Prefer the parent's precompiled filters over compiling them again
+        filters = getattr(self.parent, "filter_engine", None)
+        if isinstance(filters, FilterEngine):
+            return filters
+        return getattr(self.parent, "filters", None)
+
+    def _reuse(self, text: str) -> str:
+        # Most articles have the same name, title and original title; keep a
+        # single string instead of three equal copies.
+        return self.original_title if text == self.original_title else text
+
+    def _derive(self) -> None:
+        if self._derived:
+            return
 
         summary = normalize_text(self.description)
         summary = BeautifulSoup(html.unescape(summary), "html.parser").text
@@ -52,36 +110,153 @@ class FeedArticle(WidgetItem):
 
         # If the extracted summary exactly matches the original title or the
         # title appears to be the same content, treat it as no summary.
+        title = self._title
         if summary == self.original_title or summary in self.original_title:
-            self.summary = None
-        elif summary == self.title:
+            summary = None
+        elif summary == title:
             # When the summary equals the provided title, clear the summary.
-            self.summary = None
+            summary = None
         elif (
             self.original_title in summary
             and len(self.original_title) / len(summary) > 0.64
         ):
-            self.title = summary
-            self.summary = None
-        else:
-            self.summary = summary
-
-        filters = getattr(self.parent, "filters", None)
-        if filters is not None:
-            for filter in filters:
-                if not hasattr(self, filter["attribute"]):
-                    continue
-                match filter["type"]:
-                    case "remove":
-                        if re.search(
-                            filter["text"],
-                            getattr(self, filter["attribute"]),
-                            re.IGNORECASE,
-                        ):
-                            self.removed = True
-                    case "strip":
-                        pattern = re.compile(filter["text"])
-                        result = re.sub(pattern, "", getattr(self, filter["attribute"]))
-                        setattr(self, filter["attribute"], result)
-                    case _:
-                        pass
+            title = summary
+            summary = None
+
+        # Published articles are read by several threads without a lock, so
+        # the flag is only set once both fields hold their derived values;
+        # a thread that races in derives the same values again.
+        self._title = title
+        self._summary = summary
+        self._derived = True
+
+    @property
+    def title(self) -> str:
+        self._derive()
+        return self._title
+
+    @title.setter
+    def title(self, title: str):
+        self._derive()
+        self._title = title
+
+    @property
+    def summary(self) -> Optional[str]:
+        self._derive()
+        return self._summary
+
+    @summary.setter
+    def summary(self, summary: Optional[str]):
+        self._derive()
+        self._summary = summary
+
+    @property
+    def stored_title(self) -> str:
+        """Title to persist, without forcing the description to be parsed.
+
+        An underived title is still the raw input, and deriving again from the
+        same inputs after a reload gives the same result.
+        """
+        return self._title
+
+    def to_cache_dict(self) -> dict:
+        """Serialize for the feed cache (schema version 2).
+
+        `pub_date` is stored as epoch seconds. Once the summary has been
+        derived it is stored with the derived title, so a reload never has to
+        parse the description again.
+        """
+        data = {
+            "original_title": self.original_title,
+            "title": self.stored_title,
+            "link": self.link,
+            "description": self.description,
+            "pub_date": int(self.pub_date.timestamp()),
+            "id": self.id,
+            "processed": self.processed,
+            "name": self.name,
+            "processed_by": sorted(self.processed_by),
+        }
+        if self._derived:
+            data["summary"] = self._summary
+        return data
+
+    @classmethod
+    def from_cache_dict(
+        cls, data: dict, parent: Any, apply_filters: bool = False
+    ) -> "FeedArticle":
+        """Rebuild an article from a feed cache entry.
+
+        Version 2 entries are already normalized, so they are restored as is.
+        Entries written by older versions (RFC 2822 `pub_date`) go through
+        __init__ to be normalized and parsed.
+        """
+        pub_date = data.get("pub_date")
+        if not isinstance(pub_date, (int, float)):
+            try:
+                pub_date = dateutil.parser.parse(str(pub_date or ""))
+            except (ValueError, OverflowError):
+                pub_date = datetime.datetime.now(tz=datetime.timezone.utc)
+            return cls(
+                original_title=str(
+                    data.get("original_title") or data.get("title") or ""
+                ),
+                title=str(data.get("title") or ""),
+                link=str(data.get("link") or ""),
+                description=str(data.get("description") or ""),
+                pub_date=pub_date,
+                processed=data.get("processed"),
+                parent=parent,
+                apply_filters=apply_filters,
+                name=data.get("name"),
+                processed_by=data.get("processed_by") or (),
+            )
+
+        article = cls.__new__(cls)
+        article.parent = parent
+        article.original_title = data["original_title"]
+        article.name = article._reuse(data.get("name") or article.original_title)
+        article._link = data["link"]
+        article.id = data.get("id") or cls.link_id(data["link"])
+        article._title = article._reuse(data["title"])
+        article.description = data["description"]
+        article.pub_date = datetime.datetime.fromtimestamp(
+            pub_date, tz=datetime.timezone.utc
+        )
+        article.removed = False
+        processed = data.get("processed")
+        article.processed = _shared(processed) if processed else processed
+        article.processed_by = _shared(frozenset(data.get("processed_by") or ()))
+        article._derived = "summary" in data
+        article._summary = data.get("summary")
+        if apply_filters:
+            article.apply_filters(article._parent_filters())
+        return article
+
+    def mark_processed(self, fingerprint: str) -> None:
+        """Record that a processor ran, replacing older versions of the same one."""
+        processor = fingerprint.split(":", 1)[0]
+        self.processed_by = frozenset(
+            fp for fp in self.processed_by if fp.split(":", 1)[0] != processor
+        ) | {fingerprint}
+        self.processed_by = _shared(self.processed_by)
+
+    def apply_filters(self, filters: Optional[Union[list[dict], FilterEngine]]) -> None:
+        """Apply remove/strip filters to this article in place."""
+        if not filters:
+            return
+        if not isinstance(filters, FilterEngine):
+            filters = FilterEngine(filters)
+        filters.apply(self)
+
+    def filtered(
+        self, filters: Optional[Union[list[dict], FilterEngine]]
+    ) -> Optional["FeedArticle"]:
+        """Return a filtered copy of this article, or None if a filter removes it.
+
+        The article itself is left untouched so it can be shared between widgets
+        that display the same feed with different filters.
+        """
+        if not isinstance(filters, FilterEngine):
+            filters = FilterEngine(filters)
+        return filters.filtered(self)
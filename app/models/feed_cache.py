@@ -1,21 +1,34 @@
 import logging
 import os
-from datetime import date
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
+from .cache_archiver import CacheArchiver
 from .file_store import CacheStore
+from .history_database import HistoryDatabase, get_history_database
+from .history_store import HistoryStore
 from .local_file_store import LocalFileStore
+from .retention import RetentionPolicy
+from .sqlite_cache_store import get_sqlite_cache_store
 from .utils import pwd
 
 
-def _is_testing_mode() -> bool:
-    # Consider testing mode if FLASK_ENV=="testing" or scheduler/archive explicitly disabled
-    if os.environ.get("FLASK_ENV", "").lower() == "testing":
-        return True
-    if os.environ.get("ONBOARD_DISABLE_SCHEDULER", "False").lower() == "true":
-        return True
-    return False
+def default_cache_store(cache_dir: Path) -> CacheStore:
+    """Return the CacheStore selected by ONBOARD_CACHE_STORE.
+
+    "json" (the default) writes one JSON file per feed via LocalFileStore;
+    "sqlite" keeps all feeds in one database, ONBOARD_CACHE_DB or
+    `<cache_dir>/feeds.sqlite3`.
+    """
+    kind = os.getenv("ONBOARD_CACHE_STORE", "json").lower()
+    if kind == "sqlite":
+        db_path = os.getenv("ONBOARD_CACHE_DB") or cache_dir.joinpath("feeds.sqlite3")
+        return get_sqlite_cache_store(Path(db_path))
+    if kind != "json":
+        logging.getLogger(__name__).warning(
+            f"Unknown ONBOARD_CACHE_STORE {kind!r}; using json files"
+        )
+    return LocalFileStore()
 
 
 class FeedCache:
@@ -25,20 +38,36 @@ class FeedCache:
     - compute cache dir (based on working_dir or WORKING_STORAGE)
     - load cache as list[dict]
     - save articles atomically
+    - persist HTTP validators (ETag / Last-Modified) for conditional GETs
     - archive large json files in the cache directory
+    - append articles dropped by retention to the feed's history, and page
+      through it once compacted into the history database
+
+    Files carry a schema `version`. Version 1 files (no `version` key) store
+    RFC 2822 `pub_date` strings; version 2 stores epoch seconds and the
+    derived article fields. `version` reflects the file last loaded so the
+    feed can rewrite an old file in the current format.
     """
 
+    SCHEMA_VERSION = 2
+
+    etag: Optional[str] = None
+    modified: Optional[str] = None
+    version: int = SCHEMA_VERSION
+
     def __init__(
         self,
         feed_id: str,
         working_dir: Optional[Path] = None,
         file_store: Optional[CacheStore] = None,
+        history: Optional[HistoryStore] = None,
+        history_database: Optional[HistoryDatabase] = None,
     ):
         """Create a FeedCache bound to a feed id.
 
         If `file_store` is provided, use it for all filesystem operations. If not,
-        fall back to the real filesystem via `LocalFileStore` so behavior is
-        unchanged.
+        use the store configured by ONBOARD_CACHE_STORE (see
+        `default_cache_store`).
         """
         self.feed_id = feed_id
         if working_dir is None:
@@ -52,20 +81,18 @@ class FeedCache:
         cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir: Path = cache_dir
         self.cache_path: Path = cache_dir.joinpath(f"{self.feed_id}.json")
-        # Dependency-injected file store; default to LocalFileStore for
-        # backwards compatibility.
-        self.file_store: CacheStore = file_store or LocalFileStore()
-
-        # Run best-effort startup logic (archive existing large cache files)
-        # by default we avoid running this in testing or when the scheduler is disabled.
-        if not _is_testing_mode():
-            # archive_large_jsons is implemented to never raise; call directly
-            self.archive_large_jsons()
+        # Dependency-injected file store; otherwise the store selected by
+        # ONBOARD_CACHE_STORE.
+        self.file_store: CacheStore = file_store or default_cache_store(cache_dir)
+        # Articles dropped by retention are appended here
+        self.history = history or HistoryStore(cache_dir.joinpath("history"))
+        self._history_database = history_database
 
     def load_cache(self, archive_on_load: bool = True) -> List[dict]:
         """Return list of article dicts stored in the cache file.
 
-        If archive_on_load is True, run archive_large_jsons first. On error, return []
+        If archive_on_load is True, run archive_large_jsons first. On error,
+        return []
         """
         try:
             if archive_on_load:
@@ -76,68 +103,109 @@ class FeedCache:
             # Use the file_store to read JSON; implementations are expected to
             # raise on errors which we catch below and return []. If the store
             # does not find the file it may raise or return an empty payload.
-            if not self.cache_path.exists():
+            if not self.file_store.exists(self.cache_path):
                 return []
 
             payload = self.file_store.read_json(self.cache_path)
-            return payload.get("articles", []) if isinstance(payload, dict) else []
+            return self.adopt(payload)
         except Exception:
             # Keep behaviour simple: on any parse/read error return empty list
             return []
 
+    def adopt(self, payload: Any) -> List[dict]:
+        """Take the version and validators of a cache payload; return its articles."""
+        if not isinstance(payload, dict):
+            return []
+
+        # Remember the validators from the last successful download so the
+        # next fetch can be sent as a conditional GET.
+        self.etag = payload.get("etag")
+        self.modified = payload.get("modified")
+        self.version = payload.get("version", 1)
+        return payload.get("articles", [])
+
     def save_articles(self, articles: List[dict]) -> List[dict]:
         """Atomically write the provided list of article dicts into the feed cache file.
 
         Returns the list written.
         """
-        data = {"name": None, "link": None, "articles": articles}
+        data = {
+            "version": self.SCHEMA_VERSION,
+            "name": None,
+            "link": None,
+            "etag": self.etag,
+            "modified": self.modified,
+            "articles": articles,
+        }
 
         # Delegate atomic write to the file store implementation. Implementations
         # should ensure parent directories exist when writing.
         self.file_store.write_json_atomic(self.cache_path, data)
+        self.version = self.SCHEMA_VERSION
         return articles
 
-    def archive_large_jsons(self, min_size_bytes: int = 300 * 1024) -> List[Path]:
-        """Move any .json files in `cache_dir` larger than `min_size_bytes` into an archive folder.
+    def spill(self, articles: List[dict]) -> None:
+        """Append articles that no longer fit the live cache to the feed's history."""
+        self.history.append(self.feed_id, articles)
+
+    @property
+    def history_database(self) -> HistoryDatabase:
+        """History database shared by every feed.
 
-        Returns list of new paths for moved files.
+        Located at ONBOARD_HISTORY_DB, or `<cache_dir>/history.sqlite3`.
         """
-        logger = logging.getLogger(__name__)
-        moved: List[Path] = []
+        if self._history_database is None:
+            default = self.cache_dir.joinpath("history.sqlite3")
+            db_path = os.getenv("ONBOARD_HISTORY_DB") or default
+            self._history_database = get_history_database(Path(db_path))
+        return self._history_database
+
+    def run_maintenance(self) -> int:
+        """Archive oversized caches if retention is off, then compact history.
+
+        Run by the layout's maintenance job. Live caches are only archived by
+        size when retention is disabled (ONBOARD_FEED_MAX_ARTICLES=0):
+        retention already bounds them, and an archived cache is not hydrated
+        again. Returns the number of articles compacted.
+        """
+        if not RetentionPolicy().max_count:
+            self.archive_large_jsons()
+        return self.compact_history()
+
+    def compact_history(self) -> int:
+        """Fold every feed's spills and archived caches into the history database.
+
+        The database is not opened when there is nothing to compact.
+        """
+        spilled = any(self.history.history_dir.glob("*.jsonl")) or any(
+            self.history.history_dir.glob("*.compacting")
+        )
+        archived = any(p.is_dir() for p in self.cache_dir.glob("archive-*"))
+        if not (spilled or archived):
+            return 0
+        return self.history_database.compact(self.cache_dir, self.history)
+
+    def history_page(
+        self, before: Optional[str] = None, limit: int = 50
+    ) -> tuple[List[dict], Optional[str]]:
+        """Page through this feed's history, newest first.
+
+        Pending spills are compacted first so the page includes them. Returns
+        the articles and the cursor for the next page (None at the end).
+        """
+        self.history_database.compact_feed(self.feed_id, self.history)
+        return self.history_database.page(self.feed_id, before=before, limit=limit)
 
+    def last_modified(self) -> Optional[float]:
+        """When this feed's cache was last written (epoch seconds), if known."""
         try:
-            today = date.today().isoformat()
-            archive_dir = self.cache_dir.joinpath(f"archive-{today}")
-
-            # Ensure archive dir exists
-            archive_dir.mkdir(parents=True, exist_ok=True)
-
-            for p in list(self.file_store.list_dir(self.cache_dir)):
-                if not p.is_file():
-                    continue
-                if p.suffix != ".json":
-                    continue
-
-                # Use a safe stat call; if file disappears, skip it.
-                try:
-                    size = p.stat().st_size
-                except FileNotFoundError:
-                    continue
-
-                if size > min_size_bytes:
-                    dest = archive_dir.joinpath(p.name)
-                    # Delegate move to file_store so tests can simulate moves
-                    try:
-                        self.file_store.move(p, dest)
-                        moved.append(dest)
-                    except Exception as e:
-                        # Log per-file move errors and continue with other files
-                        logger.exception("Failed to move %s to %s: %s", p, dest, e)
-                        continue
-        except Exception as e:
-            # Top-level safety: archive_large_jsons must never raise. Log and return
-            logger.exception(
-                "archive_large_jsons encountered an unexpected error: %s", e
-            )
-
-        return moved
+            return self.file_store.mtime(self.cache_path)
+        except OSError:
+            return None
+
+    def archive_large_jsons(self, min_size_bytes: int = 300 * 1024) -> List[Path]:
+        """Move any .json files in `cache_dir` larger than `min_size_bytes` into an archive folder.
+
+        Runs a CacheArchiver pass right away. Returns list of new paths for moved files.
+        """
+        return CacheArchiver(self.cache_dir, self.file_store, min_size_bytes).run()
@@ -0,0 +1,71 @@
+import json
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from .poll_schedule import WarmupThrottle
+from .utils import calculate_sha1_hash
+
+if TYPE_CHECKING:
+    from .feed import Feed
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+
+class FeedRegistry:
+    """Layout-wide index of Feed widgets keyed by feed id (sha1 of feed_url).
+
+    The first Feed registered for a url becomes its owner: it loads the
+    FeedCache, schedules the download job and holds the shared article list.
+    Every later widget with the same url is a view on the owner that only
+    applies its own display_limit, filters and processors. With `defer_jobs`
+    owners do not schedule themselves; the caller calls `Feed.schedule`.
+    """
+
+    def __init__(self, defer_jobs: bool = False) -> None:
+        self.defer_jobs = defer_jobs
+        self._owners: dict[str, "Feed"] = {}
+        # feed id -> {view settings signature: view id}
+        self._view_ids: dict[str, dict[str, str]] = {}
+        # Staggers the refreshes of stale feeds queued while the layout loads
+        self.warmup = WarmupThrottle()
+
+    def register(self, feed: "Feed") -> "Feed":
+        """Register `feed` and return the Feed that owns its url."""
+        owner = self._owners.setdefault(feed.id, feed)
+        if owner is not feed:
+            owner.views.append(feed)
+            logger.debug(
+                f"FeedRegistry: {feed.name} shares {feed.feed_url} with {owner.name}"
+            )
+        return owner
+
+    def view_id(self, feed: "Feed") -> str:
+        """Return the id used to address this widget's rendering of the feed.
+
+        Widgets that display a url the same way share the feed id; a widget
+        with different display settings gets an id of its own so its fragment
+        can be requested separately.
+        """
+        signature = json.dumps(feed.view_settings, sort_keys=True, default=str)
+        views = self._view_ids.setdefault(feed.id, {})
+        if signature not in views:
+            views[signature] = (
+                feed.id
+                if not views
+                else calculate_sha1_hash(f"{feed.feed_url}#{signature}")
+            )
+        return views[signature]
+
+    def get(self, feed_id: str) -> Optional["Feed"]:
+        return self._owners.get(feed_id)
+
+    @property
+    def owners(self) -> list["Feed"]:
+        return list(self._owners.values())
+
+    def __contains__(self, feed_id: str) -> bool:
+        return feed_id in self._owners
+
+    def __len__(self) -> int:
+        return len(self._owners)
@@ -1,3 +1,4 @@
+import os
 from copy import copy
 from pathlib import Path
 from typing import List
@@ -48,3 +49,14 @@ class CacheStore:
     """
 
   pass
+
+  def exists(self, path: Path) -> bool:
+    """Return True if there is stored data at path.
+
+    Defaults to the real filesystem; stores that keep data elsewhere override it.
+    """
+    return path.exists()
+
+  def mtime(self, path: Path) -> float:
+    """Return the last modification time of the data at path (epoch seconds)."""
+    return os.path.getmtime(path)
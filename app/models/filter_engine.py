@@ -0,0 +1,100 @@
+import copy
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+# Patterns using backreferences can't be merged into an alternation, since the
+# group numbers shift once they are combined with other patterns.
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+@dataclass
+class _Step:
+    type: str
+    attribute: str
+    pattern: re.Pattern
+
+
+class FilterEngine:
+    """A widget's `remove`/`strip` filters compiled once for a whole feed.
+
+    Filters come from layout.yml as `{"type", "text", "attribute"}` dicts.
+    Every `remove` rule on the same attribute is merged into one
+    case-insensitive alternation, so a plain keyword list costs a single
+    search per article instead of one per keyword. `strip` rules are compiled
+    once and keep their position, so a removal still sees the value as
+    stripped by the rules listed before it.
+    """
+
+    def __init__(self, filters: Optional[Iterable[dict]] = None) -> None:
+        self.filters = list(filters or [])
+        self.steps: list[_Step] = []
+
+        pending: dict[str, list[str]] = {}
+        for filter in self.filters:
+            attribute = filter["attribute"]
+            match filter["type"]:
+                case "remove":
+                    pending.setdefault(attribute, []).append(filter["text"])
+                case "strip":
+                    # removes seen so far must match the value before this strip
+                    if attribute in pending:
+                        self._add_removes(attribute, pending.pop(attribute))
+                    self.steps.append(
+                        _Step("strip", attribute, re.compile(filter["text"]))
+                    )
+                case _:
+                    pass
+        for attribute, texts in pending.items():
+            self._add_removes(attribute, texts)
+
+    def __bool__(self) -> bool:
+        return bool(self.steps)
+
+    def _add_removes(self, attribute: str, texts: list[str]) -> None:
+        merge = [text for text in texts if not _BACKREFERENCE.search(text)]
+        alone = [text for text in texts if _BACKREFERENCE.search(text)]
+        if merge:
+            combined = "|".join(f"(?:{text})" for text in merge)
+            try:
+                self.steps.append(
+                    _Step("remove", attribute, re.compile(combined, re.IGNORECASE))
+                )
+            except re.error:
+                # e.g. a pattern with global inline flags; compile each one
+                alone = texts
+        for text in alone:
+            self.steps.append(
+                _Step("remove", attribute, re.compile(text, re.IGNORECASE))
+            )
+
+    def apply(self, article: Any, stop_on_remove: bool = False) -> None:
+        """Apply every filter to `article` in place, setting `removed` on a match."""
+        for step in self.steps:
+            value = getattr(article, step.attribute, None)
+            if value is None:
+                continue
+            if step.type == "remove":
+                if step.pattern.search(value):
+                    article.removed = True
+                    if stop_on_remove:
+                        return
+            else:
+                setattr(article, step.attribute, step.pattern.sub("", value))
+
+    def filtered(self, article: Any) -> Optional[Any]:
+        """Return a filtered copy of `article`, or None if a filter removes it."""
+        view = copy.copy(article)
+        view.removed = False
+        self.apply(view, stop_on_remove=True)
+        return None if view.removed else view
+
+    def filter(self, articles: Iterable[Any]) -> list[Any]:
+        """Return filtered copies of the `articles` that are not removed."""
+        if not self.steps:
+            return list(articles)
+        return [
+            view
+            for view in (self.filtered(article) for article in articles)
+            if view is not None
+        ]
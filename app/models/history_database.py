@@ -0,0 +1,187 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .history_store import HistoryStore, read_jsonl
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    feed_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    pub_date INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (feed_id, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS history_by_date ON history (feed_id, pub_date DESC, id DESC);
+"""
+
+
+class HistoryDatabase:
+    """Compacted, queryable history of every article that left a live cache.
+
+    Articles are stored one row each in a SQLite database, keyed by feed id and
+    article id and indexed by feed id and pub_date, with the cache-format JSON
+    zlib-compressed. Rows are only ever added: an article already present is
+    ignored. `compact` folds in the two places old articles pile up, the
+    per-feed history spill files written by retention and the
+    `archive-YYYY-MM-DD` folders of archived caches, and deletes them once
+    their articles are stored.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def add(self, feed_id: str, articles: Iterable[dict]) -> int:
+        """Store cache-format articles for `feed_id`; returns how many were new."""
+        rows = [
+            (
+                feed_id,
+                str(article["id"]),
+                int(article["pub_date"]),
+                zlib.compress(json.dumps(article, separators=(",", ":")).encode()),
+            )
+            for article in _normalized(articles)
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO history (feed_id, id, pub_date, data)"
+                    " VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return self._conn.total_changes - before
+
+    def count(self, feed_id: str) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM history WHERE feed_id = ?", (feed_id,)
+            ).fetchone()
+        return count
+
+    def page(
+        self, feed_id: str, before: Optional[str] = None, limit: int = 50
+    ) -> tuple[list[dict], Optional[str]]:
+        """Return up to `limit` articles older than the `before` cursor, newest first.
+
+        The second value is the cursor for the next page, or None at the end.
+        """
+        query = "SELECT pub_date, id, data FROM history WHERE feed_id = ?"
+        params: list = [feed_id]
+        if before:
+            pub_date, _, article_id = before.partition(":")
+            query += " AND (pub_date, id) < (?, ?)"
+            params += [int(pub_date), article_id]
+        query += " ORDER BY pub_date DESC, id DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        articles = [json.loads(zlib.decompress(data)) for _, _, data in rows]
+        cursor = f"{rows[-1][0]}:{rows[-1][1]}" if len(rows) == limit else None
+        return articles, cursor
+
+    def compact_feed(self, feed_id: str, history: HistoryStore) -> int:
+        """Move the feed's pending history spill file into the database."""
+        path = history.path(feed_id)
+        # Retention may append while we read, so the file is renamed first
+        pending = path.with_suffix(".compacting")
+        added = 0
+        if pending.exists():
+            # Left by a run that stopped before deleting it
+            added += self.add(feed_id, read_jsonl(pending))
+            pending.unlink()
+        if path.exists():
+            os.replace(path, pending)
+            added += self.add(feed_id, read_jsonl(pending))
+            pending.unlink()
+        return added
+
+    def compact(self, cache_dir: Path, history: HistoryStore) -> int:
+        """Fold spill files and archived caches under `cache_dir` into the database.
+
+        Never raises; files that fail are left in place for the next run.
+        """
+        added = 0
+        pending = [*history.history_dir.glob("*.jsonl")]
+        pending += history.history_dir.glob("*.compacting")
+        for feed_id in sorted({p.stem for p in pending}):
+            try:
+                added += self.compact_feed(feed_id, history)
+            except Exception:
+                logger.exception(f"HistoryDatabase: failed to compact {feed_id}")
+
+        for archive_dir in sorted(Path(cache_dir).glob("archive-*")):
+            if not archive_dir.is_dir():
+                continue
+            for path in sorted(archive_dir.glob("*.json")):
+                try:
+                    payload = json.loads(path.read_text(encoding="utf-8"))
+                    articles = (
+                        payload.get("articles", []) if isinstance(payload, dict) else []
+                    )
+                    added += self.add(path.stem, articles)
+                    path.unlink()
+                except Exception:
+                    logger.exception(f"HistoryDatabase: failed to compact {path}")
+            if not any(archive_dir.iterdir()):
+                archive_dir.rmdir()
+
+        if added:
+            logger.info(
+                f"HistoryDatabase: compacted {added} articles into {self.db_path}"
+            )
+        return added
+
+
+def _normalized(articles: Iterable[dict]) -> Iterable[dict]:
+    """Yield articles in the current cache format, upgrading older entries."""
+    from .feed_article import FeedArticle
+
+    for article in articles:
+        if not isinstance(article, dict) or not article.get("link"):
+            continue
+        if not isinstance(article.get("pub_date"), int):
+            article = FeedArticle.from_cache_dict(article, parent=None).to_cache_dict()
+        if article.get("id"):
+            yield article
+
+
+_DATABASES: dict[Path, HistoryDatabase] = {}
+_DATABASES_LOCK = threading.Lock()
+
+
+def get_history_database(db_path: Path) -> HistoryDatabase:
+    """Return the process-wide database for `db_path`, opening it on first use."""
+    db_path = Path(db_path).resolve()
+    with _DATABASES_LOCK:
+        if db_path not in _DATABASES:
+            _DATABASES[db_path] = HistoryDatabase(db_path)
+        return _DATABASES[db_path]
@@ -0,0 +1,49 @@
+import json
+import logging
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+
+class HistoryStore:
+    """Append-only history of the articles retention drops from feed caches.
+
+    Each feed gets a `<feed_id>.jsonl` file in `history_dir` holding one
+    cache-format article per line, oldest spill first. Appending never
+    rewrites earlier lines, so the cost of a spill only depends on its size.
+    """
+
+    def __init__(self, history_dir: Path) -> None:
+        self.history_dir = Path(history_dir)
+
+    def path(self, feed_id: str) -> Path:
+        return self.history_dir.joinpath(f"{feed_id}.jsonl")
+
+    def append(self, feed_id: str, articles: list[dict]) -> None:
+        if not articles:
+            return
+        self.history_dir.mkdir(parents=True, exist_ok=True)
+        lines = "".join(
+            json.dumps(article, separators=(",", ":")) + "\n" for article in articles
+        )
+        with open(self.path(feed_id), "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def read(self, feed_id: str) -> Iterator[dict]:
+        """Yield the feed's archived articles in the order they were spilled."""
+        return read_jsonl(self.path(feed_id))
+
+
+def read_jsonl(path: Path) -> Iterator[dict]:
+    """Yield the articles of a history file, skipping lines that do not parse."""
+    if not path.exists():
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted append
+                logger.warning(f"HistoryStore: skipping bad line {number} in {path}")
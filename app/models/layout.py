@@ -1,17 +1,25 @@
 import logging
 import os
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
 import yaml
 
 from app.services.bookmark_bar_manager import BookmarkBarManager
 from app.services.bookmarks_migrator import BookmarksMigrator
+from app.services.feed_fetcher import shutdown_feed_fetcher
 
 from .apscheduler import Scheduler
 from .bookmark import Bookmark
 from .column import Column
 from .feed import Feed
+from .feed_registry import FeedRegistry
 from .row import Row
 from .tab import Tab
 from .utils import from_list, pwd
@@ -20,7 +28,52 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
 
+@dataclass(frozen=True)
+class LayoutSnapshot:
+    """One complete build of layout.yml.
+
+    Requests read whichever snapshot is current; a reload builds the next one
+    aside and swaps it in with a single assignment, so nobody sees a layout
+    that is half built.
+    """
+
+    tabs: list[Tab] = field(default_factory=list)
+    headers: list[Bookmark] = field(default_factory=list)
+    feed_registry: FeedRegistry = field(default_factory=FeedRegistry)
+    # mtime of layout.yml when the build started
+    last_reload: float = 0
+    # view id / feed id -> Feed
+    feed_hash: dict[str, Feed] = field(default_factory=dict)
+    version: int = 0
+
+
+class _FromSnapshot:
+    """Layout attribute read from the current snapshot.
+
+    Assigning it swaps in a copy of the snapshot with the new value.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, layout, owner=None):
+        if layout is None:
+            return self
+        return getattr(layout.snapshot, self.name)
+
+    def __set__(self, layout, value) -> None:
+        layout._snapshot = replace(layout.snapshot, **{self.name: value})
+
+
 class Layout:
+    tabs = _FromSnapshot()
+    headers = _FromSnapshot()
+    feed_registry = _FromSnapshot()
+    last_reload = _FromSnapshot()
+    feed_hash = _FromSnapshot()
+
+    MAINTENANCE_JOB_ID = "cache-maintenance"
+
     def __init__(
         self,
         config_file: str = "configs/layout.yml",
@@ -29,8 +82,10 @@ class Layout:
     ):
         # Instance attributes (not shared across instances)
         self.id: str = "layout"
-        self.tabs: list[Tab] = []
-        self.headers: list[Bookmark] = []
+        self._snapshot = LayoutSnapshot()
+        # Guards the background reload so only one runs at a time
+        self._reload_lock = threading.Lock()
+        self._reloading = False
 
         # Allow skipping file operations for testing
         if not skip_file_init:
@@ -56,6 +111,15 @@ class Layout:
         if not skip_file_init:
             self.reload()
 
+    @property
+    def snapshot(self) -> LayoutSnapshot:
+        # Layouts created without __init__ (tests) start out empty
+        return self.__dict__.get("_snapshot") or LayoutSnapshot()
+
+    @property
+    def version(self) -> int:
+        return self.snapshot.version
+
     @property
     def bookmark_bar(self):
         return self.bar_manager.bar
@@ -66,6 +130,7 @@ class Layout:
 
     def stop_scheduler(self):
         Scheduler.shutdown()
+        shutdown_feed_fetcher()
 
     def favicon_path(self, url):
         return self.favicon_store.icon_path(url)
@@ -88,19 +153,195 @@ class Layout:
         return urls
 
     def reload(self):
+        """Rebuild the layout from layout.yml and swap it in, blocking until done."""
+        self.swap(self.build_snapshot())
+
+    def reload_async(self) -> Optional[threading.Thread]:
+        """Rebuild the layout in a background thread.
+
+        Requests keep being served from the current snapshot until the new
+        one is swapped in. Returns the thread, or None if a reload is already
+        running.
+        """
+        with self._reload_lock:
+            if self._reloading:
+                return None
+            self._reloading = True
+
+        thread = threading.Thread(
+            target=self._reload_in_background, name="layout-reload", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _reload_in_background(self) -> None:
+        try:
+            self.reload()
+        except Exception:
+            logger.exception("Layout reload failed; keeping the current layout")
+        finally:
+            self._reloading = False
+
+    def build_snapshot(self) -> LayoutSnapshot:
+        """Build the next snapshot from layout.yml without touching the current one.
+
+        Feed jobs are not scheduled until the snapshot is swapped in.
+        """
         logger.debug("Beginning Layout reload...")
-        Scheduler.clear_jobs()
+        started = time.perf_counter()
+        # Taken before reading so an edit made during the build reloads again
+        mtime = self.mtime
         content = self._load_layout_from_file()
-        self.tabs = [
-            Tab.from_dict(t, bookmark_manager=self.bar_manager)
+        # Fresh registry per reload so feeds removed from the layout are dropped
+        feed_registry = FeedRegistry(defer_jobs=True)
+        tabs = [
+            Tab.from_dict(
+                t, bookmark_manager=self.bar_manager, feed_registry=feed_registry
+            )
             for t in content.get("tabs", [])
         ]
-        self.headers = from_list(Bookmark.from_dict, content.get("headers", []), self)
+        headers = from_list(Bookmark.from_dict, content.get("headers", []), self)
+
+        snapshot = LayoutSnapshot(
+            tabs=tabs,
+            headers=headers,
+            feed_registry=feed_registry,
+            last_reload=mtime,
+            version=self.snapshot.version + 1,
+        )
+        self._index_feeds(snapshot)
+        logger.debug(
+            f"Completed Layout reload! {len(feed_registry)} unique feed urls "
+            f"in {time.perf_counter() - started:.3f}s"
+        )
+
+        # ONBOARD_LAYOUT_LOAD=eager loads every cache before serving; by
+        # default feeds load on first use
+        if os.getenv("ONBOARD_LAYOUT_LOAD", "lazy").lower() == "eager":
+            self.load_feeds(feed_registry.owners)
+        return snapshot
+
+    def swap(self, snapshot: LayoutSnapshot) -> None:
+        """Serve `snapshot` from now on and move the feed jobs over to it."""
+        self._snapshot = snapshot
+        self._schedule_feeds(snapshot)
+        self.schedule_cache_maintenance(snapshot)
+        logger.info(f"Layout: serving version {snapshot.version}")
+        if os.getenv("ONBOARD_LAYOUT_LOAD", "lazy").lower() != "eager":
+            self.prewarm()
+
+    def _schedule_feeds(self, snapshot: LayoutSnapshot) -> None:
+        """Replace the poll jobs with the snapshot's and drop jobs of removed feeds.
+
+        Jobs of feeds still in the layout keep their ids, so they are replaced
+        in place rather than cleared, and other jobs are left alone.
+        """
+        scheduler = Scheduler.getScheduler()
+        if not scheduler or not getattr(scheduler, "running", False):
+            return
+
+        owners = snapshot.feed_registry.owners
+        for feed in owners:
+            feed.schedule(snapshot.feed_registry.warmup)
+
+        current = {feed.job_id for feed in owners}
+        for job in scheduler.get_jobs():
+            if job.id.startswith(Feed.JOB_PREFIX) and job.id not in current:
+                try:
+                    scheduler.remove_job(job.id)
+                except Exception:
+                    # Already gone, e.g. removed by a concurrent reload
+                    pass
+
+    def schedule_cache_maintenance(self, snapshot: LayoutSnapshot) -> None:
+        """Add the job archiving oversized caches and compacting the history.
+
+        See `FeedCache.run_maintenance`. It runs once right away and then every ONBOARD_CACHE_ARCHIVE_INTERVAL
+        hours (default 24) on the scheduler's pool, never on a request. The
+        job is added by the first swap with feeds and kept across reloads.
+        """
+        scheduler = Scheduler.getScheduler()
+        owners = snapshot.feed_registry.owners
+        if not owners or not scheduler or not getattr(scheduler, "running", False):
+            return
+        if scheduler.get_job(self.MAINTENANCE_JOB_ID):
+            return
+
+        # The cache directory and history are shared by every feed
+        scheduler.add_job(
+            owners[0].feed_cache.run_maintenance,
+            "interval",
+            hours=float(os.getenv("ONBOARD_CACHE_ARCHIVE_INTERVAL", "24")),
+            next_run_time=datetime.now(timezone.utc),
+            id=self.MAINTENANCE_JOB_ID,
+            name="layout - cache maintenance",
+            max_instances=1,
+        )
 
-        self.last_reload = self.mtime
-        self.feed_hash = {}
+    def prewarm(self) -> None:
+        """Queue a background job loading the cached articles of the default tab.
 
-        logger.debug("Completed Layout reload!")
+        Feeds otherwise load their cache on first request. Disabled with
+        ONBOARD_PREWARM=false, and skipped when the scheduler is not running.
+        """
+        if os.getenv("ONBOARD_PREWARM", "true").lower() not in ("true", "1", "yes"):
+            return
+        scheduler = Scheduler.getScheduler()
+        if not self.tabs or not scheduler or not getattr(scheduler, "running", False):
+            return
+
+        feeds = self.tab_feeds(self.tabs[0])
+        scheduler.add_job(
+            self.hydrate_feeds,
+            args=(feeds,),
+            id="layout-prewarm",
+            name="layout - prewarm",
+            replace_existing=True,
+        )
+
+    def hydrate_feeds(self, feeds: list[Feed], workers: int = 1) -> None:
+        """Load the cached articles of `feeds` using `workers` threads."""
+
+        def hydrate(feed: Feed) -> None:
+            try:
+                feed.hydrate()
+            except Exception:
+                logger.exception(f"Failed to load cached articles of {feed.name}")
+
+        started = time.perf_counter()
+        if workers > 1 and len(feeds) > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="layout-load"
+            ) as pool:
+                list(pool.map(hydrate, feeds))
+        else:
+            for feed in feeds:
+                hydrate(feed)
+        logger.info(
+            f"Layout: loaded {len(feeds)} feeds in "
+            f"{time.perf_counter() - started:.3f}s ({workers} threads)"
+        )
+
+    def load_feeds(
+        self, owners: Optional[list[Feed]] = None, workers: Optional[int] = None
+    ) -> None:
+        """Load the cached articles of every feed (or `owners`) before returning.
+
+        Caches are read and converted by ONBOARD_LOAD_WORKERS threads (default
+        8).
+        """
+        if workers is None:
+            workers = int(os.getenv("ONBOARD_LOAD_WORKERS", "8"))
+        if owners is None:
+            owners = self.feed_registry.owners
+
+        started = time.perf_counter()
+        self.hydrate_feeds(owners, workers=workers)
+        articles = sum(len(feed.articles) for feed in owners)
+        logger.info(
+            f"Layout: {articles} cached articles ready in "
+            f"{time.perf_counter() - started:.3f}s"
+        )
 
     def _load_layout_from_file(self) -> dict:
         """Helper to load YAML layout content from the configured path.
@@ -162,25 +403,31 @@ class Layout:
 
         return feeds
 
-    def get_feed(self, feed_id: str) -> Feed:
-        if not self.feed_hash:
-            feeds = []
-            for tab in self.tabs:
-                for row in tab.rows:
-                    for column in row.columns:
-                        feeds += self.get_feeds(column)
+    def tab_feeds(self, tab: Tab) -> list[Feed]:
+        feeds = []
+        for row in tab.rows:
+            for column in row.columns:
+                feeds += self.get_feeds(column)
+        return feeds
 
-            for feed in feeds:
-                self.feed_hash[feed.id] = feed
+    def _index_feeds(self, snapshot: LayoutSnapshot) -> None:
+        # Each widget is addressed by its view id; the feed id resolves to
+        # the first widget showing that url.
+        for tab in snapshot.tabs:
+            for feed in self.tab_feeds(tab):
+                snapshot.feed_hash.setdefault(feed.view_id, feed)
+                snapshot.feed_hash.setdefault(feed.id, feed)
 
-        return self.feed_hash[feed_id]
+    def get_feed(self, feed_id: str) -> Feed:
+        snapshot = self.snapshot
+        if not snapshot.feed_hash:
+            self._index_feeds(snapshot)
+        return snapshot.feed_hash[feed_id]
 
     def refresh_feeds(self, feed_id: str):
         feed = self.get_feed(feed_id)
         feed.refresh()
 
-    from typing import Optional
-
     def find_link(self, row: Row, widget_id: str, link_id: str) -> Optional[str]:
         for column in row.columns:
             if column.rows:
@@ -1,3 +1,5 @@
 class NoOpFeedProcessor:
+    version = "1"
+
     def process(self, feed):
         return feed
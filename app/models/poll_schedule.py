@@ -0,0 +1,133 @@
+import hashlib
+import os
+import statistics
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+# Fixed reference point for interval phases, so a feed's offset is the same
+# across restarts.
+PHASE_EPOCH = datetime(2024, 1, 1)
+
+
+def spread_enabled() -> bool:
+    return os.getenv("ONBOARD_FEED_SPREAD", "true").lower() in ("true", "1", "yes")
+
+
+class PollSchedule:
+    """Learns how often a feed publishes and picks the delay until its next poll.
+
+    The base interval is half the median gap between the most recent
+    `pub_date`s, so a feed is usually polled about twice per new article. Every
+    consecutive fetch that brings nothing new doubles the interval (up to
+    `MAX_BACKOFF_STEPS` times), and the result is clamped to the configured
+    bounds. A widget's `update_interval` (minutes) in layout.yml overrides the
+    learned value.
+
+    Each schedule also has a stable phase derived from its `key` (the feed id),
+    so feeds sharing an interval are spread evenly across it instead of all
+    polling at the same moment.
+    """
+
+    DEFAULT_INTERVAL = timedelta(hours=1)
+    SAMPLE_SIZE = 20
+    MAX_BACKOFF_STEPS = 4
+
+    def __init__(
+        self,
+        update_interval: Optional[float] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        key: Optional[str] = None,
+    ) -> None:
+        self.key = key
+        self.override = (
+            timedelta(minutes=float(update_interval)) if update_interval else None
+        )
+        self.min_interval = timedelta(
+            minutes=min_interval or float(os.getenv("ONBOARD_FEED_MIN_INTERVAL", "15"))
+        )
+        self.max_interval = timedelta(
+            minutes=max_interval or float(os.getenv("ONBOARD_FEED_MAX_INTERVAL", "720"))
+        )
+        self.unchanged = 0
+
+    @property
+    def phase(self) -> float:
+        """Stable fraction in [0, 1) of the interval at which this feed polls."""
+        if not self.key:
+            return 0.0
+        digest = hashlib.sha1(self.key.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64
+
+    def start_date(self, interval: timedelta) -> Optional[datetime]:
+        """Anchor for an interval trigger that places polls at this feed's phase.
+
+        Returns None when spreading is disabled with ONBOARD_FEED_SPREAD=false,
+        in which case the trigger starts counting from now.
+        """
+        if not spread_enabled():
+            return None
+        return PHASE_EPOCH + interval * self.phase
+
+    def request_interval(self, update_interval: Optional[float]) -> bool:
+        """Tighten the override to `update_interval` minutes if it is shorter.
+
+        Used when several widgets share one feed. Returns True if it changed.
+        """
+        if not update_interval:
+            return False
+        interval = timedelta(minutes=float(update_interval))
+        if self.override is not None and self.override <= interval:
+            return False
+        self.override = interval
+        return True
+
+    def record_fetch(self, changed: bool) -> None:
+        """Track the streak of fetches that returned no new articles."""
+        self.unchanged = 0 if changed else self.unchanged + 1
+
+    def cadence(self, pub_dates: Iterable[datetime]) -> Optional[timedelta]:
+        """Median gap between the most recent publish times, if there are enough."""
+        stamps = sorted({d.timestamp() for d in pub_dates}, reverse=True)
+        stamps = stamps[: self.SAMPLE_SIZE]
+        if len(stamps) < 2:
+            return None
+        gaps = [newer - older for newer, older in zip(stamps, stamps[1:])]
+        return timedelta(seconds=statistics.median(gaps))
+
+    def next_interval(self, pub_dates: Iterable[datetime]) -> timedelta:
+        if self.override:
+            return self.override
+
+        cadence = self.cadence(pub_dates)
+        interval = cadence / 2 if cadence else self.DEFAULT_INTERVAL
+        interval *= 2 ** min(self.unchanged, self.MAX_BACKOFF_STEPS)
+        return max(self.min_interval, min(interval, self.max_interval))
+
+
+class WarmupThrottle:
+    """Hands out staggered run times for the refreshes queued while loading.
+
+    After a restart most feeds are stale, and refreshing them all at once
+    causes a burst of downloads, parses and cache writes. Each call returns a
+    time at least ONBOARD_FEED_WARMUP_SPACING seconds after the previous one.
+    """
+
+    def __init__(self, spacing: Optional[float] = None) -> None:
+        self.spacing = timedelta(
+            seconds=(
+                spacing
+                if spacing is not None
+                else float(os.getenv("ONBOARD_FEED_WARMUP_SPACING", "1"))
+            )
+        )
+        self._next: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def next_run_time(self) -> datetime:
+        with self._lock:
+            now = datetime.now()
+            run_time = max(now, self._next) if self._next else now
+            self._next = run_time + self.spacing
+            return run_time
@@ -0,0 +1,72 @@
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+
+
+class RetentionPolicy:
+    """Decides which of a feed's articles stay in memory and in the live cache.
+
+    Articles beyond the newest `max_count`, or published more than
+    `max_age_days` ago, are handed back to be spilled to the feed's history.
+    Widgets set `max_articles` / `max_age_days` in layout.yml; the defaults
+    come from ONBOARD_FEED_MAX_ARTICLES (250) and ONBOARD_FEED_MAX_AGE_DAYS
+    (0). A limit of 0 disables it.
+    """
+
+    def __init__(
+        self, max_count: Optional[int] = None, max_age_days: Optional[float] = None
+    ) -> None:
+        self.max_count = int(
+            max_count
+            if max_count is not None
+            else os.getenv("ONBOARD_FEED_MAX_ARTICLES", "250")
+        )
+        self.max_age = timedelta(
+            days=float(
+                max_age_days
+                if max_age_days is not None
+                else os.getenv("ONBOARD_FEED_MAX_AGE_DAYS", "0")
+            )
+        )
+
+    @classmethod
+    def from_widget(cls, widget: dict) -> "RetentionPolicy":
+        return cls(widget.get("max_articles"), widget.get("max_age_days"))
+
+    def split(
+        self,
+        articles: list[Any],
+        keep_ids: Iterable[str] = (),
+        min_count: int = 0,
+        now: Optional[datetime] = None,
+    ) -> tuple[list[Any], list[Any]]:
+        """Split `articles` (newest first) into (kept, spilled).
+
+        Articles whose id is in `keep_ids` (e.g. still listed by the feed) are
+        always kept so they are not downloaded and processed again, and at
+        least `min_count` articles are kept whatever their age.
+        """
+        keep_ids = set(keep_ids)
+        max_count = max(self.max_count, min_count) if self.max_count else 0
+        cutoff = None
+        if self.max_age:
+            cutoff = (now or datetime.now(timezone.utc)) - self.max_age
+
+        kept, spilled = [], []
+        for index, article in enumerate(articles):
+            too_many = max_count and index >= max_count
+            too_old = (
+                cutoff is not None
+                and index >= min_count
+                and _aware(article.pub_date) < cutoff
+            )
+            if (too_many or too_old) and article.id not in keep_ids:
+                spilled.append(article)
+            else:
+                kept.append(article)
+        return kept, spilled
+
+
+def _aware(value: datetime) -> datetime:
+    # Cached dates are timezone aware; treat naive ones as UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
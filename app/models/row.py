@@ -7,17 +7,21 @@ class Row:
         self.columns: list["column.Column"] = []
 
     @staticmethod
-    def from_dict(dictionary: dict, bookmark_manager=None) -> "Row":
+    def from_dict(dictionary: dict, bookmark_manager=None, feed_registry=None) -> "Row":
         row = Row()
         if "columns" in dictionary:
             row.columns = [
-                column.Column.from_dict(c, bookmark_manager=bookmark_manager)
+                column.Column.from_dict(
+                    c, bookmark_manager=bookmark_manager, feed_registry=feed_registry
+                )
                 for c in dictionary["columns"]
             ]
         else:
             col = column.Column()
             col.widgets = [
-                widget.Widget.from_dict(w, bookmark_manager=bookmark_manager)
+                widget.Widget.from_dict(
+                    w, bookmark_manager=bookmark_manager, feed_registry=feed_registry
+                )
                 for w in dictionary["widgets"]
             ]
             row.columns = [col]
@@ -0,0 +1,146 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .local_file_store import LocalFileStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feeds (
+    feed_id TEXT PRIMARY KEY,
+    meta TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS articles (
+    feed_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    pub_date INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (feed_id, id)
+);
+CREATE INDEX IF NOT EXISTS articles_by_date ON articles (feed_id, pub_date DESC);
+"""
+
+
+class SqliteCacheStore(LocalFileStore):
+    """CacheStore keeping every feed's cache in one SQLite database (WAL mode).
+
+    Feed caches are still addressed by their `<cache_dir>/<feed_id>.json` path,
+    so FeedCache works unchanged: the path's stem is the feed id. Saving a feed
+    upserts its articles and only rewrites the rows whose content changed,
+    instead of rewriting the whole file.
+
+    A feed without rows is imported from its JSON file on first read, so
+    switching stores keeps existing caches. Directory listing and moves (used
+    to archive those legacy files) still go to the filesystem.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def read_json(self, path: Path) -> dict:
+        feed_id = Path(path).stem
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT meta FROM feeds WHERE feed_id = ?", (feed_id,)
+            ).fetchone()
+            if row is not None:
+                rows = self._conn.execute(
+                    "SELECT data FROM articles WHERE feed_id = ?"
+                    " ORDER BY pub_date DESC, rowid",
+                    (feed_id,),
+                ).fetchall()
+                payload = json.loads(row[0])
+                payload["articles"] = [json.loads(data) for (data,) in rows]
+                return payload
+
+        # Not in the database yet: import the JSON file written by LocalFileStore
+        payload = super().read_json(path)
+        if isinstance(payload, dict):
+            self.write_json_atomic(path, payload)
+        return payload
+
+    def write_json_atomic(self, path: Path, data: dict) -> None:
+        feed_id = Path(path).stem
+        meta = {key: value for key, value in data.items() if key != "articles"}
+        rows = [
+            (
+                feed_id,
+                str(article.get("id")),
+                (
+                    article.get("pub_date")
+                    if isinstance(article.get("pub_date"), int)
+                    else None
+                ),
+                json.dumps(article, separators=(",", ":")),
+            )
+            for article in data.get("articles", [])
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO feeds (feed_id, meta, updated) VALUES (?, ?, ?)"
+                    " ON CONFLICT (feed_id) DO UPDATE"
+                    " SET meta = excluded.meta, updated = excluded.updated",
+                    (feed_id, json.dumps(meta), time.time()),
+                )
+                # Unchanged rows are matched by the WHERE clause and not rewritten
+                self._conn.executemany(
+                    "INSERT INTO articles (feed_id, id, pub_date, data)"
+                    " VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT (feed_id, id) DO UPDATE"
+                    " SET pub_date = excluded.pub_date, data = excluded.data"
+                    " WHERE data != excluded.data",
+                    rows,
+                )
+                self._conn.execute(
+                    "DELETE FROM articles WHERE feed_id = ?"
+                    " AND id NOT IN (SELECT value FROM json_each(?))",
+                    (feed_id, json.dumps([row[1] for row in rows])),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def exists(self, path: Path) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM feeds WHERE feed_id = ?", (Path(path).stem,)
+            ).fetchone()
+        return row is not None or Path(path).exists()
+
+    def mtime(self, path: Path) -> float:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT updated FROM feeds WHERE feed_id = ?", (Path(path).stem,)
+            ).fetchone()
+        return row[0] if row is not None else super().mtime(path)
+
+
+_STORES: dict[Path, SqliteCacheStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_sqlite_cache_store(db_path: Path) -> SqliteCacheStore:
+    """Return the process-wide store for `db_path`, opening it on first use."""
+    db_path = Path(db_path).resolve()
+    with _STORES_LOCK:
+        if db_path not in _STORES:
+            _STORES[db_path] = SqliteCacheStore(db_path)
+        return _STORES[db_path]
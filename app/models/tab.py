@@ -8,7 +8,7 @@ class Tab:
         self.rows: list["Row"] = []
 
     @staticmethod
-    def from_dict(dictionary: dict, bookmark_manager=None) -> "Tab":
+    def from_dict(dictionary: dict, bookmark_manager=None, feed_registry=None) -> "Tab":
         from .column import Column
         from .row import Row
 
@@ -16,13 +16,17 @@ class Tab:
         tab.name = dictionary["tab"]
         if "rows" in dictionary:
             tab.rows = [
-                Row.from_dict(r, bookmark_manager=bookmark_manager)
+                Row.from_dict(
+                    r, bookmark_manager=bookmark_manager, feed_registry=feed_registry
+                )
                 for r in dictionary["rows"]
             ]
         else:
             row = Row()
             row.columns = [
-                Column.from_dict(c, bookmark_manager=bookmark_manager)
+                Column.from_dict(
+                    c, bookmark_manager=bookmark_manager, feed_registry=feed_registry
+                )
                 for c in dictionary["columns"]
             ]
             tab.rows = [row]
@@ -10,10 +10,12 @@ from .utils import calculate_sha1_hash
 class WidgetItem:
     from .widget import Widget
 
+    # No per-instance __dict__: feeds keep tens of thousands of items around
+    __slots__ = ("id", "name", "parent", "_link")
+
     id: str
     name: str
     parent: Widget
-    tracking_link: Optional[str] = None
 
     def __init__(self, name: str, link: str, parent: Widget) -> None:
         # the order here matters
@@ -29,8 +31,16 @@ class WidgetItem:
     @link.setter
     def link(self, url: str):
         self._link = self.clean_url(url)
-        self.id = calculate_sha1_hash(self._link)
-        self.tracking_link = f"/redirect/{self.parent.id}/{self.id}"
+        self.id = self.link_id(url)
+
+    @property
+    def tracking_link(self) -> Optional[str]:
+        return f"/redirect/{self.parent.id}/{self.id}"
+
+    @staticmethod
+    def link_id(url: str) -> str:
+        """Id an item with this link would get, without constructing it."""
+        return calculate_sha1_hash(WidgetItem.clean_url(url))
 
     @staticmethod
     def from_dict(*args) -> "WidgetItem":
@@ -22,6 +22,11 @@ class StripLongUrls:
         # regex to find http(s) URLs
         self._url_re = re.compile(r"https?://\S+", re.IGNORECASE)
 
+    @property
+    def version(self) -> str:
+        # The threshold changes the output, so it is part of the fingerprint
+        return f"1-{self.threshold}"
+
     def _strip_long_urls(self, text: str) -> str:
         if not text:
             return text
@@ -1,4 +1,6 @@
 class TestProcessor:
+    version = "1"
+
     def process(self, articles):
         for a in articles:
             a.processed = "test_processor"
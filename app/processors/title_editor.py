@@ -33,6 +33,9 @@ logger.setLevel(logging.DEBUG)
 
 
 class TitleEditor:
+    # No `version`: progress is tracked per article through `processed`, so a
+    # title that failed (or was skipped while Ollama was unreachable) is retried.
+
     def hostname_resolves(self, hostname):
         try:
             socket.gethostbyname(hostname)
@@ -44,30 +47,34 @@ class TitleEditor:
         self.ollama_url = os.getenv("OLLAMA_URL")
 
         if self.ollama_url and self.hostname_resolves(self.ollama_url):
-            parser = StructuredOutputParser.from_response_schemas(
-                [ResponseSchema(name="title", description="title of the article")]
-            )
+            self.build_chains()
+
+    def build_chains(self):
+        """Create the LLM chains; the instance is reused, so this runs once."""
+        parser = StructuredOutputParser.from_response_schemas(
+            [ResponseSchema(name="title", description="title of the article")]
+        )
 
-            format_instructions = f"""
+        format_instructions = f"""
               {parser.get_format_instructions()}
               The contents of the markdown code snippet MUST be in VALID json format which includes proper quotes and escape characters!
               JSON property names are case sensitive, and MUST ONLY include the defined schema properties!
       """
 
-            prompt = PromptTemplate(
-                template="""
+        prompt = PromptTemplate(
+            template="""
     title: {title},
     summary: {summary},
     {format_instructions}
     """,
-                input_variables=["title", "summary"],
-                partial_variables={"format_instructions": format_instructions},
-            )
-
-            # format chat prompt
-            system_prompt = SystemMessage(
-                content=(
-                    """
+            input_variables=["title", "summary"],
+            partial_variables={"format_instructions": format_instructions},
+        )
+
+        # format chat prompt
+        system_prompt = SystemMessage(
+            content=(
+                """
     You are an expert news article title editor.
     Use the provided title and summary to write a concise and accurate title that is informative and avoids sounding like clickbait.
     Do not include links or urls in the title.
@@ -77,38 +84,42 @@ class TitleEditor:
     title MUST NOT use words that are all capitalized. NO SHOUTING!
     Only return the title in the requested format!
     """
-                )
-            )
-            user_prompt = HumanMessagePromptTemplate(prompt=prompt)
-
-            chat_prompt = ChatPromptTemplate.from_messages([system_prompt, user_prompt])
-
-            model_name = "dolphin-llama3"
-            model_temp = 0.0
-            llama3_model = Ollama(
-                base_url=self.ollama_url,
-                model=model_name,
-                keep_alive=5,
-                temperature=model_temp,
-            )
-            self.llama3_chain = chat_prompt | llama3_model | parser
-
-            model_name = "dolphin-mistral"
-            model_temp = 0.0
-            mistral_model = Ollama(
-                base_url=self.ollama_url,
-                model=model_name,
-                keep_alive=5,
-                temperature=model_temp,
-            )
-            self.mistral_chain = chat_prompt | mistral_model | parser
-
-            self.script_hash = calculate_sha1_hash(
-                f"{system_prompt.content}{model_name}{model_temp}"
             )
+        )
+        user_prompt = HumanMessagePromptTemplate(prompt=prompt)
+
+        chat_prompt = ChatPromptTemplate.from_messages([system_prompt, user_prompt])
+
+        model_name = "dolphin-llama3"
+        model_temp = 0.0
+        llama3_model = Ollama(
+            base_url=self.ollama_url,
+            model=model_name,
+            keep_alive=5,
+            temperature=model_temp,
+        )
+        self.llama3_chain = chat_prompt | llama3_model | parser
+
+        model_name = "dolphin-mistral"
+        model_temp = 0.0
+        mistral_model = Ollama(
+            base_url=self.ollama_url,
+            model=model_name,
+            keep_alive=5,
+            temperature=model_temp,
+        )
+        self.mistral_chain = chat_prompt | mistral_model | parser
+
+        self.script_hash = calculate_sha1_hash(
+            f"{system_prompt.content}{model_name}{model_temp}"
+        )
 
     def process(self, articles: list[FeedArticle]) -> list[FeedArticle]:
         if self.ollama_url and self.hostname_resolves(self.ollama_url):
+            # Ollama may have been unreachable when this instance was created
+            if not hasattr(self, "llama3_chain"):
+                self.build_chains()
+
             needs_processed = list(
                 filter(lambda article: article.processed != self.script_hash, articles)
             )
@@ -0,0 +1,348 @@
+"""Asyncio feed fetch engine.
+
+Feeds are downloaded on a dedicated event loop thread so hundreds of requests
+can be in flight at once without tying up the scheduler's worker threads. A
+global connection cap and a per-host cap bound the concurrency, and the raw
+response bytes are handed back to the caller (usually `Feed.ingest_result`)
+on a small worker pool so parsing never blocks the event loop.
+
+Every request is bounded: connect and read timeouts stop hung upstreams, and
+the body is streamed with a byte cap so an enormous response is aborted early
+instead of being buffered in full.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+USER_AGENT = "OnBoard/1.0 (+https://github.com/traefikturkey/onboard)"
+CHUNK_SIZE = 64 * 1024
+
+
+class ResponseTooLargeError(Exception):
+    pass
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a single feed download."""
+
+    url: str
+    status: Optional[int] = None
+    content: bytes = b""
+    content_type: Optional[str] = None
+    etag: Optional[str] = None
+    modified: Optional[str] = None
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None and self.status < 400
+
+
+class FeedFetcher:
+    """Concurrent HTTP downloader backed by a background asyncio loop."""
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_per_host: Optional[int] = None,
+        ingest_workers: Optional[int] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        total_timeout: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.max_connections = max_connections or int(
+            os.getenv("ONBOARD_FETCH_MAX_CONNECTIONS", "32")
+        )
+        self.max_per_host = max_per_host or int(
+            os.getenv("ONBOARD_FETCH_MAX_PER_HOST", "4")
+        )
+        self._ingest_workers = ingest_workers or int(
+            os.getenv("ONBOARD_FETCH_INGEST_WORKERS", "4")
+        )
+        self.connect_timeout = connect_timeout or float(
+            os.getenv("ONBOARD_FETCH_CONNECT_TIMEOUT", "10")
+        )
+        self.read_timeout = read_timeout or float(
+            os.getenv("ONBOARD_FETCH_READ_TIMEOUT", "30")
+        )
+        self.total_timeout = total_timeout or float(
+            os.getenv("ONBOARD_FETCH_TOTAL_TIMEOUT", "60")
+        )
+        self.max_bytes = max_bytes or int(
+            os.getenv("ONBOARD_FETCH_MAX_BYTES", str(10 * 1024 * 1024))
+        )
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Concurrency slots, created on the loop thread. Holding a slot is what
+        # starts the request clock, so time spent queued behind the per-host cap
+        # never counts against a feed's timeout.
+        self._global_slots: Optional[asyncio.Semaphore] = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._workers: Optional[ThreadPoolExecutor] = None
+        # Downloads currently queued or running, keyed by url, so a feed that is
+        # triggered again before its previous fetch finished is not fetched twice.
+        self._inflight: dict[str, Future] = {}
+        # Callbacks waiting on each in-flight download, one per consumer
+        self._callbacks: dict[str, list[Callable[[FetchResult], None]]] = {}
+
+    def fetch(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        modified: Optional[str] = None,
+        callback: Optional[Callable[[FetchResult], None]] = None,
+    ) -> FetchResult:
+        """Download `url` and block until the result is available.
+
+        The wait itself is bounded as well, so a synchronous caller can never
+        hang longer than the connect plus total timeout even if the loop is
+        saturated. A download outliving the wait is not cancelled.
+        A caller that ingests the result should pass its `callback` rather
+        than ingesting the return value: when it joins a download already in
+        flight for the same consumer, the result is then ingested only once.
+        """
+        future = self.submit(url, etag=etag, modified=modified, callback=callback)
+        bound = self.total_timeout + self.connect_timeout
+        try:
+            return future.result(timeout=bound)
+        except FutureTimeoutError:
+            # Only this wait is abandoned: the download may be shared with
+            # other consumers, and every callback still runs once it is done
+            return FetchResult(
+                url=url,
+                elapsed=bound,
+                error=f"TimeoutError: no result within {bound:.1f}s",
+            )
+
+    def submit(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        modified: Optional[str] = None,
+        callback: Optional[Callable[[FetchResult], None]] = None,
+    ) -> Future:
+        """Queue a download without blocking.
+
+        `callback` is invoked with the FetchResult on the ingest worker pool once
+        the download completes. The returned Future resolves to the FetchResult
+        after the callbacks have run.
+
+        A url already in flight is not downloaded again: `callback` is added
+        to that download's callbacks (unless an equal one is already there, so
+        a feed that is triggered twice ingests once) and its Future returned.
+        """
+        with self._lock:
+            existing = self._inflight.get(url)
+            if existing is not None and not existing.done():
+                logger.debug(f"FeedFetcher: {url} already in flight, reusing fetch")
+                callbacks = self._callbacks[url]
+                if callback is not None and callback not in callbacks:
+                    callbacks.append(callback)
+                return existing
+
+            loop = self._ensure_loop()
+            self._callbacks[url] = [callback] if callback is not None else []
+            future = asyncio.run_coroutine_threadsafe(
+                self._fetch_and_ingest(url, etag, modified), loop
+            )
+            self._inflight[url] = future
+
+        future.add_done_callback(lambda f: self._forget(url, f))
+        return future
+
+    def shutdown(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_session(), loop).result(
+                    timeout=5
+                )
+            except Exception:
+                logger.exception("FeedFetcher: failed to close HTTP session")
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        if self._workers is not None:
+            self._workers.shutdown(wait=False)
+            self._workers = None
+
+    def _forget(self, url: str, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(url) is future:
+                del self._inflight[url]
+                self._callbacks.pop(url, None)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        # Caller holds self._lock
+        if self._loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="feed-fetcher", daemon=True
+            )
+            thread.start()
+            self._loop, self._thread = loop, thread
+            self._workers = ThreadPoolExecutor(
+                max_workers=self._ingest_workers, thread_name_prefix="feed-ingest"
+            )
+        return self._loop
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Only called from the event loop thread, so no locking is needed
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections, limit_per_host=self.max_per_host
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.connect_timeout, sock_read=self.read_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={"User-Agent": USER_AGENT},
+            )
+        return self._session
+
+    def _slots_for(self, url: str) -> tuple[asyncio.Semaphore, asyncio.Semaphore]:
+        # Only called from the event loop thread, so no locking is needed
+        if self._global_slots is None:
+            self._global_slots = asyncio.Semaphore(self.max_connections)
+        host = urlsplit(url).netloc.lower()
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return self._global_slots, self._host_slots[host]
+
+    async def _close_session(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _fetch_and_ingest(
+        self, url: str, etag: Optional[str], modified: Optional[str]
+    ) -> FetchResult:
+        result = await self._fetch(url, etag, modified)
+        # Later submits start a new download instead of joining this finished
+        # one, so no callback can be added after the list is taken
+        with self._lock:
+            if self._inflight.get(url) is not None:
+                del self._inflight[url]
+            callbacks = self._callbacks.pop(url, [])
+        loop = asyncio.get_running_loop()
+        outcomes = await asyncio.gather(
+            *(loop.run_in_executor(self._workers, cb, result) for cb in callbacks),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error(
+                    f"FeedFetcher: ingest callback failed for {url}",
+                    exc_info=outcome,
+                )
+        return result
+
+    async def _fetch(
+        self, url: str, etag: Optional[str], modified: Optional[str]
+    ) -> FetchResult:
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if modified:
+            headers["If-Modified-Since"] = modified
+
+        result = FetchResult(url=url)
+        global_slot, host_slot = self._slots_for(url)
+        async with global_slot, host_slot:
+            started = time.perf_counter()
+            try:
+                async with asyncio.timeout(self.total_timeout):
+                    await self._request(url, headers, result)
+            except TimeoutError:
+                result.error = (
+                    f"TimeoutError: no complete response within "
+                    f"{time.perf_counter() - started:.1f}s"
+                )
+            except Exception as ex:
+                result.error = f"{type(ex).__name__}: {ex}"
+            result.elapsed = time.perf_counter() - started
+
+        if result.error:
+            logger.warning(
+                f"Fetch failed for {url} after {result.elapsed:.3f}s: {result.error}"
+            )
+        else:
+            logger.info(
+                f"Fetched {url}: status={result.status} "
+                f"bytes={len(result.content)} in {result.elapsed:.3f}s"
+            )
+        return result
+
+    async def _request(self, url: str, headers: dict, result: FetchResult) -> None:
+        async with self._get_session().get(url, headers=headers) as response:
+            result.status = response.status
+            result.content_type = response.headers.get("Content-Type")
+            result.etag = response.headers.get("ETag")
+            result.modified = response.headers.get("Last-Modified")
+            if response.status != 304:
+                result.content = await self._read_limited(response)
+
+    async def _read_limited(self, response: aiohttp.ClientResponse) -> bytes:
+        """Stream the body, aborting as soon as it exceeds `max_bytes`."""
+        if response.content_length and response.content_length > self.max_bytes:
+            raise ResponseTooLargeError(
+                f"Content-Length {response.content_length} exceeds "
+                f"{self.max_bytes} bytes"
+            )
+
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            body.extend(chunk)
+            if len(body) > self.max_bytes:
+                raise ResponseTooLargeError(f"response exceeded {self.max_bytes} bytes")
+        return bytes(body)
+
+
+_FEED_FETCHER: Optional[FeedFetcher] = None
+_FEED_FETCHER_LOCK = threading.Lock()
+
+
+def get_feed_fetcher() -> FeedFetcher:
+    """Return the process-wide FeedFetcher, creating it on first use."""
+    global _FEED_FETCHER
+    with _FEED_FETCHER_LOCK:
+        if _FEED_FETCHER is None:
+            _FEED_FETCHER = FeedFetcher()
+        return _FEED_FETCHER
+
+
+def shutdown_feed_fetcher() -> None:
+    """Stop the shared FeedFetcher if one was started."""
+    global _FEED_FETCHER
+    with _FEED_FETCHER_LOCK:
+        fetcher, _FEED_FETCHER = _FEED_FETCHER, None
+    if fetcher is not None:
+        fetcher.shutdown()
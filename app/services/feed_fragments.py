@@ -0,0 +1,150 @@
+"""Cache of rendered `/feed/<feed_id>` fragments.
+
+A feed widget's HTML only changes when the feed publishes a new article
+snapshot, so each widget's fragment is rendered once per snapshot and served
+from memory afterwards. The snapshot tag also makes the response ETag, which
+lets browsers revalidate with `If-None-Match` and get a 304 back.
+
+With ONBOARD_FEED_LOADING=batch the page loads all feeds of a tab with one
+`/feeds` request instead of one `/feed/<feed_id>` request per widget; that
+response carries every fragment as an htmx out-of-band swap.
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, NamedTuple, Optional
+
+from flask import Response, make_response, request
+
+from app.models.utils import calculate_sha1_hash
+
+logger = logging.getLogger(__name__)
+
+# Opening of the first element of a fragment, where the oob marker goes
+_FIRST_TAG = re.compile(r"^\s*<[a-zA-Z][\w-]*")
+
+
+class Fragment(NamedTuple):
+    html: str
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+
+
+class FeedFragmentCache:
+    """Last rendered fragment of each feed widget, keyed by its view id.
+
+    Entries are replaced when the widget's snapshot changes. At most
+    `max_entries` (ONBOARD_FRAGMENT_CACHE_SIZE, default 1024) widgets are
+    kept; the least recently served are dropped first.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None) -> None:
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else int(os.getenv("ONBOARD_FRAGMENT_CACHE_SIZE", "1024"))
+        )
+        self._fragments: OrderedDict[str, Fragment] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, widget: Any, render: Callable[[], str]) -> Fragment:
+        """Return the widget's fragment, calling `render` if its content changed.
+
+        Widgets without an article snapshot are rendered every time and get
+        no validators.
+        """
+        snapshot = getattr(widget, "snapshot", None)
+        if snapshot is None:
+            return Fragment(render())
+
+        key = widget.view_id
+        etag = f"{key}-{snapshot.tag}"
+        with self._lock:
+            cached = self._fragments.get(key)
+            if cached is not None and cached.etag == etag:
+                self._fragments.move_to_end(key)
+                return cached
+
+        # Rendered outside the lock; requests racing on a new snapshot both
+        # render the same HTML
+        fragment = Fragment(
+            render(),
+            etag,
+            datetime.fromtimestamp(snapshot.published, tz=timezone.utc),
+        )
+        with self._lock:
+            self._fragments[key] = fragment
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.max_entries:
+                self._fragments.popitem(last=False)
+        return fragment
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+
+def batch_loading_enabled() -> bool:
+    """True when pages load their feeds through the `/feeds` batch endpoint."""
+    return os.getenv("ONBOARD_FEED_LOADING", "each").lower() == "batch"
+
+
+def requested_feeds(layout) -> list:
+    """Feed widgets a `/feeds` request asks for.
+
+    Either the `ids` given (comma separated or repeated; unknown ones are
+    skipped) or every feed widget of the `tab`, the first tab by default.
+    Widgets sharing a view id are returned once; htmx swaps the fragment into
+    every element with that id.
+    """
+    ids = [i for value in request.args.getlist("ids") for i in value.split(",") if i]
+    if not ids:
+        feeds = layout.tab_feeds(layout.tab(request.args.get("tab")))
+    else:
+        feeds = []
+        for feed_id in ids:
+            try:
+                feeds.append(layout.get_feed(feed_id))
+            except KeyError:
+                logger.debug(f"requested_feeds: unknown feed {feed_id}")
+    return list({feed.view_id: feed for feed in feeds}.values())
+
+
+def oob_fragment(html: str) -> str:
+    """`html` marked to replace the element with its id as an out-of-band swap."""
+    return _FIRST_TAG.sub(r'\g<0> hx-swap-oob="true"', html, count=1)
+
+
+def fragment_response(fragment: Fragment) -> Response:
+    """Response for `fragment`, a 304 when the request already has this version."""
+    return _conditional(
+        make_response(fragment.html), fragment.etag, fragment.last_modified
+    )
+
+
+def fragments_response(fragments: list[Fragment]) -> Response:
+    """One response swapping in all `fragments`, for the `/feeds` endpoint."""
+    response = make_response("".join(oob_fragment(f.html) for f in fragments))
+    etags = [f.etag for f in fragments]
+    if not fragments or None in etags:
+        return response
+    return _conditional(
+        response,
+        calculate_sha1_hash("|".join(etags)),
+        max(f.last_modified for f in fragments),
+    )
+
+
+def _conditional(
+    response: Response, etag: Optional[str], last_modified: Optional[datetime]
+) -> Response:
+    if etag is None:
+        return response
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    # Revalidate every time rather than letting the browser guess freshness
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
@@ -0,0 +1,87 @@
+"""Debug check that `/feed/<feed_id>` fragments carry no htmx load triggers.
+
+Fragments are rendered with `skip_htmx=True` and the widget templates leave out
+their `hx-get`/`hx-trigger="load"` placeholder markup in that mode. A fragment
+that still contained a load trigger would fetch itself again as soon as htmx
+swapped it in. Set ONBOARD_VALIDATE_FRAGMENTS=true while working on templates
+to have every freshly rendered fragment checked: offending attributes are
+logged and stripped. It is off by default and costs a full HTML parse per
+render when on.
+"""
+
+import logging
+import os
+from html.parser import HTMLParser
+
+logger = logging.getLogger(__name__)
+
+TRIGGER_ATTRIBUTES = ("hx-trigger", "data-hx-trigger")
+
+
+def validation_enabled() -> bool:
+    return os.getenv("ONBOARD_VALIDATE_FRAGMENTS", "false").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+
+
+class HXStripper(HTMLParser):
+    """Re-serializes HTML without hx-trigger attributes that fire on `load`."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self.parts: list[str] = []
+        self.removed: list[str] = []
+
+    def _filter_attrs(self, tag, attrs):
+        filtered = []
+        for name, value in attrs:
+            # Tokenised on whitespace so "load" and "load once" both match
+            if name in TRIGGER_ATTRIBUTES and value and "load" in value.split():
+                self.removed.append(f'<{tag} {name}="{value}">')
+                continue
+            filtered.append((name, value))
+        return "".join(f' {n}="{v}"' if v is not None else f" {n}" for n, v in filtered)
+
+    def handle_starttag(self, tag, attrs):
+        self.parts.append(f"<{tag}{self._filter_attrs(tag, attrs)}>")
+
+    def handle_startendtag(self, tag, attrs):
+        self.parts.append(f"<{tag}{self._filter_attrs(tag, attrs)}/>")
+
+    def handle_endtag(self, tag):
+        self.parts.append(f"</{tag}>")
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+    def handle_comment(self, data):
+        self.parts.append(f"<!--{data}-->")
+
+    def handle_entityref(self, name):
+        self.parts.append(f"&{name};")
+
+    def handle_charref(self, name):
+        self.parts.append(f"&#{name};")
+
+
+def validate_fragment(html: str, source: str = "fragment") -> str:
+    """Return `html` with load triggers removed, logging any that were found.
+
+    Never raises; HTML the parser cannot handle is returned unchanged.
+    """
+    stripper = HXStripper()
+    try:
+        stripper.feed(html)
+        stripper.close()
+    except Exception:
+        logger.exception(f"validate_fragment: could not parse {source}")
+        return html
+    if not stripper.removed:
+        return html
+    logger.warning(
+        f"validate_fragment: {source} rendered load triggers with skip_htmx set: "
+        f"{', '.join(stripper.removed)}"
+    )
+    return "".join(stripper.parts)
@@ -0,0 +1,59 @@
+"""Streaming of full page renders.
+
+With ONBOARD_STREAM_PAGES=true the index page is sent while Jinja renders it,
+so the browser gets the head (CSS, scripts) and the first rows and starts
+fetching them before the last rows are rendered. Two things would otherwise
+buffer the whole body again:
+
+- Flask-Minify rewrites a response after it is complete, so the index
+  endpoint is excluded from minification when streaming.
+- Flask-Caching cannot store a streamed response; the page is instead written
+  to the page cache by the stream itself once the last chunk is sent, and
+  later requests are answered from the cache as before.
+"""
+
+import logging
+import os
+from typing import Any, Optional
+
+from flask import Response, stream_template, stream_with_context
+
+logger = logging.getLogger(__name__)
+
+
+def page_streaming_enabled() -> bool:
+    return os.getenv("ONBOARD_STREAM_PAGES", "false").lower() in ("true", "1", "yes")
+
+
+def not_streamed(response: Any) -> bool:
+    """`response_filter` for `cache.cached`: streamed responses are not stored."""
+    return not getattr(response, "is_streamed", False)
+
+
+def stream_page(
+    template_name: str,
+    cache: Any = None,
+    cache_key: Optional[str] = None,
+    timeout: Optional[int] = None,
+    **context: Any,
+) -> Response:
+    """Stream `template_name`, storing the complete page under `cache_key`.
+
+    Nothing is cached when `cache` is None or the client disconnects before
+    the page is complete.
+    """
+    chunks = stream_template(template_name, **context)
+    if cache is None:
+        return Response(chunks, mimetype="text/html")
+
+    def send_and_store():
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        try:
+            cache.set(cache_key, "".join(parts), timeout=timeout)
+        except Exception:
+            logger.exception(f"stream_page: could not cache {cache_key}")
+
+    return Response(stream_with_context(send_and_store()), mimetype="text/html")
@@ -0,0 +1,148 @@
+"""Discovery and caching of feed processors.
+
+Processors are modules named after the `processor` key in layout.yml (e.g.
+`title_editor.py`) that define a title-cased class (`TitleEditor`). They are
+looked up in the app's own `processors` package first and then in a
+`processors` directory next to the app, mirroring the previous per-call
+lookup. Each processor is imported and instantiated once and the instance is
+reused by every feed, so expensive setup such as building LLM chains happens
+once per process.
+
+With hot reload enabled (ONBOARD_PROCESSOR_HOT_RELOAD, on by default) the
+registry stats the processor's file on each lookup and reimports the module
+when it has changed, so editing a processor does not require a restart.
+"""
+
+import importlib
+import logging
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from app.models.noop_feed_processor import NoOpFeedProcessor
+from app.models.utils import pwd
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+DEFAULT_SEARCH_PATHS = [
+    (pwd.joinpath("processors"), "app.processors"),
+    (pwd.parent.joinpath("processors"), "processors"),
+]
+
+
+@dataclass
+class _Entry:
+    path: Path
+    module_name: str
+    mtime: float = 0.0
+    instance: Any = None
+
+
+class ProcessorRegistry:
+    """Caches processor classes and long-lived instances by processor name."""
+
+    def __init__(
+        self,
+        search_paths: Optional[list[tuple[Path, str]]] = None,
+        hot_reload: Optional[bool] = None,
+    ) -> None:
+        self.search_paths = search_paths or DEFAULT_SEARCH_PATHS
+        self.hot_reload = (
+            hot_reload
+            if hot_reload is not None
+            else os.getenv("ONBOARD_PROCESSOR_HOT_RELOAD", "true").lower()
+            in ("true", "1", "yes")
+        )
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self.discover()
+
+    def discover(self) -> None:
+        """Index every processor module in the search paths.
+
+        Earlier search paths win when the same name exists in several places.
+        """
+        entries: dict[str, _Entry] = {}
+        for directory, package in self.search_paths:
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.glob("*.py")):
+                name = path.stem
+                if name.startswith("_") or name in entries:
+                    continue
+                entries[name] = _Entry(path=path, module_name=f"{package}.{name}")
+        with self._lock:
+            self._entries = entries
+        logger.debug(f"ProcessorRegistry: found {sorted(entries)}")
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self._entries)
+
+    def get(self, name: str) -> Any:
+        """Return the shared instance for `name`, or a NoOpFeedProcessor."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None and self.hot_reload:
+                entry = self._find(name)
+            if entry is None:
+                return NoOpFeedProcessor()
+
+            try:
+                mtime = entry.path.stat().st_mtime
+            except OSError:
+                # File was removed; keep serving the instance we already have
+                return entry.instance or NoOpFeedProcessor()
+
+            if entry.instance is None or (self.hot_reload and mtime != entry.mtime):
+                entry.instance = self._instantiate(name, entry)
+                entry.mtime = mtime
+            return entry.instance
+
+    def _find(self, name: str) -> Optional[_Entry]:
+        # Caller holds self._lock
+        for directory, package in self.search_paths:
+            path = directory.joinpath(f"{name}.py")
+            if path.exists():
+                entry = _Entry(path=path, module_name=f"{package}.{name}")
+                self._entries[name] = entry
+                return entry
+        return None
+
+    def _instantiate(self, name: str, entry: _Entry) -> Any:
+        # Caller holds self._lock
+        class_name = "".join(word.title() for word in name.split("_"))
+        reloading = entry.instance is not None
+        try:
+            module = sys.modules.get(entry.module_name)
+            if module is not None and reloading:
+                module = importlib.reload(module)
+            else:
+                module = importlib.import_module(entry.module_name)
+            instance = getattr(module, class_name)()
+        except (ImportError, AttributeError):
+            logger.exception(f"ProcessorRegistry: failed to load processor {name}")
+            return NoOpFeedProcessor()
+
+        logger.info(
+            f"ProcessorRegistry: {'reloaded' if reloading else 'loaded'} "
+            f"{class_name} from {entry.path}"
+        )
+        return instance
+
+
+_PROCESSOR_REGISTRY: Optional[ProcessorRegistry] = None
+_PROCESSOR_REGISTRY_LOCK = threading.Lock()
+
+
+def get_processor_registry() -> ProcessorRegistry:
+    """Return the process-wide ProcessorRegistry, creating it on first use."""
+    global _PROCESSOR_REGISTRY
+    with _PROCESSOR_REGISTRY_LOCK:
+        if _PROCESSOR_REGISTRY is None:
+            _PROCESSOR_REGISTRY = ProcessorRegistry()
+        return _PROCESSOR_REGISTRY
@@ -0,0 +1,115 @@
+"""Measure the memory held by cached FeedArticle objects.
+
+Builds a synthetic layout of feeds, serializes their articles the way the feed
+cache stores them (schema version 2) and then loads them back into FeedArticle objects, reporting
+the memory retained once loading is done. Run it before and after a change to
+the article representation to compare.
+
+    python scripts/benchmark_article_memory.py --articles 50000 --feeds 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.models.feed_article import FeedArticle
+
+WORDS = (
+    "market update report release weekly open source python security patch "
+    "launch review analysis interview guide news tech science policy"
+).split()
+
+
+class SyntheticFeed:
+    def __init__(self, index: int) -> None:
+        self.id = f"feed{index:04d}"
+        self.filters = []
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=50_000)
+    parser.add_argument("--feeds", type=int, default=100)
+    parser.add_argument(
+        "--display-limit",
+        type=int,
+        default=10,
+        help="Articles per feed whose title/summary are read, as if rendered.",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    return parser
+
+
+def synthetic_cache(feed: SyntheticFeed, count: int, rng: random.Random) -> str:
+    now = datetime.now(timezone.utc)
+    articles = []
+    for i in range(count):
+        title = " ".join(rng.choices(WORDS, k=8)).title() + f" {feed.id}-{i}"
+        body = " ".join(rng.choices(WORDS, k=80))
+        articles.append(
+            {
+                "original_title": title,
+                "title": title,
+                "link": f"https://example.com/{feed.id}/{i}?utm_source=rss",
+                "description": f"<p>{body}</p><p><a href='#'>Read more</a></p>",
+                "pub_date": int((now - timedelta(hours=i)).timestamp()),
+                "id": f"{feed.id}-{i}",
+                "processed": "2024-01-01T00:00:00+00:00",
+                "name": title,
+                "processed_by": ["StripLongUrls:1-60"],
+            }
+        )
+    return json.dumps(articles)
+
+
+def load(feed: SyntheticFeed, text: str) -> list[FeedArticle]:
+    # Mirrors Feed.__init__ loading its cache file
+    return [FeedArticle.from_cache_dict(d, parent=feed) for d in json.loads(text)]
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    rng = random.Random(args.seed)
+    per_feed = max(1, args.articles // args.feeds)
+    feeds = [SyntheticFeed(i) for i in range(args.feeds)]
+    caches = [synthetic_cache(feed, per_feed, rng) for feed in feeds]
+
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    layout = [load(feed, text) for feed, text in zip(feeds, caches)]
+    load_seconds = time.perf_counter() - started
+    gc.collect()
+    loaded, _ = tracemalloc.get_traced_memory()
+
+    started = time.perf_counter()
+    for articles in layout:
+        for article in articles[: args.display_limit]:
+            article.title, article.summary, article.tracking_link
+    render_seconds = time.perf_counter() - started
+    gc.collect()
+    rendered, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(len(articles) for articles in layout)
+    print(f"articles:       {total} in {len(feeds)} feeds")
+    print(f"load time:      {load_seconds:.2f}s")
+    print(f"after load:     {loaded / 2**20:.1f} MiB ({loaded / total:.0f} B/article)")
+    print(f"after render:   {rendered / 2**20:.1f} MiB ({render_seconds:.3f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
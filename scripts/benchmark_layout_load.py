@@ -0,0 +1,133 @@
+"""Time a layout reload against a large set of synthetic feed caches.
+
+Writes a layout.yml with `--feeds` feed widgets spread over `--tabs` tabs and
+a cache file for each feed into a temporary working directory, then times
+Layout.reload in the requested mode. Run it once per mode to compare:
+
+    python scripts/benchmark_layout_load.py --mode lazy
+    python scripts/benchmark_layout_load.py --mode eager --workers 1
+    python scripts/benchmark_layout_load.py --mode eager --workers 8 --legacy
+
+`--legacy` writes version 1 caches (RFC 2822 dates), the slowest to load.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+WORDS = (
+    "market update report release weekly open source python security patch "
+    "launch review analysis interview guide news tech science policy"
+).split()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feeds", type=int, default=200)
+    parser.add_argument("--articles", type=int, default=250, help="Per feed.")
+    parser.add_argument("--tabs", type=int, default=5)
+    parser.add_argument("--mode", choices=("lazy", "eager"), default="eager")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--legacy", action="store_true")
+    parser.add_argument("--seed", type=int, default=1)
+    return parser
+
+
+def synthetic_cache(url: str, count: int, legacy: bool, rng: random.Random) -> dict:
+    now = datetime.now(timezone.utc)
+    articles = []
+    for i in range(count):
+        title = " ".join(rng.choices(WORDS, k=8)).title() + f" {i}"
+        published = now - timedelta(hours=i)
+        articles.append(
+            {
+                "original_title": title,
+                "title": title,
+                "link": f"{url}/{i}",
+                "description": f"<p>{' '.join(rng.choices(WORDS, k=80))}</p>",
+                "pub_date": (
+                    format_datetime(published) if legacy else int(published.timestamp())
+                ),
+                "id": f"{abs(hash(url))}-{i}",
+                "processed": "2024-01-01T00:00:00+00:00",
+                "name": title,
+            }
+        )
+    payload = {"articles": articles}
+    if not legacy:
+        payload["version"] = 2
+    return payload
+
+
+def write_fixture(root: Path, args: argparse.Namespace) -> Path:
+    from app.models.utils import calculate_sha1_hash
+
+    rng = random.Random(args.seed)
+    cache_dir = root.joinpath("cache")
+    cache_dir.mkdir(parents=True)
+    tabs = [{"tab": f"Tab {t}", "columns": [{"widgets": []}]} for t in range(args.tabs)]
+    for index in range(args.feeds):
+        url = f"https://example.com/feed{index}"
+        tabs[index % args.tabs]["columns"][0]["widgets"].append(
+            # No update_interval: keep the feeds idle while timing
+            {"name": f"Feed {index}", "type": "feed", "feed_url": url}
+        )
+        cache_dir.joinpath(f"{calculate_sha1_hash(url)}.json").write_text(
+            json.dumps(synthetic_cache(url, args.articles, args.legacy, rng))
+        )
+    layout_path = root.joinpath("layout.yml")
+    layout_path.write_text(json.dumps({"tabs": tabs}))
+    return layout_path
+
+
+def main() -> int:
+    args = build_parser().parse_args()
+    with tempfile.TemporaryDirectory() as root:
+        os.environ.update(
+            {
+                "WORKING_STORAGE": root,
+                "ONBOARD_DISABLE_SCHEDULER": "true",
+                "ONBOARD_LAYOUT_LOAD": args.mode,
+                "ONBOARD_LOAD_WORKERS": str(args.workers),
+            }
+        )
+        layout_path = write_fixture(Path(root), args)
+
+        from app.models.layout import Layout
+
+        layout = Layout(str(layout_path), bar_manager=object(), skip_file_init=True)
+        started = time.perf_counter()
+        layout.reload()
+        reload_seconds = time.perf_counter() - started
+
+        owners = layout.feed_registry.owners
+        started = time.perf_counter()
+        # In lazy mode this is the cost moved to the first requests
+        articles = sum(len(feed.items) for feed in owners)
+        first_use_seconds = time.perf_counter() - started
+
+    print(f"feeds:          {len(owners)} ({articles} articles)")
+    print(
+        f"mode:           {args.mode} (workers={args.workers}, "
+        f"legacy={args.legacy})"
+    )
+    print(f"reload time:    {reload_seconds:.2f}s")
+    print(f"first use:      {first_use_seconds:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,41 @@
+"""Tests for feed API endpoints."""
+
+import json
+
+
+class TestFeedHistoryRoute:
+    """Test the feed history paging endpoint."""
+
+    def test_history_page(self, test_client, mock_layout):
+        feed = mock_layout.get_feed.return_value
+        feed.name = "News"
+        feed.source.id = "feed1"
+        feed.source.feed_cache.history_page.return_value = ([{"id": "a1"}], "1:a1")
+
+        response = test_client.get("/api/feeds/view1/history?limit=1000&before=5:x")
+        data = json.loads(response.data)
+
+        assert response.status_code == 200
+        assert data == {
+            "feed_id": "feed1",
+            "name": "News",
+            "articles": [{"id": "a1"}],
+            "next": "1:a1",
+        }
+        mock_layout.get_feed.assert_called_with("view1")
+        feed.source.feed_cache.history_page.assert_called_with(before="5:x", limit=200)
+
+    def test_unknown_feed_returns_404(self, test_client, mock_layout):
+        mock_layout.get_feed.side_effect = KeyError("missing")
+
+        response = test_client.get("/api/feeds/missing/history")
+
+        assert response.status_code == 404
+
+    def test_bad_cursor_returns_400(self, test_client, mock_layout):
+        feed = mock_layout.get_feed.return_value
+        feed.source.feed_cache.history_page.side_effect = ValueError("bad")
+
+        response = test_client.get("/api/feeds/view1/history?before=nope")
+
+        assert response.status_code == 400
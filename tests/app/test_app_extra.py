@@ -13,7 +13,7 @@ class FakeLayoutModified:
         # simulate modified state
         return True
 
-    def reload(self):
+    def reload_async(self):
         self._reloaded = True
 
     def get_link(self, feed_id, link_id):
@@ -43,7 +43,7 @@ def test_index_calls_reload_when_layout_modified():
 
     r = client.get("/")
     assert r.status_code == 200
-    # layout.reload should have been called because is_modified returned True
+    # a reload should have been started because is_modified returned True
     assert fake._reloaded is True
 
 
@@ -14,6 +14,7 @@ import pytest
 
 from app.models.feed import Feed
 from app.models.layout import Layout
+from tests.mocks.mock_feed_fetcher import MockFeedFetcher
 
 # mark this module as integration so pytest -m "not integration" will deselect it
 pytestmark = pytest.mark.integration
@@ -26,6 +27,10 @@ class TestFeedIntegrationRegression(unittest.TestCase):
         """Set up test fixtures with clean environment."""
         self.tmpdir = tempfile.TemporaryDirectory()
         os.environ["WORKING_STORAGE"] = self.tmpdir.name
+        self.fetcher_patch = patch(
+            "app.models.feed.get_feed_fetcher", return_value=MockFeedFetcher()
+        )
+        self.fetcher_patch.start()
 
         # Sample feed configuration
         self.feed_config = {
@@ -36,6 +41,7 @@ class TestFeedIntegrationRegression(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
+        self.fetcher_patch.stop()
         self.tmpdir.cleanup()
         os.environ.pop("WORKING_STORAGE", None)
 
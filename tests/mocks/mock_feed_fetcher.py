@@ -0,0 +1,44 @@
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from app.services.feed_fetcher import FetchResult
+
+
+class MockFeedFetcher:
+    """Synchronous stand-in for FeedFetcher that never touches the network.
+
+    Returns a canned FetchResult per url (an empty 200 response by default) and
+    records every request so tests can assert on the validators that were sent.
+    """
+
+    def __init__(self) -> None:
+        self.results: Dict[str, FetchResult] = {}
+        self.calls: List[Dict[str, Any]] = []
+
+    def fetch(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        modified: Optional[str] = None,
+        callback: Optional[Callable[[FetchResult], None]] = None,
+    ) -> FetchResult:
+        self.calls.append({"url": url, "etag": etag, "modified": modified})
+        result = self.results.get(url) or FetchResult(url=url, status=200)
+        if callback is not None:
+            callback(result)
+        return result
+
+    def submit(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+        modified: Optional[str] = None,
+        callback: Optional[Callable[[FetchResult], None]] = None,
+    ) -> Future:
+        result = self.fetch(url, etag=etag, modified=modified, callback=callback)
+        future: Future = Future()
+        future.set_result(result)
+        return future
+
+    def shutdown(self) -> None:
+        pass
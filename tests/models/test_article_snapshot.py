@@ -0,0 +1,31 @@
+import copy
+from types import SimpleNamespace
+
+from app.models.article_snapshot import ArticleSnapshot
+
+
+def test_next_snapshot_bumps_version_and_leaves_previous_alone():
+    first = SimpleNamespace(id="a")
+    snapshot = ArticleSnapshot([first])
+    articles = [first]
+
+    following = snapshot.next(articles + [SimpleNamespace(id="b")])
+    articles.clear()
+
+    assert snapshot.articles == (first,)
+    assert snapshot.ids == {"a"}
+    assert following.version == snapshot.version + 1
+    assert following.ids == {"a", "b"}
+
+
+def test_writable_copies_only_published_articles():
+    published = SimpleNamespace(id="a")
+    fresh = SimpleNamespace(id="b")
+    snapshot = ArticleSnapshot([published])
+
+    writable = snapshot.writable([published, fresh])
+
+    assert writable[0] is not published and writable[0] == published
+    assert writable[1] is fresh
+    assert published in snapshot
+    assert copy.copy(published) not in snapshot
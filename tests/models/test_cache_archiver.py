@@ -0,0 +1,46 @@
+from pathlib import Path
+
+from app.models.cache_archiver import CacheArchiver
+from app.models.local_file_store import LocalFileStore
+
+
+def write(path: Path, size: int) -> None:
+    path.write_bytes(b"x" * size)
+
+
+def archive_dirs(cache_dir: Path) -> list[Path]:
+    return [p for p in cache_dir.iterdir() if p.name.startswith("archive-")]
+
+
+def test_nothing_to_archive_creates_no_archive_dir(tmp_path):
+    write(tmp_path / "small.json", 10)
+
+    assert CacheArchiver(tmp_path, min_size_bytes=100).run() == []
+    assert archive_dirs(tmp_path) == []
+
+
+def test_empty_cache_dir_gets_no_manifest(tmp_path):
+    CacheArchiver(tmp_path).run()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_move_is_retried_only_after_size_changes(tmp_path):
+    class FailingStore(LocalFileStore):
+        moves = 0
+
+        def move(self, src, dst):
+            FailingStore.moves += 1
+            raise OSError("read-only")
+
+    big = tmp_path / "big.json"
+    write(big, 200)
+    archiver = CacheArchiver(tmp_path, FailingStore(), min_size_bytes=100)
+
+    archiver.run()
+    archiver.run()
+    assert FailingStore.moves == 1
+
+    write(big, 300)
+    archiver.run()
+    assert FailingStore.moves == 2
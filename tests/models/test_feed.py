@@ -8,14 +8,22 @@ from unittest.mock import MagicMock, patch
 
 from app.models.feed import Feed
 from app.models.feed_article import FeedArticle
+from app.services.feed_fetcher import FetchResult
+from tests.mocks.mock_feed_fetcher import MockFeedFetcher
 
 
 class TestFeed(unittest.TestCase):
     def setUp(self):
         self.tmpdir = tempfile.TemporaryDirectory()
         os.environ["WORKING_STORAGE"] = self.tmpdir.name
+        self.fetcher = MockFeedFetcher()
+        self.fetcher_patch = patch(
+            "app.models.feed.get_feed_fetcher", return_value=self.fetcher
+        )
+        self.fetcher_patch.start()
 
     def tearDown(self):
+        self.fetcher_patch.stop()
         self.tmpdir.cleanup()
         os.environ.pop("WORKING_STORAGE", None)
 
@@ -216,19 +224,297 @@ class TestFeed(unittest.TestCase):
         self.assertIn("articles", data)
         self.assertIn("pub_date", data["articles"][0])
 
-    def test_update_calls_download_and_save(self):
+    def test_update_fetches_parses_and_saves(self):
         widget = self.make_widget()
         f = Feed(widget)
 
-        with patch.object(
-            Feed, "download", return_value=[]
-        ) as mock_download, patch.object(
-            Feed, "save_articles", return_value=[]
-        ) as mock_save:
+        with (
+            patch.object(Feed, "parse", return_value=[]) as mock_parse,
+            patch.object(Feed, "save_articles", return_value=[]) as mock_save,
+        ):
             f.update()
-            mock_download.assert_called_once()
+            self.assertEqual(len(self.fetcher.calls), 1)
+            mock_parse.assert_called_once()
             mock_save.assert_called_once()
 
+    def test_download_sends_cached_validators(self):
+        widget = self.make_widget()
+        f = Feed(widget)
+        f.feed_cache.etag = '"v1"'
+        f.feed_cache.modified = "Wed, 01 Jan 2020 00:00:00 GMT"
+
+        self.fetcher.results[f.feed_url] = FetchResult(
+            url=f.feed_url,
+            status=200,
+            content=b"<rss><channel></channel></rss>",
+            etag='"v2"',
+            modified="Thu, 02 Jan 2020 00:00:00 GMT",
+        )
+        f.download(f.feed_url)
+
+        self.assertEqual(
+            self.fetcher.calls,
+            [
+                {
+                    "url": f.feed_url,
+                    "etag": '"v1"',
+                    "modified": "Wed, 01 Jan 2020 00:00:00 GMT",
+                }
+            ],
+        )
+        self.assertEqual(f.feed_cache.etag, '"v2"')
+        self.assertEqual(f.feed_cache.modified, "Thu, 02 Jan 2020 00:00:00 GMT")
+
+    @patch("feedparser.parse")
+    def test_update_skips_parse_and_save_when_not_modified(self, mock_parse):
+        widget = self.make_widget()
+        f = Feed(widget)
+        f.feed_cache.etag = '"v1"'
+
+        self.fetcher.results[f.feed_url] = FetchResult(url=f.feed_url, status=304)
+        self.assertIsNone(f.download(f.feed_url))
+
+        with patch.object(Feed, "save_articles") as mock_save:
+            f.update()
+            mock_save.assert_not_called()
+        mock_parse.assert_not_called()
+        self.assertIsNotNone(f.last_updated)
+        self.assertFalse(f.cache_path.exists())
+
+    @patch("feedparser.parse")
+    def test_download_failure_returns_no_articles(self, mock_parse):
+        widget = self.make_widget()
+        f = Feed(widget)
+
+        self.fetcher.results[f.feed_url] = FetchResult(
+            url=f.feed_url, error="ClientConnectorError: refused"
+        )
+        self.assertEqual(f.download(f.feed_url), [])
+        mock_parse.assert_not_called()
+
+    def test_enqueue_update_ingests_through_fetcher(self):
+        widget = self.make_widget()
+        f = Feed(widget)
+
+        self.fetcher.results[f.feed_url] = FetchResult(
+            url=f.feed_url,
+            status=200,
+            content=(
+                b"<rss><channel><item><title>Hello</title>"
+                b"<link>http://example.com/hello</link></item></channel></rss>"
+            ),
+        )
+        f.enqueue_update()
+
+        self.assertEqual([a.title for a in f.items], ["Hello"])
+        self.assertTrue(f.cache_path.exists())
+
+    def rss(self, *slugs):
+        items = "".join(
+            f"<item><title>{slug}</title><link>http://example.com/{slug}</link></item>"
+            for slug in slugs
+        )
+        return f"<rss><channel>{items}</channel></rss>".encode()
+
+    def known_article(self, f, slug):
+        return FeedArticle(
+            original_title=slug,
+            title=slug,
+            link=f"http://example.com/{slug}",
+            description="",
+            pub_date=datetime(2020, 1, 1),
+            processed="",
+            parent=f,
+        )
+
+    def test_download_skips_entries_already_known(self):
+        f = Feed(self.make_widget())
+        f.items = [self.known_article(f, "old")]
+        self.fetcher.results[f.feed_url] = FetchResult(
+            url=f.feed_url, status=200, content=self.rss("new", "old")
+        )
+
+        with patch("app.models.feed.FeedArticle", wraps=FeedArticle) as ctor:
+            articles = f.download(f.feed_url)
+
+        self.assertEqual([a.title for a in articles], ["new"])
+        self.assertEqual(ctor.call_count, 1)
+
+    def test_download_stops_after_consecutive_known_entries(self):
+        widget = self.make_widget()
+        widget["stop_after_known"] = 2
+        f = Feed(widget)
+        f.items = [self.known_article(f, "a"), self.known_article(f, "b")]
+        self.fetcher.results[f.feed_url] = FetchResult(
+            url=f.feed_url, status=200, content=self.rss("new", "a", "b", "older")
+        )
+
+        articles = f.download(f.feed_url)
+
+        self.assertEqual([a.title for a in articles], ["new"])
+
+    def test_run_processor_skips_articles_already_processed_at_version(self):
+        f = Feed(self.make_widget())
+        processor = MagicMock(version="1")
+        processor.process.side_effect = lambda articles: articles
+        first = self.known_article(f, "first")
+
+        f.run_processor(processor, [first])
+        second = self.known_article(f, "second")
+        f.run_processor(processor, [first, second])
+
+        self.assertEqual(processor.process.call_args.args[0], [second])
+
+        processor.version = "2"
+        f.run_processor(processor, [first, second])
+        self.assertEqual(processor.process.call_args.args[0], [first, second])
+        self.assertEqual(first.processed_by, {"MagicMock:2"})
+
+    def test_processors_never_change_published_articles(self):
+        f = Feed(self.make_widget())
+        f.items = [self.known_article(f, "story")]
+        rendering = f.snapshot
+        processor = MagicMock(version="1")
+
+        def rename(articles):
+            for article in articles:
+                article.name = "renamed"
+            return articles
+
+        processor.process.side_effect = rename
+        f.items = f.run_processor(processor, list(f.items))
+
+        self.assertEqual(rendering.articles[0].name, "story")
+        self.assertEqual(f.items[0].name, "renamed")
+        self.assertEqual(f.snapshot.version, rendering.version + 1)
+
+    def test_processor_markers_and_name_survive_cache_reload(self):
+        f = Feed(self.make_widget())
+        article = self.known_article(f, "story")
+        article.name = "story (stripped)"
+        article.mark_processed("StripLongUrls:1-25")
+        f.save_articles([article])
+
+        reloaded = Feed(self.make_widget())
+
+        self.assertEqual(reloaded.items[0].name, "story (stripped)")
+        self.assertIn("StripLongUrls:1-25", reloaded.items[0].processed_by)
+
+    def test_cached_articles_load_on_first_use(self):
+        f = Feed(self.make_widget())
+        f.items = f.save_articles([self.known_article(f, "story")])
+        saved = datetime.fromtimestamp(f.feed_cache.last_modified())
+
+        reloaded = Feed(self.make_widget())
+
+        self.assertFalse(reloaded.hydrated)
+        self.assertEqual(reloaded.last_updated, saved)
+        self.assertEqual([a.name for a in reloaded.items], ["story"])
+        self.assertTrue(reloaded.hydrated)
+        self.assertEqual(reloaded.last_updated, saved)
+
+    def test_old_cache_format_is_upgraded_on_hydrate(self):
+        f = Feed(self.make_widget())
+        legacy = {
+            "articles": [
+                {
+                    "original_title": "Old story",
+                    "title": "Old story",
+                    "link": "http://example.com/old",
+                    "description": "<p>Body</p>",
+                    "pub_date": "Wed, 01 Jan 2020 00:00:00 GMT",
+                    "id": "ignored",
+                    "processed": "",
+                }
+            ]
+        }
+        f.cache_path.write_text(json.dumps(legacy))
+
+        reloaded = Feed(self.make_widget())
+        self.assertNotIn("version", json.loads(reloaded.cache_path.read_text()))
+
+        reloaded.hydrate()
+
+        data = json.loads(reloaded.cache_path.read_text())
+        self.assertEqual(data["version"], 2)
+        self.assertEqual(data["articles"][0]["pub_date"], 1577836800)
+        self.assertEqual(reloaded.items[0].pub_date.timestamp(), 1577836800)
+
+    def test_derived_fields_load_without_parsing(self):
+        f = Feed(self.make_widget())
+        article = self.known_article(f, "story")
+        article.description = "<p>A longer summary of the story</p>"
+        summary = article.summary
+        f.save_articles([article])
+
+        with patch("app.models.feed_article.BeautifulSoup") as soup:
+            reloaded = Feed(self.make_widget())
+            self.assertEqual(reloaded.items[0].summary, summary)
+            self.assertEqual(reloaded.items[0].title, article.title)
+            soup.assert_not_called()
+
+    def test_retention_spills_old_articles_to_history(self):
+        widget = {**self.make_widget(), "max_articles": 2, "display_limit": 1}
+        f = Feed(widget)
+        articles = [self.known_article(f, f"story{i}") for i in range(4)]
+        for i, article in enumerate(articles):
+            article.pub_date = datetime(2020, 1, 10 - i)
+
+        f.items = f.save_articles(articles)
+
+        self.assertEqual([a.name for a in f.items], ["story0", "story1"])
+        history = list(f.feed_cache.history.read(f.id))
+        self.assertEqual([a["name"] for a in history], ["story2", "story3"])
+        self.assertEqual(len(Feed(widget).items), 2)
+
+    def test_retention_ignores_widgets_without_display_limit(self):
+        widget = {**self.make_widget(), "max_articles": 2, "display_limit": None}
+        f = Feed(widget)
+        articles = [self.known_article(f, f"story{i}") for i in range(4)]
+
+        f.items = f.save_articles(articles)
+
+        self.assertEqual([a.name for a in f.items], ["story0", "story1"])
+
+    def test_oversized_cache_is_trimmed_on_load(self):
+        f = Feed(self.make_widget())
+        f.save_articles([self.known_article(f, f"story{i}") for i in range(5)])
+
+        trimmed = Feed({**self.make_widget(), "max_articles": 3, "display_limit": 1})
+
+        self.assertEqual(len(trimmed.items), 3)
+        self.assertEqual(len(json.loads(trimmed.cache_path.read_text())["articles"]), 3)
+        self.assertEqual(len(list(trimmed.feed_cache.history.read(f.id))), 2)
+
+    def test_poll_job_backs_off_when_feed_is_unchanged(self):
+        widget = self.make_widget()
+        sched = MagicMock()
+        sched.running = True
+
+        with patch("app.models.widget.Scheduler.getScheduler", return_value=sched):
+            f = Feed(widget)
+
+        args, kwargs = sched.add_job.call_args
+        self.assertEqual(args[1], "interval")
+        self.assertEqual(kwargs["seconds"], 3600)
+
+        self.fetcher.results[f.feed_url] = FetchResult(url=f.feed_url, status=304)
+        f.update()
+
+        f.job.reschedule.assert_called_once()
+        self.assertEqual(f.job.reschedule.call_args.kwargs["seconds"], 7200)
+
+    def test_update_interval_overrides_polling(self):
+        widget = self.make_widget()
+        widget["update_interval"] = 5
+        sched = MagicMock()
+        sched.running = True
+
+        with patch("app.models.widget.Scheduler.getScheduler", return_value=sched):
+            Feed(widget)
+
+        self.assertEqual(sched.add_job.call_args.kwargs["seconds"], 300)
+
     def test_needs_update_returns_true_when_force_update_env_set(self):
         """needs_update returns True when ONBOARD_FEED_FORCE_UPDATE is set."""
         widget = self.make_widget()
@@ -367,9 +653,11 @@ class TestFeedDependencyInjection(unittest.TestCase):
         # Create Feed with injected cache
         f = Feed(widget, feed_cache=mock_cache)
 
-        # Verify the injected cache was used
+        # Verify the injected cache was used, once the articles are needed
         self.assertIs(f.feed_cache, mock_cache)
-        mock_cache.load_cache.assert_called()
+        mock_cache.load_cache.assert_not_called()
+        self.assertEqual(f.items, ())
+        mock_cache.load_cache.assert_called_once()
 
     def test_feed_with_injected_scheduler(self):
         """Feed uses provided scheduler instead of Scheduler.getScheduler()."""
@@ -1,10 +1,13 @@
 import json
 import os
 import tempfile
+import threading
 import unittest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+from bs4 import BeautifulSoup
 
 from app.models.bookmarks import Bookmarks
 from app.models.column import Column
@@ -27,6 +30,34 @@ class TestFeedArticle(unittest.TestCase):
         )
         self.assertIn(a.title, ("Orig", "Desc"))
 
+    def test_readers_never_see_a_half_derived_article(self):
+        a = FeedArticle(
+            original_title="Orig",
+            title="",
+            link="l",
+            description="<p>Body text</p>",
+            pub_date=datetime.now(),
+            processed="",
+            parent=MagicMock(),
+        )
+        parsing, release = threading.Event(), threading.Event()
+
+        def slow_soup(*args, **kwargs):
+            if not parsing.is_set():
+                parsing.set()
+                release.wait(5)
+            return BeautifulSoup(*args, **kwargs)
+
+        with patch("app.models.feed_article.BeautifulSoup", side_effect=slow_soup):
+            first = threading.Thread(target=lambda: a.summary)
+            first.start()
+            parsing.wait(5)
+            try:
+                self.assertEqual(a.summary, "Body text")
+            finally:
+                release.set()
+                first.join()
+
     def test_filters_remove_and_strip(self):
         parent = MagicMock()
         parent.filters = [
@@ -166,6 +197,71 @@ class TestFeedArticle(unittest.TestCase):
         )
         self.assertFalse(a.removed)
 
+    def test_summary_is_parsed_lazily_once(self):
+        parent = MagicMock()
+        parent.filters = None
+
+        with patch(
+            "app.models.feed_article.BeautifulSoup", wraps=BeautifulSoup
+        ) as soup:
+            a = FeedArticle(
+                original_title="Orig",
+                title="",
+                link="l",
+                description="<p>Some &amp; text</p>",
+                pub_date=datetime.now(),
+                processed="",
+                parent=parent,
+            )
+            self.assertEqual(a.stored_title, "Orig")
+            soup.assert_not_called()
+
+            self.assertEqual(a.summary, "Some & text")
+            self.assertEqual(a.title, "Orig")
+            soup.assert_called_once()
+
+    def test_lazy_title_replaced_by_longer_summary(self):
+        parent = MagicMock()
+        parent.filters = None
+        a = FeedArticle(
+            original_title="Breaking news today",
+            title="",
+            link="l",
+            description="Breaking news today!!",
+            pub_date=datetime.now(),
+            processed="",
+            parent=parent,
+        )
+
+        self.assertEqual(a.title, "Breaking news today!!")
+        self.assertIsNone(a.summary)
+
+    def test_compact_representation_shares_strings(self):
+        parent = MagicMock()
+        parent.id = "feed"
+        a, b = (
+            FeedArticle(
+                original_title="Same title",
+                title="Same title",
+                link=f"https://example.com/{i}",
+                description="d",
+                pub_date=datetime.now(),
+                processed="2024-01-01T00:00:00",
+                parent=parent,
+                apply_filters=False,
+                name="Same title",
+                processed_by=["StripLongUrls:1-60"],
+            )
+            for i in range(2)
+        )
+
+        self.assertFalse(hasattr(a, "__dict__"))
+        self.assertIs(a.stored_title, a.original_title)
+        self.assertIs(a.name, a.original_title)
+        self.assertIs(a.processed, b.processed)
+        self.assertIs(a.processed_by, b.processed_by)
+        self.assertEqual(a.tracking_link, f"/redirect/feed/{a.id}")
+
 
 class TestFeed(unittest.TestCase):
     def setUp(self):
@@ -120,8 +120,8 @@ class TestFeedArticleHTMLParsing(unittest.TestCase):
 
             mock_bs.side_effect = side_effect
 
-            # This should not raise an exception
-            FeedArticle(description=description, **self.base_args)
+            # This should not raise an exception (the summary is parsed lazily)
+            FeedArticle(description=description, **self.base_args).summary
 
             # Verify that BeautifulSoup was called with html.parser
             mock_bs.assert_called()
@@ -211,3 +211,45 @@ def test_save_articles_writes_file_atomically(tmp_path):
     # file should exist and contain the articles
     loaded = fc.load_cache(archive_on_load=False)
     assert loaded == articles
+
+
+def test_validators_roundtrip_with_articles(tmp_path):
+    fc = FeedCache("validators", working_dir=tmp_path)
+    fc.etag = '"abc123"'
+    fc.modified = "Wed, 01 Jan 2020 00:00:00 GMT"
+    fc.save_articles([{"id": "1"}])
+
+    reloaded = FeedCache("validators", working_dir=tmp_path)
+    assert reloaded.etag is None
+    assert reloaded.load_cache(archive_on_load=False) == [{"id": "1"}]
+    assert reloaded.etag == '"abc123"'
+    assert reloaded.modified == "Wed, 01 Jan 2020 00:00:00 GMT"
+
+
+def test_schema_version_is_written_and_read(tmp_path):
+    fc = FeedCache("versioned", working_dir=tmp_path)
+    fc.cache_path.write_text(json.dumps({"articles": [{"id": "1"}]}))
+
+    fc.load_cache(archive_on_load=False)
+    assert fc.version == 1
+
+    fc.save_articles([{"id": "1"}])
+    assert json.loads(fc.cache_path.read_text())["version"] == FeedCache.SCHEMA_VERSION
+    assert fc.version == FeedCache.SCHEMA_VERSION
+
+
+def test_run_maintenance_archives_only_without_retention(tmp_path, monkeypatch):
+    cache_dir, cache_path = _make_cache_paths(tmp_path, "live")
+    cache_path.write_bytes(b"x" * (400 * 1024))
+    fc = FeedCache("live", working_dir=tmp_path)
+    compacted = []
+    monkeypatch.setattr(fc, "compact_history", lambda: compacted.append(1) or 0)
+
+    monkeypatch.setenv("ONBOARD_FEED_MAX_ARTICLES", "250")
+    fc.run_maintenance()
+    assert cache_path.exists()
+
+    monkeypatch.setenv("ONBOARD_FEED_MAX_ARTICLES", "0")
+    fc.run_maintenance()
+    assert not cache_path.exists()
+    assert len(compacted) == 2
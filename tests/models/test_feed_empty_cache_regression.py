@@ -10,6 +10,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from app.models.feed import Feed
+from tests.mocks.mock_feed_fetcher import MockFeedFetcher
 
 
 class TestFeedEmptyCache(unittest.TestCase):
@@ -19,6 +20,10 @@ class TestFeedEmptyCache(unittest.TestCase):
         """Set up test fixtures with clean temporary directory."""
         self.tmpdir = tempfile.TemporaryDirectory()
         os.environ["WORKING_STORAGE"] = self.tmpdir.name
+        self.fetcher_patch = patch(
+            "app.models.feed.get_feed_fetcher", return_value=MockFeedFetcher()
+        )
+        self.fetcher_patch.start()
 
         # Basic widget configuration
         self.widget_config = {
@@ -29,6 +34,7 @@ class TestFeedEmptyCache(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
+        self.fetcher_patch.stop()
         self.tmpdir.cleanup()
         os.environ.pop("WORKING_STORAGE", None)
 
@@ -0,0 +1,230 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.models.feed import Feed
+from app.models.feed_registry import FeedRegistry
+from app.services.feed_fetcher import FetchResult
+from tests.mocks.mock_feed_fetcher import MockFeedFetcher
+
+FEED_URL = "http://example.com/rss"
+FEED_BYTES = (
+    b"<rss><channel>"
+    b"<item><title>Keep me</title><link>http://example.com/keep</link>"
+    b"<description>Body sponsored</description>"
+    b"<pubDate>Thu, 02 Jan 2020 00:00:00 GMT</pubDate></item>"
+    b"<item><title>Drop me</title><link>http://example.com/drop</link>"
+    b"<pubDate>Wed, 01 Jan 2020 00:00:00 GMT</pubDate></item>"
+    b"</channel></rss>"
+)
+
+
+class CountingProcessor:
+    version = "1"
+
+    def __init__(self):
+        self.calls = 0
+
+    def process(self, articles):
+        self.calls += len(articles)
+        return articles
+
+
+class TestFeedRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.environ["WORKING_STORAGE"] = self.tmpdir.name
+        self.fetcher = MockFeedFetcher()
+        self.fetcher.results[FEED_URL] = FetchResult(
+            url=FEED_URL, status=200, content=FEED_BYTES
+        )
+        self.fetcher_patch = patch(
+            "app.models.feed.get_feed_fetcher", return_value=self.fetcher
+        )
+        self.fetcher_patch.start()
+
+        self.scheduler = MagicMock()
+        self.scheduler.running = True
+        self.scheduler_patch = patch(
+            "app.models.widget.Scheduler.getScheduler", return_value=self.scheduler
+        )
+        self.scheduler_patch.start()
+        self.registry = FeedRegistry()
+
+    def tearDown(self):
+        self.scheduler_patch.stop()
+        self.fetcher_patch.stop()
+        self.tmpdir.cleanup()
+        os.environ.pop("WORKING_STORAGE", None)
+
+    def make_feed(self, name, processor_registry=None, **settings):
+        widget = {"name": name, "type": "feed", "feed_url": FEED_URL}
+        widget.update(settings)
+        return Feed(
+            widget,
+            feed_registry=self.registry,
+            processor_registry=processor_registry,
+        )
+
+    def counting_processors(self):
+        # One class per name, as processors are fingerprinted by class name
+        processors = {}
+        registry = MagicMock()
+        registry.get.side_effect = lambda name: processors.setdefault(
+            name, type(name, (CountingProcessor,), {})()
+        )
+        return registry, processors
+
+    def test_same_url_shares_cache_and_single_job(self):
+        owner = self.make_feed("First")
+        view = self.make_feed("Second")
+
+        self.assertIs(owner.source, owner)
+        self.assertIs(view.source, owner)
+        self.assertIs(view.feed_cache, owner.feed_cache)
+        self.scheduler.add_job.assert_called_once()
+        self.assertEqual(len(self.registry), 1)
+        self.assertEqual(owner.views, [owner, view])
+
+    def test_update_from_any_widget_fetches_once_and_updates_all(self):
+        owner = self.make_feed("First")
+        view = self.make_feed("Second", display_limit=1)
+
+        view.update()
+
+        self.assertEqual(len(self.fetcher.calls), 1)
+        self.assertEqual([a.title for a in owner.items], ["Keep me", "Drop me"])
+        self.assertIs(view.items, owner.items)
+        self.assertEqual(len(list(view.display_items)), 1)
+        self.assertIsNotNone(view.last_updated)
+
+    def test_filters_apply_per_widget_without_touching_shared_articles(self):
+        owner = self.make_feed("First")
+        view = self.make_feed(
+            "Second",
+            filters={
+                "remove": [{"title": "drop"}],
+                "strip": [{"summary": " sponsored"}],
+            },
+        )
+
+        owner.update()
+
+        self.assertEqual([a.title for a in owner.items], ["Keep me", "Drop me"])
+        self.assertEqual([a.title for a in view.items], ["Keep me"])
+        self.assertEqual(view.items[0].summary, "Body")
+        self.assertEqual(owner.items[0].summary, "Body sponsored")
+        self.assertFalse(any(a.removed for a in owner.items))
+
+    def test_owner_filters_do_not_hide_articles_from_other_widgets(self):
+        owner = self.make_feed("First", filters={"remove": [{"title": "drop"}]})
+        view = self.make_feed("Second")
+
+        owner.update()
+
+        self.assertEqual([a.title for a in owner.items], ["Keep me"])
+        self.assertEqual([a.title for a in view.items], ["Keep me", "Drop me"])
+
+    def test_views_of_an_unloaded_feed_are_filtered_when_it_loads(self):
+        self.make_feed("Warm").update()
+        self.registry = FeedRegistry()
+
+        owner = self.make_feed("First")
+        view = self.make_feed("Second", filters={"remove": [{"title": "drop"}]})
+
+        self.assertFalse(owner.hydrated)
+        self.assertEqual([a.title for a in view.items], ["Keep me"])
+        self.assertEqual([a.title for a in owner.items], ["Keep me", "Drop me"])
+
+    def test_loading_the_cache_does_not_run_view_processors(self):
+        self.make_feed("Warm").update()
+        self.registry = FeedRegistry()
+        registry, processors = self.counting_processors()
+
+        self.make_feed("First")
+        view = self.make_feed("Second", registry, process=[{"processor": "count"}])
+
+        self.assertEqual(len(view.items), 2)
+        self.assertNotIn("count", processors)
+
+    def test_view_processors_run_once_from_a_job_after_loading_the_cache(self):
+        self.make_feed("Warm").update()
+        self.registry = FeedRegistry()
+        registry, processors = self.counting_processors()
+
+        owner = self.make_feed("First")
+        view = self.make_feed("Second", registry, process=[{"processor": "count"}])
+        owner.hydrate()
+        self.assertNotIn("count", processors)
+
+        jobs = [
+            call
+            for call in self.scheduler.add_job.call_args_list
+            if call.kwargs.get("id") == f"views-{owner.id}"
+        ]
+        self.assertEqual(len(jobs), 1)
+        jobs[0].args[0](*jobs[0].kwargs["args"])
+
+        self.assertEqual(processors["count"].calls, 2)
+        self.assertTrue(all("count:1" in a.processed_by for a in view.items))
+        self.assertFalse(any("count:1" in a.processed_by for a in owner.items))
+
+    def test_view_processors_skip_articles_they_already_processed(self):
+        registry, processors = self.counting_processors()
+        owner = self.make_feed("First")
+        view = self.make_feed("Second", registry, process=[{"processor": "count"}])
+
+        owner.update()
+        self.assertEqual(processors["count"].calls, 2)
+
+        owner.items = list(owner.items)
+        owner.items = list(owner.items)
+
+        self.assertEqual(processors["count"].calls, 2)
+        self.assertTrue(all("count:1" in a.processed_by for a in view.items))
+
+    def test_view_ids_follow_display_settings(self):
+        owner = self.make_feed("First")
+        same = self.make_feed("First")
+        different = self.make_feed("First", display_limit=3)
+
+        self.assertEqual(owner.view_id, owner.id)
+        self.assertEqual(same.view_id, owner.id)
+        self.assertNotEqual(different.view_id, owner.id)
+        self.assertEqual(different.hx_get, f"/feed/{different.view_id}")
+
+    def test_widgets_rendering_differently_get_their_own_view_ids(self):
+        owner = self.make_feed("First")
+        renamed = self.make_feed("Second")
+        headless = self.make_feed("First", display_header=False)
+
+        self.assertEqual(len({owner.view_id, renamed.view_id, headless.view_id}), 3)
+
+    def test_startup_refreshes_are_staggered(self):
+        self.scheduler.add_job.side_effect = lambda *a, **kw: MagicMock()
+        first = Feed(
+            {"name": "A", "feed_url": "http://example.com/a"},
+            feed_registry=self.registry,
+        )
+        second = Feed(
+            {"name": "B", "feed_url": "http://example.com/b"},
+            feed_registry=self.registry,
+        )
+
+        first_run = first.job.modify.call_args.kwargs["next_run_time"]
+        second_run = second.job.modify.call_args.kwargs["next_run_time"]
+        self.assertGreaterEqual(second_run - first_run, self.registry.warmup.spacing)
+
+    def test_refresh_delegates_to_owner_job(self):
+        owner = self.make_feed("First")
+        view = self.make_feed("Second")
+        owner.job.reset_mock()
+
+        view.refresh()
+
+        owner.job.modify.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.models.feed_article import FeedArticle
+from app.models.filter_engine import FilterEngine
+
+
+def article(title="", summary=None):
+    return SimpleNamespace(title=title, summary=summary, removed=False)
+
+
+def rule(type, text, attribute="title"):
+    return {"type": type, "text": text, "attribute": attribute}
+
+
+def test_remove_rules_on_one_attribute_share_a_pattern():
+    engine = FilterEngine(
+        [rule("remove", "#CommissionEarned"), rule("remove", "open thread")]
+    )
+
+    assert len(engine.steps) == 1
+    assert engine.filter(
+        [article("Deal #commissionearned"), article("Open Thread 42"), article("ok")]
+    ) == [article("ok")]
+
+
+def test_remove_sees_value_after_earlier_strip():
+    engine = FilterEngine(
+        [rule("strip", r"^Sponsored:\s*"), rule("remove", r"^Sponsored")]
+    )
+
+    kept = engine.filter([article("Sponsored: real news")])
+
+    assert [a.title for a in kept] == ["real news"]
+
+
+def test_backreference_patterns_are_compiled_separately():
+    engine = FilterEngine([rule("remove", r"(\w+) \1"), rule("remove", "spam")])
+
+    assert len(engine.steps) == 2
+    assert engine.filter([article("again again"), article("spam"), article("x")]) == [
+        article("x")
+    ]
+
+
+def test_filter_returns_copies_and_skips_missing_values():
+    original = article("keep me", summary=None)
+    engine = FilterEngine(
+        [rule("strip", "me"), rule("strip", "anything", attribute="summary")]
+    )
+
+    (view,) = engine.filter([original])
+
+    assert view is not original
+    assert view.title == "keep "
+    assert original.title == "keep me"
+
+
+def test_feed_article_uses_parent_filter_engine():
+    filters = [rule("remove", "bad")]
+    parent = SimpleNamespace(
+        id="feed", filters=filters, filter_engine=FilterEngine(filters)
+    )
+
+    a = FeedArticle(
+        original_title="bad title",
+        title="",
+        link="l",
+        description="",
+        pub_date=datetime.now(),
+        processed="",
+        parent=parent,
+    )
+
+    assert a.removed
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from app.models.history_database import HistoryDatabase
+from app.models.history_store import HistoryStore
+
+
+def article(i: int) -> dict:
+    return {
+        "id": f"a{i}",
+        "link": f"https://example.com/{i}",
+        "title": f"Story {i}",
+        "original_title": f"Story {i}",
+        "description": "",
+        "pub_date": 1_700_000_000 + i,
+    }
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = HistoryDatabase(tmp_path / "history.sqlite3")
+    yield db
+    db.close()
+
+
+def test_pages_newest_first_with_cursor(db):
+    assert db.add("feed", [article(i) for i in range(5)]) == 5
+    assert db.add("feed", [article(4)]) == 0
+
+    first, cursor = db.page("feed", limit=2)
+    second, cursor = db.page("feed", before=cursor, limit=2)
+    third, cursor = db.page("feed", before=cursor, limit=2)
+
+    assert [a["id"] for a in first + second + third] == ["a4", "a3", "a2", "a1", "a0"]
+    assert cursor is None
+    assert db.count("feed") == 5
+    assert db.page("other") == ([], None)
+
+
+def test_compact_folds_spills_and_archives_into_database(db, tmp_path):
+    cache_dir = tmp_path / "cache"
+    history = HistoryStore(cache_dir / "history")
+    history.append("feed", [article(1), article(2)])
+    archive_dir = cache_dir / "archive-2024-01-01"
+    archive_dir.mkdir(parents=True)
+    legacy = {**article(3), "pub_date": "Wed, 01 Jan 2020 00:00:00 GMT"}
+    (archive_dir / "feed.json").write_text(json.dumps({"articles": [legacy]}))
+
+    assert db.compact(cache_dir, history) == 3
+
+    assert not history.path("feed").exists()
+    assert not archive_dir.exists()
+    articles, _ = db.page("feed")
+    assert [a["title"] for a in articles] == ["Story 2", "Story 1", "Story 3"]
+    assert articles[-1]["pub_date"] == 1577836800
+
+
+def test_compact_feed_recovers_interrupted_run(db, tmp_path):
+    history = HistoryStore(tmp_path)
+    history.append("feed", [article(1)])
+    history.path("feed").rename(tmp_path / "feed.compacting")
+    history.append("feed", [article(2)])
+
+    assert db.compact_feed("feed", history) == 2
+    assert list(tmp_path.glob("feed.*")) == []
@@ -0,0 +1,21 @@
+from app.models.history_store import HistoryStore
+
+
+def test_append_and_read_in_spill_order(tmp_path):
+    history = HistoryStore(tmp_path / "history")
+
+    history.append("feed", [{"id": "1"}, {"id": "2"}])
+    history.append("feed", [])
+    history.append("feed", [{"id": "3"}])
+
+    assert [a["id"] for a in history.read("feed")] == ["1", "2", "3"]
+    assert list(history.read("other")) == []
+
+
+def test_torn_line_is_skipped(tmp_path):
+    history = HistoryStore(tmp_path)
+    history.append("feed", [{"id": "1"}])
+    with open(history.path("feed"), "a", encoding="utf-8") as f:
+        f.write('{"id": "2"')
+
+    assert [a["id"] for a in history.read("feed")] == ["1"]
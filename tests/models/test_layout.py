@@ -1,11 +1,12 @@
 import os
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from app.models.layout import Layout
+from app.models.layout import Layout, LayoutSnapshot
 
 
 class TestLayoutBasicMethods(unittest.TestCase):
@@ -86,6 +87,8 @@ class TestLayout(unittest.TestCase):
         self.layout.headers = []
         # Mock bar_manager since reload() needs it
         self.layout.bar_manager = MagicMock()
+        self.layout._reload_lock = threading.Lock()
+        self.layout._reloading = False
         # ensure scheduler methods are patched when reload runs
         self.patcher = patch("app.models.layout.Scheduler.clear_jobs")
         self.mock_clear = self.patcher.start()
@@ -144,6 +147,213 @@ class TestLayout(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_reload_shares_one_feed_per_url_across_tabs(self):
+        yaml = """
+        tabs:
+          - tab: T1
+            columns:
+              - widgets:
+                  - name: News
+                    type: feed
+                    feed_url: http://example.com/rss
+          - tab: T2
+            columns:
+              - widgets:
+                  - name: News (short)
+                    type: feed
+                    feed_url: http://example.com/rss
+                    display_limit: 3
+        """
+        path = self.write_yaml_config(yaml)
+        scheduler = MagicMock()
+        scheduler.running = True
+        with (
+            tempfile.TemporaryDirectory() as storage,
+            patch.dict(
+                os.environ, {"WORKING_STORAGE": storage, "ONBOARD_PREWARM": "false"}
+            ),
+            patch("app.models.widget.Scheduler.getScheduler", return_value=scheduler),
+        ):
+            try:
+                self.layout.config_path = path
+                self.layout.reload()
+            finally:
+                os.unlink(path)
+
+        first = self.layout.tabs[0].rows[0].columns[0].widgets[0]
+        second = self.layout.tabs[1].rows[0].columns[0].widgets[0]
+        self.assertEqual(len(self.layout.feed_registry), 1)
+        self.assertIs(second.source, first)
+        scheduler.add_job.assert_called_once()
+        self.assertIs(self.layout.get_feed(first.id), first)
+        self.assertIs(self.layout.get_feed(second.view_id), second)
+
+    def test_reload_prewarms_only_the_default_tab(self):
+        yaml = """
+        tabs:
+          - tab: T1
+            columns:
+              - widgets:
+                  - name: First
+                    type: feed
+                    feed_url: http://example.com/first
+          - tab: T2
+            columns:
+              - widgets:
+                  - name: Second
+                    type: feed
+                    feed_url: http://example.com/second
+        """
+        path = self.write_yaml_config(yaml)
+        scheduler = MagicMock()
+        scheduler.running = True
+        with (
+            tempfile.TemporaryDirectory() as storage,
+            patch.dict(os.environ, {"WORKING_STORAGE": storage}),
+            patch("app.models.layout.Scheduler.getScheduler", return_value=scheduler),
+        ):
+            try:
+                self.layout.config_path = path
+                self.layout.reload()
+            finally:
+                os.unlink(path)
+
+            args, kwargs = scheduler.add_job.call_args
+            self.assertEqual(kwargs["id"], "layout-prewarm")
+            args[0](*kwargs["args"])
+
+            first = self.layout.tabs[0].rows[0].columns[0].widgets[0]
+            second = self.layout.tabs[1].rows[0].columns[0].widgets[0]
+            self.assertTrue(first.hydrated)
+            self.assertFalse(second.hydrated)
+
+    def test_eager_reload_loads_every_feed(self):
+        yaml = """
+        tabs:
+          - tab: T1
+            columns:
+              - widgets:
+                  - name: First
+                    type: feed
+                    feed_url: http://example.com/first
+          - tab: T2
+            columns:
+              - widgets:
+                  - name: Second
+                    type: feed
+                    feed_url: http://example.com/second
+        """
+        path = self.write_yaml_config(yaml)
+        with (
+            tempfile.TemporaryDirectory() as storage,
+            patch.dict(
+                os.environ,
+                {"WORKING_STORAGE": storage, "ONBOARD_LAYOUT_LOAD": "eager"},
+            ),
+        ):
+            try:
+                self.layout.config_path = path
+                self.layout.reload()
+            finally:
+                os.unlink(path)
+
+        feeds = self.layout.feed_registry.owners
+        self.assertEqual(len(feeds), 2)
+        self.assertTrue(all(feed.hydrated for feed in feeds))
+
+    def test_background_reload_serves_previous_snapshot_until_swap(self):
+        old_tabs = [SimpleNamespace(name="Old")]
+        self.layout.tabs = old_tabs
+        building, release = threading.Event(), threading.Event()
+        new = LayoutSnapshot(tabs=[SimpleNamespace(name="New")], version=2)
+
+        def build_snapshot():
+            building.set()
+            release.wait(5)
+            return new
+
+        with (
+            patch.object(self.layout, "build_snapshot", side_effect=build_snapshot),
+            patch.dict(os.environ, {"ONBOARD_PREWARM": "false"}),
+        ):
+            thread = self.layout.reload_async()
+            building.wait(5)
+            self.assertIs(self.layout.tabs, old_tabs)
+            self.assertIsNone(self.layout.reload_async())
+
+            release.set()
+            thread.join(5)
+
+        self.assertIs(self.layout.snapshot, new)
+        self.assertEqual(self.layout.version, 2)
+        self.assertFalse(self.layout._reloading)
+
+    def test_reload_guard_is_per_layout(self):
+        with (
+            tempfile.TemporaryDirectory() as storage,
+            patch("app.models.layout.pwd", Path(storage)),
+        ):
+            first = Layout(bar_manager=MagicMock(), skip_file_init=True)
+            second = Layout(bar_manager=MagicMock(), skip_file_init=True)
+
+        first._reloading = True
+        self.assertIsNot(first._reload_lock, second._reload_lock)
+        self.assertFalse(second._reloading)
+
+    def test_swap_replaces_feed_jobs_and_drops_removed_feeds(self):
+        feed = MagicMock(job_id="feed-kept")
+        registry = MagicMock(owners=[feed])
+        scheduler = MagicMock(running=True)
+        scheduler.get_jobs.return_value = [
+            SimpleNamespace(id="feed-kept"),
+            SimpleNamespace(id="feed-removed"),
+            SimpleNamespace(id="layout-prewarm"),
+        ]
+
+        with (
+            patch("app.models.layout.Scheduler.getScheduler", return_value=scheduler),
+            patch.dict(os.environ, {"ONBOARD_PREWARM": "false"}),
+        ):
+            self.layout.swap(LayoutSnapshot(feed_registry=registry))
+
+        feed.schedule.assert_called_once_with(registry.warmup)
+        scheduler.remove_job.assert_called_once_with("feed-removed")
+        self.mock_clear.assert_not_called()
+
+    def test_swap_schedules_cache_maintenance_once(self):
+        feed = MagicMock(job_id="feed-kept")
+        registry = MagicMock(owners=[feed])
+        scheduler = MagicMock(running=True)
+        scheduler.get_jobs.return_value = []
+        scheduler.get_job.return_value = None
+
+        with (
+            patch("app.models.layout.Scheduler.getScheduler", return_value=scheduler),
+            patch.dict(os.environ, {"ONBOARD_PREWARM": "false"}),
+        ):
+            self.layout.swap(LayoutSnapshot(feed_registry=registry))
+            args, kwargs = scheduler.add_job.call_args
+            self.assertEqual(kwargs["id"], Layout.MAINTENANCE_JOB_ID)
+            self.assertIs(args[0], feed.feed_cache.run_maintenance)
+
+            scheduler.get_job.return_value = SimpleNamespace(id="cache-maintenance")
+            self.layout.swap(LayoutSnapshot(feed_registry=registry))
+
+        scheduler.add_job.assert_called_once()
+        feed.feed_cache.run_maintenance.assert_not_called()
+
+    def test_prewarm_can_be_disabled(self):
+        scheduler = MagicMock()
+        scheduler.running = True
+        self.layout.tabs = [MagicMock()]
+        with (
+            patch.dict(os.environ, {"ONBOARD_PREWARM": "false"}),
+            patch("app.models.layout.Scheduler.getScheduler", return_value=scheduler),
+        ):
+            self.layout.prewarm()
+
+        scheduler.add_job.assert_not_called()
+
     def test_get_feeds_widgets_feed_type(self):
         feed_widget = MagicMock()
         feed_widget.type = "feed"
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.poll_schedule import PHASE_EPOCH, PollSchedule, WarmupThrottle
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def every(gap: timedelta, count: int = 10) -> list[datetime]:
+    return [NOW - gap * i for i in range(count)]
+
+
+@pytest.fixture
+def schedule():
+    return PollSchedule(min_interval=15, max_interval=720)
+
+
+def test_fast_feed_polls_at_half_its_cadence(schedule):
+    assert schedule.next_interval(every(timedelta(hours=1))) == timedelta(minutes=30)
+
+
+def test_interval_is_clamped_to_bounds(schedule):
+    assert schedule.next_interval(every(timedelta(minutes=5))) == timedelta(minutes=15)
+    assert schedule.next_interval(every(timedelta(days=30))) == timedelta(hours=12)
+
+
+def test_default_interval_without_history(schedule):
+    assert schedule.next_interval([NOW]) == PollSchedule.DEFAULT_INTERVAL
+
+
+def test_unchanged_fetches_back_off_and_reset(schedule):
+    dates = every(timedelta(hours=1))
+
+    schedule.record_fetch(changed=False)
+    schedule.record_fetch(changed=False)
+    assert schedule.next_interval(dates) == timedelta(hours=2)
+
+    schedule.record_fetch(changed=True)
+    assert schedule.next_interval(dates) == timedelta(minutes=30)
+
+
+def test_backoff_is_capped(schedule):
+    for _ in range(10):
+        schedule.record_fetch(changed=False)
+
+    assert schedule.next_interval(every(timedelta(minutes=40))) == timedelta(
+        minutes=20 * 2**PollSchedule.MAX_BACKOFF_STEPS
+    )
+
+
+def test_update_interval_overrides_learned_cadence():
+    schedule = PollSchedule(update_interval=5, min_interval=15)
+    schedule.record_fetch(changed=False)
+
+    assert schedule.next_interval(every(timedelta(hours=6))) == timedelta(minutes=5)
+
+
+def test_request_interval_keeps_the_shortest_override():
+    schedule = PollSchedule(update_interval=60)
+
+    assert not schedule.request_interval(None)
+    assert not schedule.request_interval(90)
+    assert schedule.request_interval(30)
+    assert schedule.override == timedelta(minutes=30)
+
+
+def test_bounds_read_from_environment(monkeypatch):
+    monkeypatch.setenv("ONBOARD_FEED_MIN_INTERVAL", "60")
+    monkeypatch.setenv("ONBOARD_FEED_MAX_INTERVAL", "120")
+    schedule = PollSchedule()
+
+    assert schedule.next_interval(every(timedelta(minutes=10))) == timedelta(hours=1)
+    assert schedule.next_interval(every(timedelta(days=1))) == timedelta(hours=2)
+
+
+def test_phase_is_stable_per_key_and_spread_across_interval():
+    phases = [PollSchedule(key=f"feed-{i}").phase for i in range(200)]
+
+    assert PollSchedule(key="feed-0").phase == phases[0]
+    assert all(0 <= p < 1 for p in phases)
+    # Every quarter of the interval gets a share of the feeds
+    assert {int(p * 4) for p in phases} == {0, 1, 2, 3}
+
+
+def test_start_date_offsets_by_phase(monkeypatch):
+    schedule = PollSchedule(key="feed")
+    interval = timedelta(hours=1)
+
+    assert schedule.start_date(interval) == PHASE_EPOCH + interval * schedule.phase
+
+    monkeypatch.setenv("ONBOARD_FEED_SPREAD", "false")
+    assert schedule.start_date(interval) is None
+
+
+def test_warmup_throttle_staggers_run_times():
+    throttle = WarmupThrottle(spacing=5)
+
+    first, second, third = (throttle.next_run_time() for _ in range(3))
+
+    assert second - first >= timedelta(seconds=5)
+    assert third - second >= timedelta(seconds=5)
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.models.retention import RetentionPolicy
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def articles(count: int, gap: timedelta = timedelta(days=1)) -> list:
+    return [SimpleNamespace(id=str(i), pub_date=NOW - gap * i) for i in range(count)]
+
+
+def ids(items) -> list[str]:
+    return [item.id for item in items]
+
+
+def test_max_count_spills_oldest():
+    kept, spilled = RetentionPolicy(max_count=3, max_age_days=0).split(articles(5))
+
+    assert ids(kept) == ["0", "1", "2"]
+    assert ids(spilled) == ["3", "4"]
+
+
+def test_max_age_spills_old_articles_but_keeps_min_count():
+    policy = RetentionPolicy(max_count=0, max_age_days=2.5)
+
+    kept, spilled = policy.split(articles(5), now=NOW)
+    assert ids(kept) == ["0", "1", "2"]
+    assert ids(spilled) == ["3", "4"]
+
+    kept, _ = policy.split(articles(5), min_count=4, now=NOW)
+    assert ids(kept) == ["0", "1", "2", "3"]
+
+
+def test_articles_still_listed_by_the_feed_are_kept():
+    kept, spilled = RetentionPolicy(max_count=2, max_age_days=0).split(
+        articles(4), keep_ids={"3"}
+    )
+
+    assert ids(kept) == ["0", "1", "3"]
+    assert ids(spilled) == ["2"]
+
+
+def test_defaults_from_environment(monkeypatch):
+    monkeypatch.setenv("ONBOARD_FEED_MAX_ARTICLES", "0")
+    monkeypatch.setenv("ONBOARD_FEED_MAX_AGE_DAYS", "0")
+    policy = RetentionPolicy.from_widget({})
+
+    assert policy.split(articles(500)) == (articles(500), [])
+    assert RetentionPolicy.from_widget({"max_articles": 7}).max_count == 7
@@ -23,13 +23,17 @@ def test_from_dict_with_columns(row_dict_with_columns):
         row = Row.from_dict(row_dict_with_columns)
         assert isinstance(row, Row)
         assert row.columns == [mock_column, mock_column]
-        # Verify from_dict was called for each column with bookmark_manager=None
+        # Verify from_dict was called for each column with no injected dependencies
         assert mock_column_from_dict.call_count == 2
         mock_column_from_dict.assert_any_call(
-            row_dict_with_columns["columns"][0], bookmark_manager=None
+            row_dict_with_columns["columns"][0],
+            bookmark_manager=None,
+            feed_registry=None,
         )
         mock_column_from_dict.assert_any_call(
-            row_dict_with_columns["columns"][1], bookmark_manager=None
+            row_dict_with_columns["columns"][1],
+            bookmark_manager=None,
+            feed_registry=None,
         )
 
 
@@ -48,8 +52,10 @@ def test_from_dict_with_widgets(row_dict_with_widgets):
         assert isinstance(row, Row)
         assert row.columns == [mock_column]
         mock_column.widgets = [mock_widget, mock_widget, mock_widget]
-        # Verify from_dict was called for each widget with bookmark_manager=None
+        # Verify from_dict was called for each widget with no injected dependencies
         assert mock_widget_from_dict.call_count == 3
         for widget_data in row_dict_with_widgets["widgets"]:
-            mock_widget_from_dict.assert_any_call(widget_data, bookmark_manager=None)
+            mock_widget_from_dict.assert_any_call(
+                widget_data, bookmark_manager=None, feed_registry=None
+            )
         mock_column_class.assert_called_once()
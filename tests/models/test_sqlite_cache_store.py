@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from app.models.feed_cache import FeedCache, default_cache_store
+from app.models.local_file_store import LocalFileStore
+from app.models.sqlite_cache_store import SqliteCacheStore
+
+
+def article(id, pub_date, title="t"):
+    return {"id": id, "pub_date": pub_date, "title": title}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SqliteCacheStore(tmp_path / "feeds.sqlite3")
+    yield store
+    store.close()
+
+
+def test_write_and_read_roundtrip_newest_first(store, tmp_path):
+    path = tmp_path / "cache" / "feed1.json"
+    data = {"version": 2, "etag": '"x"', "articles": [article("a", 1), article("b", 2)]}
+
+    store.write_json_atomic(path, data)
+
+    assert store.exists(path)
+    assert store.read_json(path) == {
+        "version": 2,
+        "etag": '"x"',
+        "articles": [article("b", 2), article("a", 1)],
+    }
+    assert not store.exists(tmp_path / "cache" / "other.json")
+
+
+def test_write_upserts_changes_and_drops_missing_articles(store, tmp_path):
+    path = tmp_path / "feed1.json"
+    store.write_json_atomic(path, {"articles": [article("a", 1), article("b", 2)]})
+
+    store.write_json_atomic(
+        path, {"articles": [article("b", 2, title="edited"), article("c", 3)]}
+    )
+
+    assert store.read_json(path)["articles"] == [
+        article("c", 3),
+        article("b", 2, title="edited"),
+    ]
+
+
+def test_existing_json_file_is_imported_on_first_read(store, tmp_path):
+    path = tmp_path / "legacy.json"
+    LocalFileStore().write_json_atomic(path, {"articles": [article("a", 1)]})
+
+    assert store.exists(path)
+    assert store.read_json(path)["articles"] == [article("a", 1)]
+
+    path.unlink()
+    assert store.read_json(path)["articles"] == [article("a", 1)]
+
+
+def test_feed_cache_selects_sqlite_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("ONBOARD_CACHE_STORE", "sqlite")
+    monkeypatch.setenv("ONBOARD_CACHE_DB", str(tmp_path / "shared.sqlite3"))
+
+    fc = FeedCache("feed", working_dir=tmp_path)
+    fc.etag = '"v1"'
+    fc.save_articles([article("a", 1), article("b", 2)])
+
+    assert isinstance(fc.file_store, SqliteCacheStore)
+    assert fc.file_store is default_cache_store(tmp_path)
+    assert not fc.cache_path.exists()
+
+    reloaded = FeedCache("feed", working_dir=tmp_path)
+    assert reloaded.load_cache(archive_on_load=False) == [
+        article("b", 2),
+        article("a", 1),
+    ]
+    assert reloaded.etag == '"v1"'
+    assert reloaded.last_modified() is not None
+
+
+def test_default_store_is_json_files(tmp_path, monkeypatch):
+    monkeypatch.delenv("ONBOARD_CACHE_STORE", raising=False)
+
+    assert isinstance(default_cache_store(Path(tmp_path)), LocalFileStore)
+    assert not isinstance(default_cache_store(Path(tmp_path)), SqliteCacheStore)
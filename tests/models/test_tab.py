@@ -31,13 +31,13 @@ class TestTab(unittest.TestCase):
         self.assertEqual(tab.name, "TestTab")
         self.assertEqual(len(tab.rows), 2)
         self.assertEqual(tab.rows, [mock_row_instance, mock_row_instance])
-        # Verify from_dict was called for each row with bookmark_manager=None
+        # Verify from_dict was called for each row with no injected dependencies
         assert mock_row_class.from_dict.call_count == 2
         mock_row_class.from_dict.assert_any_call(
-            dictionary["rows"][0], bookmark_manager=None
+            dictionary["rows"][0], bookmark_manager=None, feed_registry=None
         )
         mock_row_class.from_dict.assert_any_call(
-            dictionary["rows"][1], bookmark_manager=None
+            dictionary["rows"][1], bookmark_manager=None, feed_registry=None
         )
 
     @patch("app.models.row.Row")
@@ -64,13 +64,13 @@ class TestTab(unittest.TestCase):
         self.assertEqual(
             mock_row_instance.columns, [mock_column_instance, mock_column_instance]
         )
-        # Verify from_dict was called for each column with bookmark_manager=None
+        # Verify from_dict was called for each column with no injected dependencies
         assert mock_column_class.from_dict.call_count == 2
         mock_column_class.from_dict.assert_any_call(
-            dictionary["columns"][0], bookmark_manager=None
+            dictionary["columns"][0], bookmark_manager=None, feed_registry=None
         )
         mock_column_class.from_dict.assert_any_call(
-            dictionary["columns"][1], bookmark_manager=None
+            dictionary["columns"][1], bookmark_manager=None, feed_registry=None
         )
 
     def test_from_dict_missing_tab_key(self):
@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 from flask import Flask, render_template_string
 
 from app.models.feed import Feed
+from tests.mocks.mock_feed_fetcher import MockFeedFetcher
 
 
 class TestWidgetTemplateRegression(unittest.TestCase):
@@ -21,6 +22,10 @@ class TestWidgetTemplateRegression(unittest.TestCase):
         """Set up test fixtures."""
         self.tmpdir = tempfile.TemporaryDirectory()
         os.environ["WORKING_STORAGE"] = self.tmpdir.name
+        self.fetcher_patch = patch(
+            "app.models.feed.get_feed_fetcher", return_value=MockFeedFetcher()
+        )
+        self.fetcher_patch.start()
 
         # Create a minimal Flask app for template testing
         self.app = Flask(__name__)
@@ -34,6 +39,7 @@ class TestWidgetTemplateRegression(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
+        self.fetcher_patch.stop()
         self.tmpdir.cleanup()
         os.environ.pop("WORKING_STORAGE", None)
 
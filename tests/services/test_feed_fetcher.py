@@ -0,0 +1,195 @@
+import threading
+import time
+from concurrent.futures import wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.feed_fetcher import FeedFetcher
+
+FEED_BYTES = b"<rss><channel><title>t</title></channel></rss>"
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Serves FEED_BYTES with an ETag, tracking concurrent requests."""
+
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    served = 0
+    delay = 0.0
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.served += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            time.sleep(cls.delay)
+            if self.path == "/slow":
+                time.sleep(2)
+            if self.path == "/big":
+                self.send_response(200)
+                self.send_header("Content-Length", str(10 * 1024 * 1024))
+                self.end_headers()
+                return
+            if self.path == "/stream":
+                # No Content-Length: the cap has to be enforced while streaming
+                self.send_response(200)
+                self.end_headers()
+                for _ in range(64):
+                    self.wfile.write(b"x" * 1024)
+                return
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Last-Modified", "Wed, 01 Jan 2020 00:00:00 GMT")
+            self.send_header("Content-Length", str(len(FEED_BYTES)))
+            self.end_headers()
+            self.wfile.write(FEED_BYTES)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    FeedHandler.active = FeedHandler.peak = FeedHandler.served = 0
+    FeedHandler.delay = 0.0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def fetcher():
+    f = FeedFetcher(
+        max_connections=8,
+        max_per_host=2,
+        read_timeout=0.5,
+        total_timeout=5,
+        max_bytes=16 * 1024,
+    )
+    yield f
+    f.shutdown()
+
+
+def test_fetch_returns_bytes_validators_and_timing(server, fetcher):
+    result = fetcher.fetch(f"{server}/feed")
+
+    assert result.ok
+    assert result.status == 200
+    assert result.content == FEED_BYTES
+    assert result.content_type == "application/rss+xml"
+    assert result.etag == '"v1"'
+    assert result.modified == "Wed, 01 Jan 2020 00:00:00 GMT"
+    assert result.elapsed > 0
+
+
+def test_fetch_sends_conditional_headers(server, fetcher):
+    result = fetcher.fetch(f"{server}/feed", etag='"v1"')
+
+    assert result.not_modified
+    assert result.content == b""
+
+
+def test_fetch_reports_connection_errors(fetcher):
+    result = fetcher.fetch("http://127.0.0.1:9/unreachable")
+
+    assert not result.ok
+    assert result.error
+
+
+def test_submit_runs_callback_and_respects_per_host_cap(server, fetcher):
+    FeedHandler.delay = 0.1
+    seen = []
+
+    futures = [
+        fetcher.submit(f"{server}/feed/{i}", callback=seen.append) for i in range(6)
+    ]
+    wait(futures, timeout=10)
+
+    assert sorted(r.url for r in seen) == sorted(f"{server}/feed/{i}" for i in range(6))
+    assert all(f.result().ok for f in futures)
+    assert FeedHandler.peak <= 2
+
+
+def test_submit_reuses_inflight_fetch_for_same_url(server, fetcher):
+    FeedHandler.delay = 0.2
+
+    first = fetcher.submit(f"{server}/feed")
+    second = fetcher.submit(f"{server}/feed")
+
+    assert first is second
+    assert first.result(timeout=10).ok
+
+
+def test_fetch_times_out_hung_upstream(server, fetcher):
+    started = time.perf_counter()
+    result = fetcher.fetch(f"{server}/slow")
+
+    assert not result.ok
+    assert result.error.startswith("TimeoutError")
+    assert time.perf_counter() - started < 2
+
+
+def test_fetch_rejects_oversized_content_length(server, fetcher):
+    result = fetcher.fetch(f"{server}/big")
+
+    assert not result.ok
+    assert "ResponseTooLargeError" in result.error
+    assert result.content == b""
+
+
+def test_fetch_aborts_stream_past_byte_limit(server, fetcher):
+    result = fetcher.fetch(f"{server}/stream")
+
+    assert not result.ok
+    assert "exceeded 16384 bytes" in result.error
+
+
+def test_joining_an_inflight_fetch_runs_each_consumer_once(server, fetcher):
+    FeedHandler.delay = 0.2
+    first, second = [], []
+
+    futures = [
+        fetcher.submit(f"{server}/feed", callback=first.append),
+        fetcher.submit(f"{server}/feed", callback=second.append),
+    ]
+    result = fetcher.fetch(f"{server}/feed", callback=first.append)
+    wait(futures, timeout=10)
+
+    assert result.ok
+    assert len(first) == 1
+    assert len(second) == 1
+    assert FeedHandler.served == 1
+
+
+def test_fetch_timeout_leaves_the_shared_download_running(server):
+    FeedHandler.delay = 0.3
+    fetcher = FeedFetcher(max_per_host=1, connect_timeout=0.1, total_timeout=1)
+    joined, mine = [], []
+    try:
+        # Holds the only host slot until its total timeout, so the wait for
+        # /feed runs out while the download is still queued
+        fetcher.submit(f"{server}/slow")
+        shared = fetcher.submit(f"{server}/feed", callback=joined.append)
+        result = fetcher.fetch(f"{server}/feed", callback=mine.append)
+
+        assert result.error == "TimeoutError: no result within 1.1s"
+        assert shared.result(timeout=10).ok
+        assert len(joined) == 1
+        assert len(mine) == 1
+    finally:
+        fetcher.shutdown()
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from app.models.article_snapshot import ArticleSnapshot
+from app.services.feed_fragments import FeedFragmentCache, oob_fragment
+
+
+def make_widget(view_id="view1"):
+    return SimpleNamespace(view_id=view_id, snapshot=ArticleSnapshot())
+
+
+def test_fragment_is_rendered_once_per_snapshot():
+    cache = FeedFragmentCache()
+    widget = make_widget()
+    renders = []
+
+    def render():
+        renders.append(widget.snapshot.version)
+        return f"<div>{widget.snapshot.version}</div>"
+
+    first = cache.get(widget, render)
+    assert cache.get(widget, render) == first
+    assert renders == [0]
+
+    widget.snapshot = widget.snapshot.next([])
+    second = cache.get(widget, render)
+
+    assert second.html == "<div>1</div>"
+    assert second.etag != first.etag
+    assert renders == [0, 1]
+
+
+def test_widgets_without_snapshots_are_not_cached():
+    cache = FeedFragmentCache()
+
+    fragment = cache.get(SimpleNamespace(view_id="x"), lambda: "<div/>")
+
+    assert fragment.etag is None
+    assert len(cache) == 0
+
+
+def test_least_recently_served_widgets_are_dropped():
+    cache = FeedFragmentCache(max_entries=2)
+    first, second, third = make_widget("a"), make_widget("b"), make_widget("c")
+
+    for widget in (first, second, first, third):
+        cache.get(widget, lambda: "<div/>")
+
+    assert list(cache._fragments) == ["a", "c"]
+
+
+def test_oob_fragment_marks_the_first_element():
+    html = '\n  <div class="box" id="feed-a"><p>x</p></div>'
+
+    assert oob_fragment(html) == (
+        '\n  <div hx-swap-oob="true" class="box" id="feed-a"><p>x</p></div>'
+    )
@@ -0,0 +1,27 @@
+import logging
+
+from app.services.fragment_validator import validate_fragment, validation_enabled
+
+
+def test_load_triggers_are_stripped_and_logged(caplog):
+    html = '<div hx-get="/feed/1" hx-trigger="load once"><p>x</p></div>'
+
+    with caplog.at_level(logging.WARNING):
+        result = validate_fragment(html, "widget.html")
+
+    assert result == '<div hx-get="/feed/1"><p>x</p></div>'
+    assert "widget.html" in caplog.text
+
+
+def test_fragments_without_load_triggers_are_returned_unchanged():
+    html = '<div hx-trigger="click">a &amp; b</div>'
+
+    assert validate_fragment(html) is html
+
+
+def test_validation_is_opt_in(monkeypatch):
+    monkeypatch.delenv("ONBOARD_VALIDATE_FRAGMENTS", raising=False)
+    assert not validation_enabled()
+
+    monkeypatch.setenv("ONBOARD_VALIDATE_FRAGMENTS", "true")
+    assert validation_enabled()
@@ -0,0 +1,45 @@
+from flask import Flask
+from flask_caching import Cache
+from jinja2 import DictLoader
+
+from app.services.page_stream import not_streamed, stream_page
+
+
+def make_app():
+    app = Flask(__name__)
+    app.jinja_loader = DictLoader(
+        {
+            "page.html": "<head>{{ title }}</head>{% for row in rows %}<p>{{ row }}</p>{% endfor %}"
+        }
+    )
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    return app, cache
+
+
+def test_streamed_page_is_cached_once_complete():
+    app, cache = make_app()
+    with app.test_request_context("/"):
+        response = stream_page(
+            "page.html", cache=cache, cache_key="view//", title="T", rows=[1, 2]
+        )
+        assert response.is_streamed
+        assert not not_streamed(response)
+        assert cache.get("view//") is None
+
+        body = response.get_data()
+
+        assert body == b"<head>T</head><p>1</p><p>2</p>"
+        assert cache.get("view//") == body.decode()
+
+
+def test_unfinished_streams_are_not_cached():
+    app, cache = make_app()
+    with app.test_request_context("/"):
+        response = stream_page(
+            "page.html", cache=cache, cache_key="view//", title="T", rows=[1, 2]
+        )
+        chunks = iter(response.response)
+        next(chunks)
+        chunks.close()
+
+        assert cache.get("view//") is None
@@ -0,0 +1,100 @@
+import os
+import sys
+import uuid
+
+import pytest
+
+from app.models.noop_feed_processor import NoOpFeedProcessor
+from app.services.processor_registry import ProcessorRegistry
+
+PROCESSOR_SOURCE = """
+class UpperCase:
+    version = "{version}"
+    instances = 0
+
+    def __init__(self):
+        type(self).instances += 1
+
+    def process(self, articles):
+        return articles
+"""
+
+
+@pytest.fixture
+def processors_dir(tmp_path):
+    package = f"procs_{uuid.uuid4().hex}"
+    directory = tmp_path / package
+    directory.mkdir()
+    (directory / "__init__.py").write_text("")
+    sys.path.insert(0, str(tmp_path))
+    yield directory, package
+    sys.path.remove(str(tmp_path))
+    for name in [m for m in sys.modules if m.startswith(package)]:
+        del sys.modules[name]
+
+
+def write_processor(directory, version, mtime=None):
+    path = directory / "upper_case.py"
+    path.write_text(PROCESSOR_SOURCE.format(version=version))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_instances_are_created_once_and_reused(processors_dir):
+    directory, package = processors_dir
+    write_processor(directory, "1")
+    registry = ProcessorRegistry(search_paths=[(directory, package)])
+
+    first = registry.get("upper_case")
+    second = registry.get("upper_case")
+
+    assert registry.names == ["upper_case"]
+    assert first is second
+    assert type(first).instances == 1
+
+
+def test_changed_file_is_reloaded(processors_dir):
+    directory, package = processors_dir
+    write_processor(directory, "1", mtime=1_000_000)
+    registry = ProcessorRegistry(search_paths=[(directory, package)])
+    assert registry.get("upper_case").version == "1"
+
+    write_processor(directory, "2", mtime=2_000_000)
+
+    assert registry.get("upper_case").version == "2"
+
+
+def test_hot_reload_disabled_keeps_first_instance(processors_dir):
+    directory, package = processors_dir
+    write_processor(directory, "1", mtime=1_000_000)
+    registry = ProcessorRegistry(search_paths=[(directory, package)], hot_reload=False)
+    registry.get("upper_case")
+
+    write_processor(directory, "2", mtime=2_000_000)
+
+    assert registry.get("upper_case").version == "1"
+
+
+def test_processor_added_after_discovery_is_found(processors_dir):
+    directory, package = processors_dir
+    registry = ProcessorRegistry(search_paths=[(directory, package)])
+    assert isinstance(registry.get("upper_case"), NoOpFeedProcessor)
+
+    write_processor(directory, "1")
+
+    assert registry.get("upper_case").version == "1"
+
+
+def test_broken_processor_falls_back_to_noop(processors_dir):
+    directory, package = processors_dir
+    (directory / "upper_case.py").write_text("class Misnamed:\n    pass\n")
+    registry = ProcessorRegistry(search_paths=[(directory, package)])
+
+    assert isinstance(registry.get("upper_case"), NoOpFeedProcessor)
+
+
+def test_default_search_path_finds_app_processors():
+    registry = ProcessorRegistry()
+
+    assert {"strip_long_urls", "title_editor"} <= set(registry.names)
+    assert type(registry.get("strip_long_urls")).__name__ == "StripLongUrls"
@@ -1,6 +1,7 @@
 """Tests for Flask application factory and routes."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 import pandas as pd
 
@@ -232,6 +233,96 @@ class TestRoutes:
         assert response.status_code == 302
         mock_layout.refresh_feeds.assert_called_with("test_feed")
 
+    def test_index_is_streamed_when_enabled(
+        self, route_client, mock_layout, monkeypatch
+    ):
+        """Test ONBOARD_STREAM_PAGES=true sends the index page as it renders."""
+        monkeypatch.setenv("ONBOARD_STREAM_PAGES", "true")
+        mock_layout.tab.return_value = SimpleNamespace(name="Home", rows=[])
+
+        response = route_client.get("/")
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert "</html>" in response.get_data(as_text=True)
+
+    def test_batch_mode_loads_tab_feeds_in_one_request(
+        self, route_client, mock_layout, monkeypatch
+    ):
+        """Test ONBOARD_FEED_LOADING=batch makes the tab request /feeds once."""
+        monkeypatch.setenv("ONBOARD_FEED_LOADING", "batch")
+        mock_layout.tab.return_value = SimpleNamespace(name="My Tab", rows=[])
+
+        response = route_client.get("/tab/my-tab", headers={"HX-Request": "true"})
+
+        assert 'hx-get="/feeds?tab=My%20Tab"' in response.get_data(as_text=True)
+
+    def test_feeds_route_returns_oob_fragments(self, route_client, mock_layout):
+        """Test /feeds renders the requested feeds as out-of-band swaps."""
+        from app.models.article_snapshot import ArticleSnapshot
+
+        feeds = {
+            view_id: SimpleNamespace(
+                template="widget.html",
+                type="feed",
+                name=view_id,
+                link="",
+                display_header=True,
+                display_items=[],
+                view_id=view_id,
+                snapshot=ArticleSnapshot(),
+            )
+            for view_id in ("a", "b")
+        }
+        mock_layout.get_feed.side_effect = feeds.__getitem__
+        mock_layout.tab_feeds.return_value = [feeds["a"], feeds["b"], feeds["a"]]
+
+        by_id = route_client.get("/feeds?ids=b,missing&ids=a")
+        html = by_id.get_data(as_text=True)
+        assert by_id.status_code == 200
+        assert html.index('id="feed-b"') < html.index('id="feed-a"')
+        assert html.count('hx-swap-oob="true"') == 2
+
+        by_tab = route_client.get("/feeds?tab=Home")
+        mock_layout.tab.assert_called_with("Home")
+        assert by_tab.get_data(as_text=True).count('hx-swap-oob="true"') == 2
+
+        unchanged = route_client.get(
+            "/feeds?tab=Home", headers={"If-None-Match": by_tab.headers["ETag"]}
+        )
+        assert unchanged.status_code == 304
+
+    def test_feed_fragment_is_revalidated_with_etag(self, route_client, mock_layout):
+        """Test /feed/<feed_id> answers 304 until the feed publishes new articles."""
+        from app.models.article_snapshot import ArticleSnapshot
+
+        feed = SimpleNamespace(
+            template="widget.html",
+            type="feed",
+            name="News",
+            link="",
+            display_header=True,
+            display_items=[],
+            view_id="view1",
+            hx_get="/feed/view1",
+            snapshot=ArticleSnapshot(),
+        )
+        mock_layout.get_feed.return_value = feed
+
+        first = route_client.get("/feed/view1")
+        etag = first.headers["ETag"]
+        assert first.status_code == 200
+        assert b"hx-trigger" not in first.data
+        assert "no-cache" in first.headers["Cache-Control"]
+
+        unchanged = route_client.get("/feed/view1", headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+
+        feed.snapshot = feed.snapshot.next([])
+        changed = route_client.get("/feed/view1", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
     def test_bookmarks_manage_route(self, route_client):
         """Test /bookmarks/manage route loads."""
         response = route_client.get("/bookmarks/manage")